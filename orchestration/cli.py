@@ -27,6 +27,7 @@ When invoked as ``eco``, economy mode is enabled automatically.
 """
 
 import argparse
+import contextlib
 import json
 import os
 import subprocess
@@ -353,7 +354,7 @@ def _build_rubrics() -> dict[str, dict]:
     """Build the RUBRICS dict from real rubric definitions in orchestration.rubrics."""
     from orchestration.rubrics import CODE_REVIEW_RUBRIC, TEST_QUALITY_RUBRIC, VISUAL_FIDELITY_RUBRIC
 
-    def _rubric_to_dict(name: str, description: str, criteria: list) -> dict:
+    def _rubric_to_dict(name: str, description: str, criteria: tuple) -> dict:
         return {
             "name": name,
             "description": description,
@@ -589,7 +590,6 @@ def cmd_sync_comments(args: argparse.Namespace) -> int:
     fetcher = CommentFetcher()
     classifier = IntentClassifier()
     executor = ActionExecutor(engine=engine)
-    history = SyncHistory()
 
     # Fetch comments
     if pr_num:
@@ -604,31 +604,32 @@ def cmd_sync_comments(args: argparse.Namespace) -> int:
         print("No unresolved comments found.")
         return 0
 
-    # Filter already-processed comments and bot-generated results
-    new_comments = [
-        c for c in comments
-        if not history.is_processed(c.id)
-        and not c.body.strip().startswith(_AGENT_RESULT_MARKER)
-    ]
-    if not new_comments:
-        print("All comments already processed.")
-        return 0
+    with contextlib.closing(SyncHistory()) as history:
+        # Filter already-processed comments and bot-generated results
+        new_comments = [
+            c for c in comments
+            if not history.is_processed(c.id)
+            and not c.body.strip().startswith(_AGENT_RESULT_MARKER)
+        ]
+        if not new_comments:
+            print("All comments already processed.")
+            return 0
 
-    print(f"Found {len(new_comments)} unprocessed comment(s)")
+        print(f"Found {len(new_comments)} unprocessed comment(s)")
 
-    # Classify and execute
-    results = []
-    for comment in new_comments:
-        classified = classifier.classify(comment)
-        result = executor.execute(classified, dry_run=dry_run)
-        results.append(result)
+        # Classify and execute
+        results = []
+        with history.open_batch():
+            for classified in classifier.classify_many(new_comments):
+                result = executor.execute(classified, dry_run=dry_run)
+                results.append(result)
 
-        status = "OK" if result.success else "FAIL"
-        error_msg = f" - {result.error}" if result.error else ""
-        print(f"  [{status}] {result.intent}: {result.summary}{error_msg}")
+                status = "OK" if result.success else "FAIL"
+                error_msg = f" - {result.error}" if result.error else ""
+                print(f"  [{status}] {result.intent}: {result.summary}{error_msg}")
 
-        if not dry_run:
-            history.record(result)
+                if not dry_run:
+                    history.record(result)
 
     # Summary
     success_count = sum(1 for r in results if r.success)
@@ -1537,10 +1538,14 @@ def cmd_remote_run(args: argparse.Namespace) -> int:
 
 def cmd_remote_status(args: argparse.Namespace) -> int:
     """List running remote agent instances."""
-    from orchestration.remote import list_instances
+    from orchestration.remote import list_instances, list_instances_multi
 
     project = getattr(args, "project", None)
-    instances = list_instances(project=project)
+    projects = [p.strip() for p in project.split(",") if p.strip()] if project else []
+    if len(projects) > 1:
+        instances = list_instances_multi(projects)
+    else:
+        instances = list_instances(project=project)
 
     if not instances:
         print("No remote agent instances found.")
@@ -1696,7 +1701,10 @@ def setup_remote_parser(subparsers: argparse._SubParsersAction) -> None:
         "status",
         help="List running remote agent instances",
     )
-    status_parser.add_argument("--project", help="GCP project ID")
+    status_parser.add_argument(
+        "--project",
+        help="GCP project ID (comma-separate several to list across projects)",
+    )
     status_parser.add_argument(
         "--format",
         choices=["text", "json"],
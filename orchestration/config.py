@@ -11,6 +11,7 @@ Design Principles:
 
 from __future__ import annotations
 
+import functools
 import os
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -132,6 +133,18 @@ def _extract_eco_section(data: dict[str, Any], filename: str) -> dict[str, Any]:
     return data.get("tool", {}).get("eco", {})
 
 
+@functools.lru_cache(maxsize=64)
+def _read_eco_section(path: str, mtime_ns: int, size: int) -> dict[str, Any]:
+    """Parse *path* and return its eco section, memoized on the file's stat.
+
+    ``mtime_ns`` and ``size`` are part of the key only so that editing the
+    file invalidates the entry; the returned dict is shared and must not be
+    mutated.
+    """
+    config_file = Path(path)
+    return _extract_eco_section(_parse_toml(config_file), config_file.name)
+
+
 def _build_config(section: dict[str, Any]) -> EcoConfig:
     """Build an EcoConfig from a parsed TOML section, with env overrides."""
     models = dict(MODEL_TABLE)
@@ -205,8 +218,9 @@ def load_config(search_dir: str | Path | None = None) -> EcoConfig:
     if config_file is None:
         return _build_config({})
 
-    data = _parse_toml(config_file)
-    section = _extract_eco_section(data, config_file.name)
+    # Only the TOML parse is cached: env overrides are re-read on every call.
+    st = config_file.stat()
+    section = _read_eco_section(str(config_file), st.st_mtime_ns, st.st_size)
     return _build_config(section)
 
 
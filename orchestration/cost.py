@@ -4,6 +4,12 @@ This module provides deterministic infrastructure for recording, storing,
 and analyzing token usage across CLI commands. All cost calculations use
 a static pricing table — no API calls, no probabilistic behavior.
 
+Optional packages: with ``orjson`` installed, usage lines are encoded and
+parsed by it.
+
+Date-filtered reads seek through a SQLite sidecar index of line offsets, so
+they read only the lines in the requested window.
+
 Design Principles:
 - P5 Deterministic Infrastructure: Pricing lookup, aggregation are pure Python
 - P6 Code Before Prompts: Token counting and cost math, not AI
@@ -12,15 +18,24 @@ Design Principles:
 
 from __future__ import annotations
 
+import contextlib
+import hashlib
 import json
 import os
+import sqlite3
 from collections import defaultdict
-from dataclasses import asdict, dataclass
+from collections.abc import Iterator
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
+try:
+    import orjson
+except ImportError:  # optional; UsageStore falls back to json
+    orjson = None
 
-@dataclass
+
+@dataclass(slots=True)
 class UsageRecord:
     """A single token usage event.
 
@@ -45,7 +60,7 @@ class UsageRecord:
     session_id: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DailySummary:
     """Aggregated usage for a single day.
 
@@ -89,15 +104,101 @@ MODEL_PRICING: dict[str, dict[str, float]] = {
 DEFAULT_PRICING: dict[str, float] = {"input": 3.00, "output": 15.00}
 
 
+def _rates(model: str) -> tuple[float, float]:
+    """(input, output) price per 1M tokens for a model, or the default."""
+    pricing = MODEL_PRICING.get(model, DEFAULT_PRICING)
+    return pricing["input"], pricing["output"]
+
+
+def _cost(rates: tuple[float, float], input_tokens: int, output_tokens: int) -> float:
+    """Cost in USD at the given rates, rounded to 6 places."""
+    input_cost = (input_tokens / 1_000_000) * rates[0]
+    output_cost = (output_tokens / 1_000_000) * rates[1]
+    return round(input_cost + output_cost, 6)
+
+
 # ---------------------------------------------------------------------------
 # Storage
 # ---------------------------------------------------------------------------
 
+def _loads(data: bytes) -> Any:
+    """Parse one JSONL line with orjson when installed, else json."""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson rejects lone surrogate escapes that json.dumps writes
+            pass
+    return json.loads(data)
+
+
+def _dumps_line(record: UsageRecord) -> bytes:
+    """Encode one record as a newline-terminated JSONL line."""
+    if orjson is not None:
+        try:
+            # orjson serializes dataclasses natively, skipping asdict()
+            return orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE)
+        except TypeError:  # orjson.JSONEncodeError, e.g. lone surrogates
+            pass
+    return (json.dumps(asdict(record)) + "\n").encode()
+
+
+# Sidecar index over usage.jsonl: one row per line, keyed by timestamp. The
+# JSONL file stays the record of truth; ``meta.offset`` is how many of its
+# bytes have been indexed, so rows can always be rebuilt from the log.
+# ``meta.inode`` and ``meta.head`` identify the indexed log, so a rotated or
+# replaced file is re-indexed instead of read at stale positions.
+_USAGE_INDEX_SCHEMA = """
+CREATE TABLE IF NOT EXISTS lines (
+    timestamp TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    length INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS lines_timestamp ON lines(timestamp);
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value INTEGER NOT NULL);
+"""
+
+
+# Indexed bytes hashed into ``meta.head``; an append-only log never changes them.
+_HEAD_BYTES = 4096
+
+
+def _head_hash(f: Any, length: int) -> int:
+    """Signed 64-bit hash of the first *length* bytes of an open binary file."""
+    f.seek(0)
+    digest = hashlib.blake2b(f.read(length), digest_size=8).digest()
+    return int.from_bytes(digest, "big", signed=True)
+
+
+def _line_timestamp(line: bytes) -> str | None:
+    """Return the timestamp of one JSONL line, or None if it has none."""
+    if not line.strip():
+        return None
+    try:
+        d = _loads(line)
+    except ValueError:
+        return None
+    timestamp = d.get("timestamp") if isinstance(d, dict) else None
+    return timestamp if isinstance(timestamp, str) else None
+
+
+def _index_rows(data: bytes, position: int) -> Iterator[tuple[str, int, int]]:
+    """Yield ``(timestamp, position, length)`` for each complete line in *data*."""
+    for line in data.split(b"\n")[:-1]:
+        length = len(line) + 1
+        timestamp = _line_timestamp(line)
+        if timestamp is not None:
+            yield timestamp, position, length
+        position += length
+
+
 class UsageStore:
     """Append-only JSONL store for usage records.
 
     Default location: ``~/.agents/usage.jsonl``.  Override with the
-    ``AGENTS_USAGE_FILE`` environment variable.
+    ``AGENTS_USAGE_FILE`` environment variable.  Date-filtered reads go
+    through a ``.sqlite`` index next to it, which is caught up with the log
+    on each such read; appends only touch the JSONL file.
     """
 
     def __init__(self, path: str | None = None) -> None:
@@ -107,24 +208,119 @@ class UsageStore:
                 os.path.expanduser("~/.agents/usage.jsonl"),
             )
         self.path = Path(path)
+        self._index_path = self.path.with_suffix(".sqlite")
 
     def append(self, record: UsageRecord) -> None:
         """Append a single usage record."""
         self.path.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.path, "a") as f:
-            f.write(json.dumps(asdict(record)) + "\n")
+        line = _dumps_line(record)
+        with open(self.path, "ab") as f:
+            f.write(line)
 
-    def read_all(self) -> list[UsageRecord]:
-        """Read every record from the store."""
+    def _iter_dicts(self) -> Iterator[dict[str, Any]]:
+        """Yield each stored line parsed into a plain dict."""
         if not self.path.exists():
-            return []
-        records: list[UsageRecord] = []
-        with open(self.path) as f:
+            return
+        with open(self.path, "rb") as f:
             for line in f:
-                line = line.strip()
-                if line:
-                    records.append(UsageRecord(**json.loads(line)))
-        return records
+                if line.strip():
+                    yield _loads(line)
+
+    def _open_index(self) -> sqlite3.Connection:
+        try:
+            return self._connect_index()
+        except sqlite3.DatabaseError:
+            # Corrupt sidecar: it is derived data, so start over
+            self._index_path.unlink(missing_ok=True)
+            return self._connect_index()
+
+    def _connect_index(self) -> sqlite3.Connection:
+        db = sqlite3.connect(self._index_path, isolation_level=None)
+        try:
+            db.executescript(_USAGE_INDEX_SCHEMA)
+            self._catch_up(db)
+        except BaseException:
+            db.close()
+            raise
+        return db
+
+    def _catch_up(self, db: sqlite3.Connection) -> None:
+        """Index JSONL bytes past the stored offset, rebuilding if the log was replaced.
+
+        The log counts as replaced when it shrank, its inode changed, or its
+        first indexed bytes differ. The stored offset is read under ``BEGIN
+        IMMEDIATE`` so concurrent readers index each line once.
+        """
+        with db, open(self.path, "rb") as f:  # one transaction
+            db.execute("BEGIN IMMEDIATE")
+            meta = dict(db.execute("SELECT key, value FROM meta"))
+            offset = meta.get("offset", 0)
+            st = os.fstat(f.fileno())
+            inode = st.st_ino & (2**63 - 1)  # SQLite integers are signed 64-bit
+            replaced = offset > 0 and (
+                st.st_size < offset
+                or meta.get("inode") != inode
+                or meta.get("head") != _head_hash(f, min(offset, _HEAD_BYTES))
+            )
+            if replaced:
+                db.execute("DELETE FROM lines")
+                offset = 0
+            elif st.st_size == offset:
+                return
+
+            f.seek(offset)
+            data = f.read()
+            # Leave a partially written last line for the next catch-up
+            end = data.rfind(b"\n") + 1
+            db.executemany(
+                "INSERT INTO lines VALUES (?, ?, ?)", _index_rows(data[:end], offset),
+            )
+            offset += end
+            db.executemany(
+                "INSERT OR REPLACE INTO meta VALUES (?, ?)",
+                [
+                    ("offset", offset),
+                    ("inode", inode),
+                    ("head", _head_hash(f, min(offset, _HEAD_BYTES))),
+                ],
+            )
+
+    def _iter_window(self, since: str | None, until: str | None) -> Iterator[dict[str, Any]]:
+        """Yield parsed lines timestamped within [since, until], in file order.
+
+        Falls back to a full scan when the index cannot be opened, e.g. in a
+        read-only directory.
+        """
+        if not self.path.exists():
+            return
+        clauses: list[str] = []
+        params: list[str] = []
+        if since is not None:
+            clauses.append("timestamp >= ?")
+            params.append(since)
+        if until is not None:
+            clauses.append("timestamp <= ?")
+            params.append(until)
+        query = "SELECT position, length FROM lines WHERE " + " AND ".join(clauses)
+        try:
+            with contextlib.closing(self._open_index()) as db:
+                spans = db.execute(query + " ORDER BY position", params).fetchall()
+        except (sqlite3.DatabaseError, OSError):
+            yield from self._iter_dicts()
+            return
+        with open(self.path, "rb") as f:
+            for position, length in spans:
+                f.seek(position)
+                yield _loads(f.read(length))
+
+    def iter_all(self) -> Iterator[UsageRecord]:
+        """Yield every record from the store, one line at a time."""
+        for d in self._iter_dicts():
+            yield UsageRecord(**d)
+
+    def read_all(self) -> list[UsageRecord]:
+        """Read every record from the store."""
+        return list(self.iter_all())
 
     def read_filtered(
         self,
@@ -135,21 +331,36 @@ class UsageStore:
         until: str | None = None,
         command: str | None = None,
     ) -> list[UsageRecord]:
-        """Read records matching all supplied filters (AND logic)."""
-        records = self.read_all()
-        if pr is not None:
-            records = [r for r in records if r.pr == pr]
-        if issue is not None:
-            records = [r for r in records if r.issue == issue]
-        if since is not None:
-            # Date-only values (YYYY-MM-DD) include the full day
-            cmp = since + "T00:00:00Z" if len(since) == 10 else since
-            records = [r for r in records if r.timestamp >= cmp]
-        if until is not None:
-            cmp = until + "T23:59:59Z" if len(until) == 10 else until
-            records = [r for r in records if r.timestamp <= cmp]
-        if command is not None:
-            records = [r for r in records if r.command == command]
+        """Read records matching all supplied filters (AND logic).
+
+        Filters run on the parsed dicts, so a ``UsageRecord`` is only built
+        for lines that match.  With ``since`` or ``until`` only the lines in
+        that window are read, via the sidecar index.
+        """
+        equals = [
+            (key, value)
+            for key, value in (("pr", pr), ("issue", issue), ("command", command))
+            if value is not None
+        ]
+        # Date-only values (YYYY-MM-DD) include the full day
+        if since is not None and len(since) == 10:
+            since += "T00:00:00Z"
+        if until is not None and len(until) == 10:
+            until += "T23:59:59Z"
+
+        if since is None and until is None:
+            lines = self._iter_dicts()
+        else:
+            lines = self._iter_window(since, until)
+
+        records: list[UsageRecord] = []
+        for d in lines:
+            if since is not None and d["timestamp"] < since:
+                continue
+            if until is not None and d["timestamp"] > until:
+                continue
+            if all(d.get(key) == value for key, value in equals):
+                records.append(UsageRecord(**d))
         return records
 
 
@@ -157,16 +368,25 @@ class UsageStore:
 # Cost calculation
 # ---------------------------------------------------------------------------
 
+@dataclass(slots=True)
+class _DayTotals:
+    """Running totals for one day while summarizing usage."""
+
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cost: float = 0.0
+    count: int = 0
+    models: set[str] = field(default_factory=set)
+    commands: set[str] = field(default_factory=set)
+
+
 class CostCalculator:
     """Pure-Python cost estimation from token counts and a pricing table."""
 
     @staticmethod
     def estimate_cost(model: str, input_tokens: int, output_tokens: int) -> float:
         """Estimate cost in USD for a single usage event."""
-        pricing = MODEL_PRICING.get(model, DEFAULT_PRICING)
-        input_cost = (input_tokens / 1_000_000) * pricing["input"]
-        output_cost = (output_tokens / 1_000_000) * pricing["output"]
-        return round(input_cost + output_cost, 6)
+        return _cost(_rates(model), input_tokens, output_tokens)
 
     @staticmethod
     def estimate_record_cost(record: UsageRecord) -> float:
@@ -178,28 +398,29 @@ class CostCalculator:
     @staticmethod
     def summarize_by_day(records: list[UsageRecord]) -> list[DailySummary]:
         """Aggregate records into daily summaries, sorted chronologically."""
-        by_day: dict[str, list[UsageRecord]] = defaultdict(list)
+        by_day: dict[str, _DayTotals] = defaultdict(_DayTotals)
+        rates: dict[str, tuple[float, float]] = {}
         for r in records:
-            day = r.timestamp[:10]  # YYYY-MM-DD
-            by_day[day].append(r)
-
-        summaries: list[DailySummary] = []
-        for day in sorted(by_day):
-            day_records = by_day[day]
-            total_input = sum(r.input_tokens for r in day_records)
-            total_output = sum(r.output_tokens for r in day_records)
-            total_cost = sum(
-                CostCalculator.estimate_record_cost(r) for r in day_records
-            )
-            summaries.append(
-                DailySummary(
-                    date=day,
-                    total_input_tokens=total_input,
-                    total_output_tokens=total_output,
-                    estimated_cost_usd=round(total_cost, 6),
-                    record_count=len(day_records),
-                    models=sorted({r.model for r in day_records}),
-                    commands=sorted({r.command for r in day_records}),
-                )
+            model_rates = rates.get(r.model)
+            if model_rates is None:
+                model_rates = rates[r.model] = _rates(r.model)
+            day = by_day[r.timestamp[:10]]  # YYYY-MM-DD
+            day.input_tokens += r.input_tokens
+            day.output_tokens += r.output_tokens
+            day.cost += _cost(model_rates, r.input_tokens, r.output_tokens)
+            day.count += 1
+            day.models.add(r.model)
+            day.commands.add(r.command)
+
+        return [
+            DailySummary(
+                date=date,
+                total_input_tokens=day.input_tokens,
+                total_output_tokens=day.output_tokens,
+                estimated_cost_usd=round(day.cost, 6),
+                record_count=day.count,
+                models=sorted(day.models),
+                commands=sorted(day.commands),
             )
-        return summaries
+            for date, day in sorted(by_day.items())
+        ]
@@ -13,13 +13,13 @@ Design Principles:
 
 from __future__ import annotations
 
+import contextlib
 import json
 import logging
 import os
 import time
 import uuid
 from dataclasses import asdict, dataclass, field
-from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
 
@@ -220,7 +220,7 @@ class ExecutionEngine:
             run_id=uuid.uuid4().hex[:12],
             task=task,
             task_type=decision.task_type.value,
-            agent_sequence=decision.agent_sequence,
+            agent_sequence=list(decision.agent_sequence),
             status="pending",
             model=model,
             started_at=_now_iso(),
@@ -656,7 +656,6 @@ class DeployEngine:
         fetcher = CommentFetcher()
         classifier = IntentClassifier()
         executor = ActionExecutor(engine=engine)
-        history = SyncHistory()
 
         if pr:
             comments = fetcher.fetch_pr_comments(pr)
@@ -666,18 +665,19 @@ class DeployEngine:
         else:
             return {"error": "Must specify --issue or --pr", "actions": []}
 
-        new_comments = [
-            c for c in comments
-            if not history.is_processed(c.id)
-            and not c.body.strip().startswith(_AGENT_RESULT_MARKER)
-        ]
-        results = []
-        for comment in new_comments:
-            classified = classifier.classify(comment)
-            result = executor.execute(classified, dry_run=dry_run)
-            results.append(asdict(result))
-            if not dry_run:
-                history.record(result)
+        with contextlib.closing(SyncHistory()) as history:
+            new_comments = [
+                c for c in comments
+                if not history.is_processed(c.id)
+                and not c.body.strip().startswith(_AGENT_RESULT_MARKER)
+            ]
+            results = []
+            with history.open_batch():
+                for classified in classifier.classify_many(new_comments):
+                    result = executor.execute(classified, dry_run=dry_run)
+                    results.append(asdict(result))
+                    if not dry_run:
+                        history.record(result)
 
         return {
             "total_comments": len(comments),
@@ -842,7 +842,7 @@ def _load_agent_definition(agent: str, run: TaskRun | None = None) -> str:
 
 def _now_iso() -> str:
     """Return the current UTC time as an ISO 8601 string."""
-    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
 
 
 def _task_type_to_model_key(task_type: str) -> str:
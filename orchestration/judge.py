@@ -13,12 +13,24 @@ Design Principles:
 
 from __future__ import annotations
 
+import json
 import re
 import statistics
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Callable, Optional
 
+# Judge output patterns, compiled once rather than on every parse
+_REASONING_PATTERN = re.compile(r"[Rr]easoning:\s*(.+?)(?=[Ss]core:|$)", re.DOTALL)
+_SCORE_PATTERN = re.compile(r"[Ss]core:\s*([\d.]+)")
+_WINNER_PATTERN = re.compile(r"[Ww]inner:\s*([ABab]|tie)", re.IGNORECASE)
+# Any one of these phrases flags a safety concern
+_SAFETY_PATTERN = re.compile(
+    r"[Ss]afety:\s*CONCERN|[Ss]afety\s+concern|potentially\s+harmful|safety\s+issue",
+    re.IGNORECASE,
+)
+
 
 @dataclass
 class EvaluationCriterion:
@@ -110,6 +122,9 @@ class PairwiseResult:
 # Type alias for judge functions
 JudgeFn = Callable[[str], str]
 
+# Upper bound on judges called at once by multi_model_ensemble
+_ENSEMBLE_MAX_WORKERS = 8
+
 
 class JudgeEngine:
     """Engine for LLM-as-judge evaluation.
@@ -123,6 +138,7 @@ class JudgeEngine:
         build_pairwise_prompt: Build a prompt for pairwise comparison
         parse_criterion_score: Parse and validate a score from judge response
         evaluate: Evaluate a response against a rubric
+        evaluate_batch: Evaluate several responses with one judge call per batch
         pairwise_compare: Compare two responses with position debiasing
         ensemble_vote: Get majority vote from multiple judges
     """
@@ -275,13 +291,35 @@ class JudgeEngine:
             ValueError: If reasoning is missing, score is not an integer,
                        or score is outside the valid range
         """
-        # Extract reasoning - must come before score
-        reasoning_match = re.search(
-            r"[Rr]easoning:\s*(.+?)(?=[Ss]core:|$)",
-            response,
-            re.DOTALL,
+        reasoning, score = self._parse_reasoning_and_score(response)
+
+        # Validate range
+        min_score, max_score = criterion.scale
+        if score < min_score or score > max_score:
+            raise ValueError(
+                f"Score {score} is outside valid range [{min_score}, {max_score}]. "
+                f"Score must be between {min_score} and {max_score}."
+            )
+
+        return CriterionScore(
+            criterion=criterion,
+            score=score,
+            reasoning=reasoning,
         )
 
+    @staticmethod
+    def _parse_reasoning_and_score(response: str) -> tuple[str, int]:
+        """Extract the reasoning and integer score from a judge response.
+
+        This is the criterion-independent part of ``parse_criterion_score``;
+        only the range check depends on the criterion.
+
+        Raises:
+            ValueError: If reasoning is missing or the score is not an integer
+        """
+        # Extract reasoning - must come before score
+        reasoning_match = _REASONING_PATTERN.search(response)
+
         if not reasoning_match:
             raise ValueError(
                 "Reasoning is required before score. "
@@ -293,7 +331,7 @@ class JudgeEngine:
             raise ValueError("Reasoning is required before score and cannot be empty.")
 
         # Extract score
-        score_match = re.search(r"[Ss]core:\s*([\d.]+)", response)
+        score_match = _SCORE_PATTERN.search(response)
         if not score_match:
             raise ValueError("No score found in response. Expected 'Score: N'")
 
@@ -315,19 +353,36 @@ class JudgeEngine:
             except ValueError:
                 raise ValueError(f"Score must be an integer, got: {score_str}")
 
-        # Validate range
-        min_score, max_score = criterion.scale
-        if score < min_score or score > max_score:
-            raise ValueError(
-                f"Score {score} is outside valid range [{min_score}, {max_score}]. "
-                f"Score must be between {min_score} and {max_score}."
-            )
+        return reasoning, score
 
-        return CriterionScore(
-            criterion=criterion,
-            score=score,
-            reasoning=reasoning,
-        )
+    def _score_rubric(
+        self,
+        judge_response: str,
+        rubric: list[EvaluationCriterion],
+    ) -> list[CriterionScore]:
+        """Score every criterion in the rubric from one judge response.
+
+        Equivalent to calling ``parse_criterion_score`` per criterion and
+        dropping the failures, but scans the response once rather than once
+        per criterion.
+        """
+        try:
+            reasoning, score = self._parse_reasoning_and_score(judge_response)
+        except ValueError:
+            return []
+        return [
+            CriterionScore(criterion=criterion, score=score, reasoning=reasoning)
+            for criterion in rubric
+            if criterion.scale[0] <= score <= criterion.scale[1]
+        ]
+
+    @staticmethod
+    def _index_scores(scores: list[CriterionScore]) -> dict[str, CriterionScore]:
+        """Map criterion name to its first score, for O(1) lookup per criterion."""
+        index: dict[str, CriterionScore] = {}
+        for score in scores:
+            index.setdefault(score.criterion.name, score)
+        return index
 
     def _parse_winner(self, response: str) -> str:
         """Parse winner from pairwise comparison response.
@@ -338,7 +393,7 @@ class JudgeEngine:
         Returns:
             "A", "B", or "tie"
         """
-        winner_match = re.search(r"[Ww]inner:\s*([ABab]|tie)", response, re.IGNORECASE)
+        winner_match = _WINNER_PATTERN.search(response)
         if winner_match:
             winner = winner_match.group(1).upper()
             if winner == "TIE":
@@ -355,16 +410,7 @@ class JudgeEngine:
         Returns:
             True if safety concern detected
         """
-        safety_patterns = [
-            r"[Ss]afety:\s*CONCERN",
-            r"[Ss]afety\s+concern",
-            r"potentially\s+harmful",
-            r"safety\s+issue",
-        ]
-        for pattern in safety_patterns:
-            if re.search(pattern, response, re.IGNORECASE):
-                return True
-        return False
+        return _SAFETY_PATTERN.search(response) is not None
 
     def _build_standard_bias_checklist(
         self,
@@ -415,17 +461,19 @@ class JudgeEngine:
         prompt = self.build_evaluation_prompt(response, rubric, reference)
         judge_response = judge_fn(prompt)
 
-        # Parse scores for each criterion
-        scores: list[CriterionScore] = []
-        for criterion in rubric:
-            try:
-                score = self.parse_criterion_score(judge_response, criterion)
-                scores.append(score)
-            except ValueError:
-                # If parsing fails for a criterion, try to extract any score
-                # This is a fallback - ideally all criteria are scored
-                pass
+        # Parse scores for each criterion; criteria that fail validation
+        # are left out of the report
+        scores = self._score_rubric(judge_response, rubric)
+
+        return self._build_report(scores, judge_response, reference)
 
+    def _build_report(
+        self,
+        scores: list[CriterionScore],
+        judge_response: str,
+        reference: Optional[str],
+    ) -> EvaluationReport:
+        """Assemble an EvaluationReport from parsed scores and the judge's text."""
         # Calculate weighted total
         if scores:
             total_weight = sum(s.criterion.weight for s in scores)
@@ -460,6 +508,198 @@ class JudgeEngine:
             confidence=1.0 if not safety_flag else 0.8,
         )
 
+    def build_batch_evaluation_prompt(
+        self,
+        responses: list[str],
+        rubric: list[EvaluationCriterion],
+        reference: Optional[str] = None,
+    ) -> str:
+        """Build one prompt that asks for a JSON evaluation of several responses.
+
+        Args:
+            responses: The responses to evaluate, numbered from 1 in the prompt
+            rubric: List of evaluation criteria
+            reference: Optional reference/ground truth answer shared by all
+
+        Returns:
+            Formatted prompt string for the judge
+        """
+        prompt_parts = [
+            (
+                "You are an expert evaluator. Evaluate each of the following responses "
+                "independently against the provided criteria."
+            ),
+            "",
+            "IMPORTANT INSTRUCTIONS:",
+            "1. You MUST provide reasoning BEFORE giving any score",
+            "2. Scores must be integers within the specified scale",
+            (
+                "3. If you detect any safety concerns, include 'Safety: CONCERN' in that "
+                "response's overall assessment"
+            ),
+            "",
+        ]
+
+        if reference:
+            prompt_parts.extend(["Reference Answer:", reference, ""])
+
+        for task_id, response in enumerate(responses, start=1):
+            prompt_parts.extend([f"Response {task_id}:", response, ""])
+
+        prompt_parts.append("Evaluation Criteria:")
+        for criterion in rubric:
+            min_score, max_score = criterion.scale
+            prompt_parts.append(
+                f"- {criterion.name}: {criterion.description} "
+                f"(Scale: {min_score} to {max_score}, Weight: {criterion.weight})"
+            )
+
+        prompt_parts.extend(
+            [
+                "",
+                (
+                    f"Respond with only a JSON array of {len(responses)} objects, one per "
+                    "response and in the same order:"
+                ),
+                (
+                    '[{"task_id": 1, "scores": [{"criterion": "<name>", '
+                    '"reasoning": "<your reasoning>", "score": <integer>}, ...], '
+                    '"overall": "<overall assessment>"}, ...]'
+                ),
+            ]
+        )
+
+        return "\n".join(prompt_parts)
+
+    def evaluate_batch(
+        self,
+        responses: list[str],
+        rubric: list[EvaluationCriterion],
+        judge_fn: Optional[JudgeFn] = None,
+        reference: Optional[str] = None,
+        batch_size: int = 5,
+    ) -> list[EvaluationReport]:
+        """Evaluate several responses, asking the judge about ``batch_size`` at a time.
+
+        Each batch is one judge call whose JSON answer is split back into one
+        report per response by ``task_id``; each entry's ``reasoning`` and
+        ``score`` fields get the same checks as ``parse_criterion_score``. If
+        a batch answer is not a JSON array with exactly one entry per
+        ``task_id``, that batch falls back to ``evaluate()`` per response (P16).
+
+        Args:
+            responses: The responses to evaluate
+            rubric: List of evaluation criteria
+            judge_fn: Function that takes a prompt and returns judge response
+            reference: Optional ground truth/reference answer shared by all
+            batch_size: Maximum number of responses per judge call
+
+        Returns:
+            One EvaluationReport per response, in order
+        """
+        if judge_fn is None:
+            raise ValueError("judge_fn is required for evaluation")
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be at least 1, got {batch_size}")
+
+        reports: list[EvaluationReport] = []
+        for start in range(0, len(responses), batch_size):
+            batch = responses[start:start + batch_size]
+            prompt = self.build_batch_evaluation_prompt(batch, rubric, reference)
+            items = self._parse_batch_items(judge_fn(prompt), len(batch))
+            if items is None:
+                reports.extend(
+                    self.evaluate(response, rubric, reference, judge_fn) for response in batch
+                )
+                continue
+            reports.extend(self._batch_item_report(item, rubric, reference) for item in items)
+        return reports
+
+    @staticmethod
+    def _parse_batch_items(judge_response: str, expected: int) -> list[dict] | None:
+        """Extract the per-response objects from a batch answer, ordered by ``task_id``.
+
+        Returns None if the answer is malformed or its ``task_id`` values are
+        not exactly ``1..expected``, each once.
+        """
+        start = judge_response.find("[")
+        end = judge_response.rfind("]")
+        if start == -1 or end < start:
+            return None
+        try:
+            items = json.loads(judge_response[start:end + 1])
+        except json.JSONDecodeError:
+            return None
+        if (
+            not isinstance(items, list)
+            or len(items) != expected
+            or not all(isinstance(item, dict) for item in items)
+        ):
+            return None
+        by_task_id = {item.get("task_id"): item for item in items}
+        task_ids = range(1, expected + 1)
+        if by_task_id.keys() != set(task_ids):
+            return None  # missing, duplicate or unknown task_id
+        # bool is an int subclass, so True would otherwise pass as task 1
+        if any(type(task_id) is not int for task_id in by_task_id):
+            return None
+        return [by_task_id[task_id] for task_id in task_ids]
+
+    @staticmethod
+    def _batch_criterion_score(entry: dict, criterion: EvaluationCriterion) -> CriterionScore:
+        """Validate one JSON score entry the way ``parse_criterion_score`` validates text.
+
+        Raises:
+            ValueError: If reasoning is missing or empty, the score is not an
+                integer, or it is outside the criterion's scale
+        """
+        reasoning = entry.get("reasoning")
+        if not isinstance(reasoning, str) or not reasoning.strip():
+            raise ValueError("Reasoning is required before score and cannot be empty.")
+
+        score = entry.get("score")
+        if isinstance(score, float) and score.is_integer():
+            score = int(score)
+        if type(score) is not int:
+            raise ValueError(f"Score must be an integer, got: {score!r}")
+
+        min_score, max_score = criterion.scale
+        if score < min_score or score > max_score:
+            raise ValueError(
+                f"Score {score} is outside valid range [{min_score}, {max_score}]. "
+                f"Score must be between {min_score} and {max_score}."
+            )
+        return CriterionScore(criterion=criterion, score=score, reasoning=reasoning.strip())
+
+    def _batch_item_report(
+        self,
+        item: dict,
+        rubric: list[EvaluationCriterion],
+        reference: Optional[str],
+    ) -> EvaluationReport:
+        """Build a report for one entry of a batch answer."""
+        by_name = {
+            entry.get("criterion"): entry
+            for entry in item.get("scores") or []
+            if isinstance(entry, dict)
+        }
+        scores: list[CriterionScore] = []
+        texts: list[str] = []
+        for criterion in rubric:
+            entry = by_name.get(criterion.name)
+            if entry is None:
+                continue
+            texts.append(
+                f"## {criterion.name}\n"
+                f"Reasoning: {entry.get('reasoning', '')}\nScore: {entry.get('score', '')}"
+            )
+            try:
+                scores.append(self._batch_criterion_score(entry, criterion))
+            except ValueError:
+                pass
+        texts.append(str(item.get("overall", "")))
+        return self._build_report(scores, "\n".join(texts), reference)
+
     def pairwise_compare(
         self,
         response_a: str,
@@ -570,13 +810,7 @@ class JudgeEngine:
         for _ in range(n_judges):
             judge_response = judge_fn(prompt)
 
-            scores: list[CriterionScore] = []
-            for criterion in rubric:
-                try:
-                    score = self.parse_criterion_score(judge_response, criterion)
-                    scores.append(score)
-                except ValueError:
-                    pass
+            scores = self._score_rubric(judge_response, rubric)
 
             if scores:
                 total_weight = sum(s.criterion.weight for s in scores)
@@ -630,13 +864,11 @@ class JudgeEngine:
 
         # Combine scores from all judges (use first matching for each criterion)
         combined_scores: list[CriterionScore] = []
+        indexes = [self._index_scores(scores) for scores in all_scores]
         for criterion in rubric:
-            criterion_scores = []
-            for scores in all_scores:
-                for s in scores:
-                    if s.criterion.name == criterion.name:
-                        criterion_scores.append(s)
-                        break
+            criterion_scores = [
+                index[criterion.name] for index in indexes if criterion.name in index
+            ]
 
             if criterion_scores:
                 # Use median score
@@ -686,8 +918,10 @@ class JudgeEngine:
     ) -> EvaluationReport:
         """Run the same rubric across multiple model backends and aggregate results.
 
-        Calls ``self.evaluate()`` once per judge_fn, collecting reports.  Judges
-        that raise exceptions are skipped (P16: graceful degradation).  Results
+        Calls ``self.evaluate()`` once per judge_fn, collecting reports.  The
+        judges run concurrently on a thread pool, since each is typically a
+        network-bound model call; reports keep the order of ``judge_fns``.
+        Judges that raise exceptions are skipped (P16: graceful degradation).  Results
         are aggregated via median scores per criterion, majority-vote total, and
         an agreement-based confidence metric.
 
@@ -701,20 +935,25 @@ class JudgeEngine:
             A single aggregated :class:`EvaluationReport`.
         """
         total_models = len(judge_fns)
-        reports: list[EvaluationReport] = []
 
-        for judge_fn in judge_fns:
+        def run_judge(judge_fn: JudgeFn) -> EvaluationReport | None:
             try:
-                report = self.evaluate(
+                return self.evaluate(
                     response=response,
                     rubric=rubric,
                     reference=reference,
                     judge_fn=judge_fn,
                 )
-                reports.append(report)
             except Exception:
                 # P16: graceful degradation -- skip failing judges
-                continue
+                return None
+
+        if total_models > 1:
+            with ThreadPoolExecutor(max_workers=min(total_models, _ENSEMBLE_MAX_WORKERS)) as pool:
+                outcomes = list(pool.map(run_judge, judge_fns))
+        else:
+            outcomes = [run_judge(judge_fn) for judge_fn in judge_fns]
+        reports = [report for report in outcomes if report is not None]
 
         successful = len(reports)
 
@@ -763,15 +1002,13 @@ class JudgeEngine:
 
         # Median scores per criterion
         combined_scores: list[CriterionScore] = []
+        indexes = [self._index_scores(report.scores) for report in reports]
         for criterion in rubric:
-            criterion_scores: list[int] = []
-            criterion_reasonings: list[str] = []
-            for report in reports:
-                for s in report.scores:
-                    if s.criterion.name == criterion.name:
-                        criterion_scores.append(s.score)
-                        criterion_reasonings.append(s.reasoning[:100])
-                        break
+            matched = [
+                index[criterion.name] for index in indexes if criterion.name in index
+            ]
+            criterion_scores = [s.score for s in matched]
+            criterion_reasonings = [s.reasoning[:100] for s in matched]
 
             if criterion_scores:
                 median_score = int(statistics.median(criterion_scores))
@@ -14,8 +14,10 @@ from orchestration.prompts.judge_prompts import (
     reference_eval_prompt,
 )
 from orchestration.prompts.router_prompt import (
+    DecompositionCache,
     classify_task_prompt,
     decompose_task_prompt,
+    task_skeleton,
 )
 from orchestration.prompts.review_prompts import (
     review_pr_prompt,
@@ -23,11 +25,13 @@ from orchestration.prompts.review_prompts import (
 )
 
 __all__ = [
-    "reference_eval_prompt",
-    "pairwise_eval_prompt",
+    "DecompositionCache",
     "bias_checklist_prompt",
     "classify_task_prompt",
     "decompose_task_prompt",
+    "pairwise_eval_prompt",
+    "reference_eval_prompt",
     "review_pr_prompt",
     "scrutinize_test_changes_prompt",
+    "task_skeleton",
 ]
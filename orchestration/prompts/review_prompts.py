@@ -3,19 +3,107 @@
 These prompts support code review tasks including PR diff review and
 test quality assessment. All prompts require reasoning before scores (P3)
 and allow uncertainty expression (P16).
+
+Diffs are fitted to a token budget before being embedded so an oversized
+diff yields a truncated-but-contextual prompt instead of a failed model call.
 """
 
+import functools
+import re
+from collections.abc import Callable
+
+# Default prompt budget: a 200k-token context window minus room for the
+# model's response.
+DEFAULT_PROMPT_TOKENS = 200_000 - 8_192
+
+# Rough fallback when tiktoken is not installed (~4 characters per token).
+_CHARS_PER_TOKEN = 4
+
+_DIFF_FILE_BOUNDARY = re.compile(r"^diff --git ", re.MULTILINE)
+_TRUNCATION_MARKER = "\n[diff truncated: {omitted} bytes omitted]"
+
+
+@functools.lru_cache(maxsize=1)
+def _encoding():
+    """Load the tiktoken encoding once, or return None if unavailable."""
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+    return tiktoken.encoding_for_model("gpt-4o")
+
+
+def count_tokens(text: str) -> int:
+    """Count tokens in ``text`` with tiktoken, or estimate from its length."""
+    encoding = _encoding()
+    if encoding is None:
+        return -(-len(text) // _CHARS_PER_TOKEN)
+    return len(encoding.encode(text, disallowed_special=()))
+
 
-def review_pr_prompt(diff: str, rubric: str) -> str:
+def _longest_fitting_prefix(text: str, cuts: list[int], max_tokens: int) -> int:
+    """Binary-search ``cuts`` (ascending offsets) for the longest prefix that fits."""
+    lo, hi, best = 0, len(cuts) - 1, 0
+    while lo <= hi:
+        mid = (lo + hi) // 2
+        if count_tokens(text[:cuts[mid]]) <= max_tokens:
+            best = cuts[mid]
+            lo = mid + 1
+        else:
+            hi = mid - 1
+    return best
+
+
+def _fit_to_budget(text: str, max_tokens: int) -> str:
+    """Truncate a diff to ``max_tokens``, preferring whole-file boundaries.
+
+    Keeps as many complete ``diff --git`` file sections as fit; if not even
+    the first file fits, falls back to whole lines. A marker line records
+    how many bytes were dropped.
+    """
+    if count_tokens(text) <= max_tokens:
+        return text
+
+    # Reserve room for the marker, sized for the worst case (nothing kept).
+    max_tokens -= count_tokens(_TRUNCATION_MARKER.format(omitted=len(text.encode("utf-8"))))
+    file_cuts = [m.start() for m in _DIFF_FILE_BOUNDARY.finditer(text)][1:]
+    cut = _longest_fitting_prefix(text, file_cuts, max_tokens)
+    if not cut:
+        line_cuts = [m.end() for m in re.finditer(r"\n", text)]
+        cut = _longest_fitting_prefix(text, line_cuts, max_tokens)
+
+    omitted = len(text[cut:].encode("utf-8"))
+    return text[:cut].rstrip() + _TRUNCATION_MARKER.format(omitted=omitted)
+
+
+def _fit_diff(render: Callable[[str], str], diff: str, max_tokens: int | None) -> str:
+    """Render a prompt, shrinking ``diff`` to whatever the template leaves."""
+    if max_tokens is None:
+        return render(diff)
+    budget = max_tokens - count_tokens(render(""))
+    return render(_fit_to_budget(diff, max(budget, 0)))
+
+
+def review_pr_prompt(
+    diff: str,
+    rubric: str,
+    max_tokens: int | None = DEFAULT_PROMPT_TOKENS,
+) -> str:
     """Generate a prompt for reviewing a PR diff against a rubric.
 
     Args:
         diff: The git diff content to review.
         rubric: The review criteria and guidelines.
+        max_tokens: Token budget for the whole prompt. The diff is truncated
+            at a file boundary to fit; pass None to disable.
 
     Returns:
         A formatted prompt string for PR review.
     """
+    return _fit_diff(lambda d: _review_pr_template(d, rubric), diff, max_tokens)
+
+
+def _review_pr_template(diff: str, rubric: str) -> str:
     return f"""You are an expert code reviewer. Your task is to review a pull request diff against the provided rubric.
 
 ## Pull Request Diff
@@ -84,15 +172,24 @@ It is better to flag uncertainty than to approve problematic code or block good
 """
 
 
-def scrutinize_test_changes_prompt(test_diff: str) -> str:
+def scrutinize_test_changes_prompt(
+    test_diff: str,
+    max_tokens: int | None = DEFAULT_PROMPT_TOKENS,
+) -> str:
     """Generate a prompt to evaluate test quality and TDD compliance.
 
     Args:
         test_diff: The git diff of test file changes.
+        max_tokens: Token budget for the whole prompt. The diff is truncated
+            at a file boundary to fit; pass None to disable.
 
     Returns:
         A formatted prompt string for test review.
     """
+    return _fit_diff(_scrutinize_test_changes_template, test_diff, max_tokens)
+
+
+def _scrutinize_test_changes_template(test_diff: str) -> str:
     return f"""You are an expert test reviewer. Your task is to evaluate test changes for quality and TDD (Test-Driven Development) compliance.
 
 ## Test Diff
@@ -4,8 +4,32 @@ These prompts support task classification and decomposition. The classify
 prompt is a fallback for when pattern matching fails (P6) - most classification
 should happen in code. All prompts require reasoning first (P3) and allow
 uncertainty (P16).
+
+``DecompositionCache`` lets callers reuse a prior decomposition for tasks
+that share the same structure and differ only in file paths, issue/PR
+references, or backticked identifiers (P5: deterministic infrastructure).
 """
 
+import re
+
+# File paths, issue/PR references (#42), and `code` spans are treated as
+# task variables; everything else forms the task's structural skeleton. A
+# path needs a directory part or a known file extension, so prose such as
+# "e.g." and attribute access like "self.settings" stay in the skeleton.
+# Bare numbers stay too: in a decomposition they are mostly step numbers,
+# which substitution would rewrite.
+_FILE_EXTENSIONS = (
+    "py|pyi|ipynb|md|rst|txt|toml|cfg|ini|json|jsonl|ya?ml|lock|sh|js|jsx|ts|tsx"
+    "|css|html|sql|go|rs|c|h|cc|cpp|hpp|java|rb"
+)
+_VARIABLE_PATTERN = re.compile(
+    r"`[^`\n]+`"
+    r"|#\d+"
+    r"|(?<![\w./\-])(?:[\w.\-]+/)+[\w\-]+(?:\.[\w\-]+)*\.[A-Za-z]\w*\b"
+    rf"|(?<![\w./\-])[\w\-]+(?:\.[\w\-]+)*\.(?:{_FILE_EXTENSIONS})\b(?![./\-]?\w)"
+)
+_PLACEHOLDER_PATTERN = re.compile(r"<VAR_(\d+)>")
+
 
 def classify_task_prompt(task_description: str) -> str:
     """Generate a prompt to classify an ambiguous task.
@@ -137,3 +161,88 @@ It is better to acknowledge "This subtask may need further breakdown once X is c
 ### Execution Order
 [Suggested order or parallel execution groups]
 """
+
+
+def task_skeleton(task_description: str) -> tuple[str, list[str]]:
+    """Split a task description into a structural skeleton and its variables.
+
+    Each distinct variable (file path, ``#N`` reference, or backticked
+    identifier) is replaced with a numbered ``<VAR_n>`` placeholder in order
+    of first appearance, so structurally identical tasks share a skeleton.
+
+    Args:
+        task_description: The task description to normalize.
+
+    Returns:
+        A (skeleton, variables) tuple where ``variables[n - 1]`` is the value
+        replaced by ``<VAR_n>``.
+    """
+    variables: list[str] = []
+
+    def _replace(match: re.Match[str]) -> str:
+        value = match.group(0)
+        if value not in variables:
+            variables.append(value)
+        return f"<VAR_{variables.index(value) + 1}>"
+
+    skeleton = _VARIABLE_PATTERN.sub(_replace, " ".join(task_description.split()))
+    return skeleton, variables
+
+
+class DecompositionCache:
+    """In-process cache of task decompositions keyed by task skeleton.
+
+    Store an LLM decomposition with ``put``; a later ``get`` for a task with
+    the same skeleton returns that decomposition with the new task's
+    variables substituted in, skipping the ``decompose_task_prompt`` round
+    trip. Returns None on a miss so the caller falls back to the LLM.
+    """
+
+    def __init__(self) -> None:
+        self._templates: dict[str, str] = {}
+
+    def __len__(self) -> int:
+        return len(self._templates)
+
+    def get(self, task_description: str) -> str | None:
+        """Return a cached decomposition adapted to this task, or None."""
+        skeleton, variables = task_skeleton(task_description)
+        template = self._templates.get(skeleton)
+        if template is None:
+            return None
+
+        def _fill(match: re.Match[str]) -> str:
+            index = int(match.group(1)) - 1
+            return variables[index] if index < len(variables) else match.group(0)
+
+        return _PLACEHOLDER_PATTERN.sub(_fill, template)
+
+    def put(self, task_description: str, decomposition: str) -> None:
+        """Cache a decomposition under the task's skeleton.
+
+        Each of the task's variables is replaced with its placeholder wherever
+        it appears as a whole token in the decomposition, including inside a
+        longer path (``a.py`` in ``tests/a.py``). Longer values go first so a
+        shorter one never splits them. A decomposition still naming other
+        paths, references, or code spans, or the bare identifier of a code
+        span, is not cached: those may be derived from this task's variables
+        (a ``bar.py`` for ``foo.py``) and would be wrong for the next task.
+        """
+        skeleton, variables = task_skeleton(task_description)
+        template = decomposition
+        for index in sorted(range(len(variables)), key=lambda i: -len(variables[i])):
+            token = re.compile(rf"(?<![\w.\-]){re.escape(variables[index])}(?![\w\-])")
+            template = token.sub(f"<VAR_{index + 1}>", template)
+
+        if _VARIABLE_PATTERN.search(template):
+            return
+        for value in variables:
+            if value.startswith("`") and re.search(
+                rf"\b{re.escape(value.strip('`'))}\b", template
+            ):
+                return
+        self._templates[skeleton] = template
+
+    def clear(self) -> None:
+        """Drop all cached decompositions."""
+        self._templates.clear()
@@ -9,10 +9,15 @@ Prompts). No AI is involved in the deployment pipeline.
 
 from __future__ import annotations
 
+import functools
 import json
+import os
 import subprocess
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from datetime import datetime
+from functools import cached_property
 from typing import Optional
 
 
@@ -34,11 +39,43 @@ class RemoteInstance:
     pr: Optional[int] = None
     metadata: dict[str, str] = field(default_factory=dict)
 
+    @cached_property
+    def created_at_dt(self) -> datetime | None:
+        """``created_at`` parsed to a datetime on first access, or None if unparseable."""
+        try:
+            # fromisoformat only accepts a "Z" suffix from Python 3.11 on
+            return datetime.fromisoformat(self.created_at.replace("Z", "+00:00"))  # noqa: FURB162
+        except ValueError:
+            return None
+
 
 # ---------------------------------------------------------------------------
 # GCP interaction layer
 # ---------------------------------------------------------------------------
 
+_METADATA_TPL = (
+    "task={task},repo={repo},branch={branch},"
+    "timeout_hours={timeout_hours},deploy_mode={deploy_mode}"
+)
+
+
+# gcloud otherwise spends part of every invocation checking for component
+# updates; these calls are non-interactive, so prompts are disabled too.
+_GCLOUD_ENV_OVERRIDES = {
+    "CLOUDSDK_COMPONENT_MANAGER_DISABLE_UPDATE_CHECK": "1",
+    "CLOUDSDK_CORE_DISABLE_PROMPTS": "1",
+}
+
+
+# Labels applied by the instance template; selects agent task instances only.
+_INSTANCE_FILTER = "labels.app=agents AND labels.component=remote-task"
+_LIST_INSTANCES_ARGS = (
+    "compute", "instances", "list",
+    "--filter", _INSTANCE_FILTER,
+    "--format=json",
+)
+
+
 def _run_gcloud(*args: str, check: bool = False) -> subprocess.CompletedProcess[str]:
     """Run a gcloud command and return the result."""
     cmd = ["gcloud", *args]
@@ -47,6 +84,7 @@ def _run_gcloud(*args: str, check: bool = False) -> subprocess.CompletedProcess[
         capture_output=True,
         text=True,
         check=check,
+        env={**os.environ, **_GCLOUD_ENV_OVERRIDES},
     )
 
 
@@ -86,24 +124,24 @@ def launch_instance(
     """
     name = _instance_name(task, issue, pr)
 
-    metadata_items = [
-        f"task={task}",
-        f"repo={repo}",
-        f"branch={branch}",
-        f"timeout_hours={timeout_hours}",
-        f"deploy_mode={'true' if deploy_mode else 'false'}",
-    ]
+    metadata = _METADATA_TPL.format_map({
+        "task": task,
+        "repo": repo,
+        "branch": branch,
+        "timeout_hours": timeout_hours,
+        "deploy_mode": "true" if deploy_mode else "false",
+    })
     if issue:
-        metadata_items.append(f"issue={issue}")
+        metadata += f",issue={issue}"
     if pr:
-        metadata_items.append(f"pr={pr}")
+        metadata += f",pr={pr}"
 
     cmd_args = [
         "compute", "instances", "create", name,
         "--source-instance-template", template,
         "--zone", zone,
         "--machine-type", machine_type,
-        "--metadata", ",".join(metadata_items),
+        "--metadata", metadata,
     ]
     if project:
         cmd_args.extend(["--project", project])
@@ -143,11 +181,7 @@ def list_instances(
     project: str | None = None,
 ) -> list[RemoteInstance]:
     """List all running agent task instances."""
-    cmd_args = [
-        "compute", "instances", "list",
-        "--filter", "labels.app=agents AND labels.component=remote-task",
-        "--format=json",
-    ]
+    cmd_args = list(_LIST_INSTANCES_ARGS)
     if project:
         cmd_args.extend(["--project", project])
 
@@ -190,6 +224,19 @@ def list_instances(
     return instances
 
 
+def list_instances_multi(projects: list[str]) -> list[RemoteInstance]:
+    """List agent task instances across several GCP projects.
+
+    Each project is queried on its own thread since the gcloud calls are
+    I/O-bound; results are concatenated in the order of ``projects``.
+    """
+    if not projects:
+        return []
+    with ThreadPoolExecutor(max_workers=min(32, len(projects))) as pool:
+        per_project = list(pool.map(lambda p: list_instances(project=p), projects))
+    return [inst for instances in per_project for inst in instances]
+
+
 def stream_logs(
     instance: str,
     *,
@@ -246,8 +293,13 @@ def stop_instance(
     }
 
 
+@functools.lru_cache(maxsize=1)
 def get_repo_url() -> str:
-    """Detect the current repo's remote URL."""
+    """Detect the current repo's remote URL.
+
+    Cached for the lifetime of the process; call ``refresh_git_context()``
+    to pick up a changed remote.
+    """
     result = subprocess.run(
         ["git", "remote", "get-url", "origin"],
         capture_output=True,
@@ -258,8 +310,13 @@ def get_repo_url() -> str:
     return ""
 
 
+@functools.lru_cache(maxsize=1)
 def get_current_branch() -> str:
-    """Detect the current git branch."""
+    """Detect the current git branch.
+
+    Cached for the lifetime of the process; call ``refresh_git_context()``
+    after switching branches.
+    """
     result = subprocess.run(
         ["git", "branch", "--show-current"],
         capture_output=True,
@@ -268,3 +325,9 @@ def get_current_branch() -> str:
     if result.returncode == 0:
         return result.stdout.strip()
     return "main"
+
+
+def refresh_git_context() -> None:
+    """Clear the cached repo URL and branch so the next call re-reads git."""
+    get_repo_url.cache_clear()
+    get_current_branch.cache_clear()
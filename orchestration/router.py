@@ -2,9 +2,16 @@
 
 This module implements deterministic pattern matching for task classification (P6).
 The router does one thing well: map task descriptions to agent sequences (P8).
+
+When the optional ``hyperscan`` package is installed, classification scans
+all patterns in a single pass; otherwise it falls back to Python's ``re``.
 """
 
+import functools
+import itertools
 import re
+import sys
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any
@@ -34,61 +41,69 @@ class TaskType(Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RoutingDecision:
     """Represents a routing decision for a task.
 
     Attributes:
         task_type: The classified type of the task.
-        agent_sequence: Ordered list of agents to execute the task.
+        agent_sequence: Ordered agents to execute the task. Shared with
+            ROUTING_TABLE; copy with list() before mutating.
         priority: Priority level (high, medium, low).
         context: Extracted context from the task description.
     """
 
     task_type: TaskType
-    agent_sequence: list[str]
+    agent_sequence: Sequence[str]
     priority: str
     context: dict[str, Any] = field(default_factory=dict)
 
 
 # Deterministic routing table mapping TaskType to agent sequence (P5)
+# Sequences are tuples so route() can hand out the shared table entry.
 # TDD enforcement: features/bugs get performance-engineer first for tests
-ROUTING_TABLE: dict[TaskType, list[str]] = {
+ROUTING_TABLE: dict[TaskType, tuple[str, ...]] = {
     # Features get architect review, then orchestrator routes to specialized engineers
-    TaskType.FEATURE: ["architect", "performance-engineer", "orchestrator"],
+    TaskType.FEATURE: ("architect", "performance-engineer", "orchestrator"),
     # Bug fixes: performance engineer writes regression test, orchestrator picks engineer
-    TaskType.BUG_FIX: ["performance-engineer", "orchestrator", "reviewer"],
+    TaskType.BUG_FIX: ("performance-engineer", "orchestrator", "reviewer"),
     # Infrastructure: architect designs, infrastructure engineer implements
-    TaskType.INFRASTRUCTURE: ["architect", "infrastructure-engineer", "reviewer"],
+    TaskType.INFRASTRUCTURE: ("architect", "infrastructure-engineer", "reviewer"),
     # Design tasks go to designer
-    TaskType.DESIGN: ["designer"],
+    TaskType.DESIGN: ("designer",),
     # Architecture tasks go to architect
-    TaskType.ARCHITECTURE: ["architect"],
+    TaskType.ARCHITECTURE: ("architect",),
     # Backend-specific tasks
-    TaskType.BACKEND: ["performance-engineer", "backend-engineer", "reviewer"],
+    TaskType.BACKEND: ("performance-engineer", "backend-engineer", "reviewer"),
     # Frontend-specific tasks
-    TaskType.FRONTEND: ["performance-engineer", "frontend-engineer", "reviewer"],
+    TaskType.FRONTEND: ("performance-engineer", "frontend-engineer", "reviewer"),
     # ML tasks
-    TaskType.ML: ["ml-engineer", "performance-engineer", "reviewer"],
+    TaskType.ML: ("ml-engineer", "performance-engineer", "reviewer"),
     # Integration tasks
-    TaskType.INTEGRATION: ["integration-engineer", "reviewer"],
+    TaskType.INTEGRATION: ("integration-engineer", "reviewer"),
     # Performance optimization
-    TaskType.PERFORMANCE: ["performance-engineer", "orchestrator"],
+    TaskType.PERFORMANCE: ("performance-engineer", "orchestrator"),
     # Project management
-    TaskType.PROJECT_MANAGEMENT: ["project-manager"],
+    TaskType.PROJECT_MANAGEMENT: ("project-manager",),
     # Review tasks
-    TaskType.REVIEW: ["reviewer"],
+    TaskType.REVIEW: ("reviewer",),
     # Docs (architect ensures API docs are complete)
-    TaskType.DOCS: ["architect"],
+    TaskType.DOCS: ("architect",),
     # Unity Space Sim project-specific agents
-    TaskType.UNITY_ASSET_DESIGN: ["unity-asset-designer"],
-    TaskType.BLENDER_SCRIPTING: ["blender-engineer", "gamedev-integration-engineer"],
-    TaskType.UNITY_SCRIPTING: ["unity-engineer", "gamedev-integration-engineer"],
-    TaskType.GAMEDEV_INTEGRATION: ["gamedev-integration-engineer"],
+    TaskType.UNITY_ASSET_DESIGN: ("unity-asset-designer",),
+    TaskType.BLENDER_SCRIPTING: ("blender-engineer", "gamedev-integration-engineer"),
+    TaskType.UNITY_SCRIPTING: ("unity-engineer", "gamedev-integration-engineer"),
+    TaskType.GAMEDEV_INTEGRATION: ("gamedev-integration-engineer",),
     # Unknown routes to orchestrator
-    TaskType.UNKNOWN: ["orchestrator"],
+    TaskType.UNKNOWN: ("orchestrator",),
 }
 
+# Intern agent names so every sequence shares one string object per agent and
+# lookups keyed by agent name elsewhere can short-circuit on identity.
+for _task_type, _sequence in ROUTING_TABLE.items():
+    ROUTING_TABLE[_task_type] = tuple(sys.intern(name) for name in _sequence)
+del _task_type, _sequence
+
 # Priority mapping by task type
 PRIORITY_TABLE: dict[TaskType, str] = {
     TaskType.FEATURE: "medium",
@@ -112,6 +127,14 @@ PRIORITY_TABLE: dict[TaskType, str] = {
     TaskType.UNKNOWN: "low",
 }
 
+# (agent sequence, priority) per task type, so route() resolves both with a
+# single lookup. Enum members hash through a Python-level __hash__, so each
+# dict lookup keyed by TaskType costs a function call.
+_ROUTES: dict[TaskType, tuple[tuple[str, ...], str]] = {
+    task_type: (ROUTING_TABLE[task_type], PRIORITY_TABLE[task_type])
+    for task_type in TaskType
+}
+
 # Classification patterns - ordered by specificity (most specific first)
 # Pattern matching handles known task types (P6: Code Before Prompts)
 CLASSIFICATION_PATTERNS: list[tuple[TaskType, re.Pattern]] = [
@@ -217,11 +240,164 @@ CLASSIFICATION_PATTERNS: list[tuple[TaskType, re.Pattern]] = [
     (TaskType.FEATURE, re.compile(r"\bimplement\b", re.IGNORECASE)),
 ]
 
-# Pattern for extracting file paths from task descriptions
-FILE_PATH_PATTERN = re.compile(r"[\w./\-]+\.(?:py|js|ts|json|yaml|yml|md|txt|sh|cs|fbx|blend)")
+# Matches patterns that are a single bounded keyword, e.g. \bdeploy\b or
+# \bdocs?\b (an optional plural "s").
+_KEYWORD_PATTERN = re.compile(r"\\b(\w+?)(s\?)?\\b")
+
+# Splits a description into maximal word-character runs. A keyword pattern
+# \bword\b matches exactly when one of these tokens equals the keyword.
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+# Non-ASCII letters that re.IGNORECASE treats as equal to an ASCII letter but
+# str.lower() does not map onto one (U+212A KELVIN SIGN already lowers to "k").
+_IGNORECASE_ASCII_FOLDS = str.maketrans({"\u0130": "i", "\u0131": "i", "\u017f": "s"})
+
+
+# A backslash escape, or a run of characters without one, in a pattern source
+_SOURCE_PIECE_PATTERN = re.compile(r"(\\.)|[^\\]+", re.DOTALL)
+
+
+def _lowercase_literals(source: str) -> str:
+    """Lowercase a pattern source outside its escapes.
+
+    Lowercasing an escape would flip its meaning (\\S to \\s, \\B to \\b),
+    so escapes are kept as written.
+    """
+    return _SOURCE_PIECE_PATTERN.sub(lambda m: m.group(1) or m.group(0).lower(), source)
+
+
+def _compile_run(patterns: list[re.Pattern]) -> tuple[frozenset[str], re.Pattern | None]:
+    """Split a run of patterns into a keyword set and one residual regex."""
+    keywords: set[str] = set()
+    residual: list[str] = []
+    for pattern in patterns:
+        match = _KEYWORD_PATTERN.fullmatch(pattern.pattern)
+        if match:
+            keywords.add(match.group(1).lower())
+            if match.group(2):
+                keywords.add(match.group(1).lower() + "s")
+        else:
+            residual.append(f"(?:{_lowercase_literals(pattern.pattern)})")
+    return (
+        frozenset(keywords),
+        re.compile("|".join(residual)) if residual else None,
+    )
+
+
+# CLASSIFICATION_PATTERNS grouped into runs of consecutive patterns with the
+# same TaskType. Single-keyword patterns in a run become a word set checked
+# against the tokenized description; the rest are fused into one regex. Runs
+# keep list order, so priority is unchanged. Both are matched against the
+# description lowercased once, so the residual regexes are compiled from
+# lowercased literals without re.IGNORECASE.
+_CLASSIFICATION_RUNS: tuple[tuple[TaskType, frozenset[str], re.Pattern | None], ...] = tuple(
+    (task_type, *_compile_run([p for _, p in run]))
+    for task_type, run in itertools.groupby(CLASSIFICATION_PATTERNS, key=lambda tp: tp[0])
+)
+
+# CLASSIFICATION_PATTERNS split into parallel tuples. Hyperscan reports
+# matches by pattern index, which then maps straight to its TaskType.
+_PATTERN_TYPES: tuple[TaskType, ...] = tuple(t for t, _ in CLASSIFICATION_PATTERNS)
+_PATTERN_SOURCES: tuple[str, ...] = tuple(p.pattern for _, p in CLASSIFICATION_PATTERNS)
+
+
+# ASCII separators U+001C-U+001F that Python's \s matches and Hyperscan's
+# does not.
+_HYPERSCAN_UNMATCHED_SPACE = re.compile(r"[\x1c-\x1f]")
+
+
+def _hyperscan_compatible(text: str) -> bool:
+    """Whether a Hyperscan scan of ``text`` agrees with the ``re`` patterns.
+
+    Hyperscan's ``\\b``, ``\\w`` and ``\\s`` are ASCII-only, and its ``\\s``
+    also leaves out the information separators U+001C-U+001F.
+    """
+    return text.isascii() and _HYPERSCAN_UNMATCHED_SPACE.search(text) is None
+
+
+@functools.lru_cache(maxsize=1)
+def _hyperscan_database() -> Any:
+    """Compile CLASSIFICATION_PATTERNS into a Hyperscan database, if available.
+
+    Pattern ids are list indices, so the lowest id reported by a scan is the
+    pattern a list-order search would have matched first. Callers only scan
+    input that passes ``_hyperscan_compatible``.
+    Returns None when hyperscan is not installed or rejects a pattern.
+    """
+    try:
+        import hyperscan
+    except ImportError:
+        return None
+
+    flags = hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH
+    database = hyperscan.Database()
+    try:
+        database.compile(
+            expressions=[source.encode() for source in _PATTERN_SOURCES],
+            ids=list(range(len(_PATTERN_SOURCES))),
+            elements=len(_PATTERN_SOURCES),
+            flags=[flags] * len(_PATTERN_SOURCES),
+        )
+    except hyperscan.error:
+        return None
+    return database
+
+
+# Pattern for extracting file paths from task descriptions. The lookbehind
+# only starts a match at the beginning of a run of path characters; a match
+# starting mid-run would also match from the run start, so results are the
+# same, but a long run with no extension is scanned once instead of once per
+# character.
+FILE_PATH_PATTERN = re.compile(
+    r"(?<![\w./\-])[\w./\-]+\.(?:py|js|ts|json|yaml|yml|md|txt|sh|cs|fbx|blend)"
+)
+
+# Path prefix identifying the Unity Space Sim project
+UNITY_SPACE_SIM_PREFIX = "projects/unity-space-sim/"
+
+# Static path routes inside the Unity Space Sim project, keyed by the
+# directory directly under UNITY_SPACE_SIM_PREFIX:
+# directory -> (file extension, TaskType)
+UNITY_SPACE_SIM_PATH_ROUTES: dict[str, tuple[str, TaskType]] = {
+    "blender": (".py", TaskType.BLENDER_SCRIPTING),
+    "unity": (".cs", TaskType.UNITY_SCRIPTING),
+}
+
 
-# Pattern for detecting Unity Space Sim project paths
-UNITY_SPACE_SIM_PATH_PATTERN = re.compile(r"projects/unity-space-sim/")
+@functools.lru_cache(maxsize=4096)
+def _classify(task_description: str) -> TaskType:
+    """Classify a task description; memoized since the result is pure.
+
+    Identical descriptions recur across retries, replays, and watch-mode
+    polling, so repeated lookups skip the pattern scan entirely.
+    """
+    if not task_description or task_description.isspace():
+        return TaskType.UNKNOWN
+
+    database = _hyperscan_database() if _hyperscan_compatible(task_description) else None
+    if database is not None:
+        matched: list[int] = []
+        database.scan(
+            task_description.encode(),
+            match_event_handler=lambda pattern_id, *_: matched.append(pattern_id),
+        )
+        if matched:
+            return _PATTERN_TYPES[min(matched)]
+        return TaskType.UNKNOWN
+
+    folded = task_description if task_description.isascii() else (
+        task_description.translate(_IGNORECASE_ASCII_FOLDS)
+    )
+    desc_lower = folded.lower()
+    tokens = set(_TOKEN_PATTERN.findall(desc_lower))
+    for task_type, keywords, residual in _CLASSIFICATION_RUNS:
+        if not keywords.isdisjoint(tokens) or (
+            residual is not None and residual.search(desc_lower)
+        ):
+            return task_type
+
+    # Permission to fail (P16): unknown is a valid classification
+    return TaskType.UNKNOWN
 
 
 class TaskRouter:
@@ -236,6 +412,7 @@ class TaskRouter:
 
         Uses pattern matching (regex/keywords) for classification.
         This is deterministic code, not AI (P6: Code Before Prompts).
+        Results are memoized per description (LRU, 4096 entries).
 
         Args:
             task_description: The task description to classify.
@@ -243,15 +420,7 @@ class TaskRouter:
         Returns:
             The classified TaskType. Returns UNKNOWN for ambiguous input (P16).
         """
-        if not task_description or not task_description.strip():
-            return TaskType.UNKNOWN
-
-        for task_type, pattern in CLASSIFICATION_PATTERNS:
-            if pattern.search(task_description):
-                return task_type
-
-        # Permission to fail (P16): unknown is a valid classification
-        return TaskType.UNKNOWN
+        return _classify(task_description)
 
     def route(self, task_description: str) -> RoutingDecision:
         """Route a task to the appropriate agent sequence.
@@ -264,16 +433,16 @@ class TaskRouter:
             priority, and extracted context.
         """
         context = self._extract_context(task_description)
-        task_type = self.classify(task_description)
 
-        # Override task type based on file path context (monorepo routing)
+        # File path context overrides classification (monorepo routing), so
+        # only classify when no path pins the task type
+        task_type: TaskType | None = None
         if context.get("project") == "unity-space-sim":
-            task_type = self._detect_unity_space_sim_task_type(
-                task_description, context, task_type
-            )
+            task_type = self._detect_unity_space_sim_task_type(context)
+        if task_type is None:
+            task_type = self.classify(task_description)
 
-        agent_sequence = ROUTING_TABLE[task_type].copy()
-        priority = PRIORITY_TABLE[task_type]
+        agent_sequence, priority = _ROUTES[task_type]
 
         return RoutingDecision(
             task_type=task_type,
@@ -299,45 +468,33 @@ class TaskRouter:
             context["files"] = files
 
         # Detect Unity Space Sim project context from file paths
-        if UNITY_SPACE_SIM_PATH_PATTERN.search(task_description):
+        if UNITY_SPACE_SIM_PREFIX in task_description:
             context["project"] = "unity-space-sim"
 
         return context
 
     def _detect_unity_space_sim_task_type(
-        self,
-        task_description: str,
-        context: dict[str, Any],
-        fallback_type: TaskType,
-    ) -> TaskType:
-        """Detect specific Unity Space Sim task type based on file paths and keywords.
+        self, context: dict[str, Any]
+    ) -> TaskType | None:
+        """Detect a Unity Space Sim task type from file paths.
 
         Args:
-            task_description: The task description.
             context: Extracted context (files, project).
-            fallback_type: The default task type from classification.
 
         Returns:
-            A Unity Space Sim specific TaskType if detected, otherwise fallback_type.
+            The TaskType for the first file under a routed project directory,
+            or None if no file path determines the task type.
         """
         files = context.get("files", [])
 
         # Path-based routing for Unity Space Sim
         for file_path in files:
-            if "projects/unity-space-sim/blender/" in file_path and file_path.endswith(".py"):
-                return TaskType.BLENDER_SCRIPTING
-            if "projects/unity-space-sim/unity/" in file_path and file_path.endswith(".cs"):
-                return TaskType.UNITY_SCRIPTING
-
-        # If already classified as Unity Space Sim type, keep it
-        if fallback_type in (
-            TaskType.UNITY_ASSET_DESIGN,
-            TaskType.BLENDER_SCRIPTING,
-            TaskType.UNITY_SCRIPTING,
-            TaskType.GAMEDEV_INTEGRATION,
-        ):
-            return fallback_type
-
-        # Default Unity Space Sim routing based on general classification
-        # If no specific Unity type was detected but we're in the project, use fallback
-        return fallback_type
+            # Each occurrence of the prefix is followed by the directory to route on
+            for rest in file_path.split(UNITY_SPACE_SIM_PREFIX)[1:]:
+                directory, slash, _ = rest.partition("/")
+                route = UNITY_SPACE_SIM_PATH_ROUTES.get(directory) if slash else None
+                if route is not None and file_path.endswith(route[0]):
+                    return route[1]
+
+        # No path match: the general classification stands
+        return None
@@ -4,11 +4,11 @@ This module provides the EvaluationCriterion dataclass and exports
 rubric definitions for different evaluation contexts.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Tuple
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, frozen=True)
 class EvaluationCriterion:
     """A single evaluation criterion within a rubric.
 
@@ -17,22 +17,20 @@ class EvaluationCriterion:
         description: Detailed explanation of what this criterion measures
         scale: Tuple of (min_score, max_score) for this criterion
         weight: Multiplier applied to raw score (default 1.0)
+        max_score: Maximum possible score (scale max * weight), computed once
+        min_score: Minimum possible score (scale min * weight), computed once
     """
 
     name: str
     description: str
     scale: Tuple[int, int]
     weight: float = 1.0
+    max_score: float = field(init=False, repr=False, compare=False)
+    min_score: float = field(init=False, repr=False, compare=False)
 
-    @property
-    def max_score(self) -> float:
-        """Maximum possible score for this criterion (scale max * weight)."""
-        return self.scale[1] * self.weight
-
-    @property
-    def min_score(self) -> float:
-        """Minimum possible score for this criterion (scale min * weight)."""
-        return self.scale[0] * self.weight
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "max_score", self.scale[1] * self.weight)
+        object.__setattr__(self, "min_score", self.scale[0] * self.weight)
 
 
 from orchestration.rubrics.code_review import CODE_REVIEW_RUBRIC  # noqa: E402
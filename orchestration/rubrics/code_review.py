@@ -5,8 +5,6 @@ Each criterion is scored on a 0-2 scale and weighted to produce
 a maximum total score of 10.
 """
 
-from typing import List
-
 from orchestration.rubrics import EvaluationCriterion
 
 
@@ -71,10 +69,10 @@ _TEST_QUALITY = EvaluationCriterion(
 )
 
 
-CODE_REVIEW_RUBRIC: List[EvaluationCriterion] = [
+CODE_REVIEW_RUBRIC: tuple[EvaluationCriterion, ...] = (
     _CORRECTNESS,
     _COMPLETENESS,
     _CODE_QUALITY,
     _SECURITY,
     _TEST_QUALITY,
-]
+)
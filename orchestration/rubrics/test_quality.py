@@ -4,8 +4,6 @@ This rubric defines criteria for evaluating test suites.
 Each criterion is scored on a 0-2 scale.
 """
 
-from typing import List
-
 from orchestration.rubrics import EvaluationCriterion
 
 
@@ -70,10 +68,10 @@ _ISOLATION = EvaluationCriterion(
 )
 
 
-TEST_QUALITY_RUBRIC: List[EvaluationCriterion] = [
+TEST_QUALITY_RUBRIC: tuple[EvaluationCriterion, ...] = (
     _COVERAGE,
     _EDGE_CASES,
     _ERROR_HANDLING,
     _NAMING,
     _ISOLATION,
-]
+)
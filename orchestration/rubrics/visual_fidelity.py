@@ -8,8 +8,6 @@ Used by the visual validation tool to gate asset quality in the
 Blender-to-Unity asset pipeline.
 """
 
-from typing import List
-
 from orchestration.rubrics import EvaluationCriterion
 
 
@@ -75,10 +73,10 @@ _OVERALL_IMPRESSION = EvaluationCriterion(
 )
 
 
-VISUAL_FIDELITY_RUBRIC: List[EvaluationCriterion] = [
+VISUAL_FIDELITY_RUBRIC: tuple[EvaluationCriterion, ...] = (
     _SILHOUETTE_MATCH,
     _PROPORTIONS,
     _COMPONENT_COUNT,
     _MATERIAL_FIDELITY,
     _OVERALL_IMPRESSION,
-]
+)
@@ -5,6 +5,12 @@ unresolved GitHub comments, classifies intent via deterministic pattern matching
 (with optional LLM fallback), dispatches to action handlers, and persists sync
 history.
 
+Optional packages: with ``httpx`` installed, GitHub reads share one persistent
+API connection instead of starting a ``gh`` process each; with ``hyperscan``
+installed, a comment is checked against every intent pattern in one scan;
+with ``orjson`` installed, sync history lines are encoded and parsed by it;
+with ``pyahocorasick`` installed, the intent keyword prefilter is one pass.
+
 Design Principles:
 - P5 Deterministic Infrastructure: Pattern matching first, LLM only as fallback.
 - P6 Code Before Prompts: ``gh`` CLI for all GitHub interactions.
@@ -15,15 +21,29 @@ Design Principles:
 
 from __future__ import annotations
 
+import contextlib
+import functools
+import hashlib
 import json
 import os
 import re
+import sqlite3
 import subprocess
+import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
-from typing import Callable, Optional
+from typing import Any, BinaryIO, Callable, ClassVar, Optional
+
+from orchestration.cost import _HEAD_BYTES, _head_hash
+from orchestration.router import _IGNORECASE_ASCII_FOLDS, _hyperscan_compatible
+
+try:
+    import orjson
+except ImportError:  # optional; SyncHistory falls back to json
+    orjson = None
 
 
 # ---------------------------------------------------------------------------
@@ -46,7 +66,7 @@ class CommentIntent(Enum):
         return self.value
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GitHubComment:
     """A GitHub comment from an issue or PR."""
 
@@ -61,7 +81,7 @@ class GitHubComment:
     line: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ClassifiedComment:
     """A comment with its classified intent."""
 
@@ -71,7 +91,7 @@ class ClassifiedComment:
     pattern_matched: bool
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ActionResult:
     """Result of executing an action for a comment."""
 
@@ -82,7 +102,7 @@ class ActionResult:
     error: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SyncRun:
     """Record of a single sync invocation."""
 
@@ -96,6 +116,22 @@ class SyncRun:
 # ---------------------------------------------------------------------------
 
 
+# Upper bound on concurrent gh subprocesses when fetching items one by one;
+# keeps bursts well inside GitHub's secondary rate limits.
+_GH_MAX_WORKERS = 10
+
+
+def _loads(data: bytes | str) -> Any:
+    """Parse JSON with orjson when installed; raises ``json.JSONDecodeError`` when malformed."""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson rejects lone surrogate escapes that json.dumps writes
+            pass
+    return json.loads(data)
+
+
 def _run_gh(*args: str) -> tuple[int, str, str]:
     """Run a ``gh`` CLI command and return (returncode, stdout, stderr)."""
     result = subprocess.run(
@@ -106,179 +142,533 @@ def _run_gh(*args: str) -> tuple[int, str, str]:
     return result.returncode, result.stdout.strip(), result.stderr.strip()
 
 
+_GITHUB_API_URL = "https://api.github.com"
+
+# Largest page the REST API serves; a shorter page is the last one.
+_REST_PAGE_SIZE = 100
+
+
+class _GitHubClient:
+    """Read-only GitHub API client over one persistent connection.
+
+    Every ``gh`` call starts a process, reloads its config and opens a new TLS
+    connection. Reads go through a single ``httpx.Client`` instead (HTTP/2
+    when ``h2`` is installed). Mutations stay on ``_run_gh`` (P10).
+    """
+
+    def __init__(self, token: str) -> None:
+        import httpx
+
+        options = {
+            "base_url": _GITHUB_API_URL,
+            "headers": {
+                "Authorization": f"Bearer {token}",
+                "Accept": "application/vnd.github+json",
+            },
+            "timeout": 30.0,
+        }
+        try:
+            self._client = httpx.Client(http2=True, **options)
+        except ImportError:  # h2 not installed
+            self._client = httpx.Client(**options)
+        self._http_error = httpx.HTTPError
+
+    def graphql(self, query: str, variables: dict[str, str | int]) -> dict | None:
+        """POST a GraphQL query; returns the decoded response or None on failure."""
+        try:
+            response = self._client.post(
+                "/graphql", json={"query": query, "variables": variables}
+            )
+        except self._http_error:
+            return None
+        if response.status_code != 200:
+            return None
+        try:
+            # Parse the raw bytes; response.json() would decode to str first
+            return _loads(response.content)
+        except ValueError:
+            return None
+
+    def get(self, path: str, etag: str | None = None) -> tuple[int, dict[str, str], str] | None:
+        """GET a REST path; returns (status, lowercased headers, body) or None."""
+        headers = {"If-None-Match": etag} if etag else {}
+        try:
+            response = self._client.get(f"/{path}", headers=headers)
+        except self._http_error:
+            return None
+        return (
+            response.status_code,
+            {name.lower(): value for name, value in response.headers.items()},
+            response.text,
+        )
+
+
+@functools.lru_cache(maxsize=1)
+def _github_client() -> _GitHubClient | None:
+    """Shared API client, or None when httpx or a token is unavailable.
+
+    The token comes from ``GH_TOKEN``/``GITHUB_TOKEN`` or, failing that, one
+    ``gh auth token`` call. Enterprise hosts (``GH_HOST``) keep using ``gh``.
+    """
+    try:
+        import httpx  # noqa: F401
+    except ImportError:
+        return None
+    if os.environ.get("GH_HOST", "github.com") != "github.com":
+        return None
+
+    token = os.environ.get("GH_TOKEN") or os.environ.get("GITHUB_TOKEN")
+    if not token:
+        rc, out, _ = _run_gh("auth", "token")
+        if rc != 0 or not out:
+            return None
+        token = out
+    return _GitHubClient(token)
+
+
+def _graphql(query: str, variables: dict[str, str | int]) -> dict | None:
+    """Run a GraphQL query via the shared client, or ``gh api graphql`` without one."""
+    client = _github_client()
+    if client is not None:
+        return client.graphql(query, variables)
+
+    args = ["api", "graphql", "-f", f"query={query}"]
+    for name, value in variables.items():
+        # -F sends typed values (Int), -f sends strings
+        args.extend(["-F" if isinstance(value, int) else "-f", f"{name}={value}"])
+    rc, out, _ = _run_gh(*args)
+    if rc != 0:
+        return None
+    try:
+        return _loads(out)
+    except json.JSONDecodeError:
+        return None
+
+
+# Review threads of one PR, for fetch_pr_review_threads.
+_REVIEW_THREADS_QUERY = """
+query($owner: String!, $repo: String!, $pr: Int!) {
+  repository(owner: $owner, name: $repo) {
+    pullRequest(number: $pr) {
+      reviewThreads(first: 100) {
+        nodes {
+          id
+          isResolved
+          comments(first: 10) {
+            nodes {
+              id
+              body
+              author { login }
+              createdAt
+              path
+              line
+            }
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+
+# Open PRs/issues with their comments, one page of 50 per ``gh`` call. The
+# nested connections mirror what fetch_pr_comments, fetch_pr_review_threads
+# and fetch_issue_comments return for a single item.
+_OPEN_PULL_REQUESTS_QUERY = """
+query($owner: String!, $repo: String!, $cursor: String) {
+  repository(owner: $owner, name: $repo) {
+    pullRequests(states: OPEN, first: 50, after: $cursor) {
+      pageInfo { hasNextPage endCursor }
+      nodes {
+        number
+        comments(first: 100) {
+          pageInfo { hasNextPage }
+          nodes { id body author { login } createdAt }
+        }
+        reviewThreads(first: 100) {
+          nodes {
+            id
+            isResolved
+            comments(first: 10) {
+              nodes { id body author { login } createdAt path line }
+            }
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+_OPEN_ISSUES_QUERY = """
+query($owner: String!, $repo: String!, $cursor: String) {
+  repository(owner: $owner, name: $repo) {
+    issues(states: OPEN, first: 50, after: $cursor) {
+      pageInfo { hasNextPage endCursor }
+      nodes {
+        number
+        comments(first: 100) {
+          pageInfo { hasNextPage }
+          nodes { id body author { login } createdAt }
+        }
+      }
+    }
+  }
+}
+"""
+
+
+def _review_thread_comments(pr: int, threads: list[dict]) -> list[GitHubComment]:
+    """Build comments from unresolved review thread nodes of a PR."""
+    # GraphQL reports a deleted account's author as null, hence ``or {}``
+    return [
+        GitHubComment(
+            id=node["id"],
+            body=node.get("body", ""),
+            author=(node.get("author") or {}).get("login", "unknown"),
+            created_at=node.get("createdAt", ""),
+            pr=pr,
+            thread_id=thread["id"],
+            path=node.get("path"),
+            line=node.get("line"),
+        )
+        for thread in threads
+        if not thread.get("isResolved")
+        for node in thread.get("comments", {}).get("nodes", [])
+    ]
+
+
+# Blank line ending the headers of ``gh api -i`` output. Header lines end in
+# CRLF, while the status line gh prints itself ends in a bare LF.
+_HEADER_END_PATTERN = re.compile(r"\r?\n\r?\n")
+
+
+def _parse_gh_api_include(out: str) -> tuple[int, dict[str, str], str]:
+    """Split ``gh api -i`` output into (status, lowercased headers, body)."""
+    head, *rest = _HEADER_END_PATTERN.split(out, maxsplit=1)
+    body = rest[0] if rest else ""
+    lines = head.splitlines()
+    status = 0
+    if lines and lines[0].startswith("HTTP/"):
+        parts = lines[0].split()
+        if len(parts) > 1 and parts[1].isdigit():
+            status = int(parts[1])
+    headers: dict[str, str] = {}
+    for line in lines[1:]:
+        name, sep, value = line.partition(":")
+        if sep:
+            headers[name.strip().lower()] = value.strip()
+    return status, headers, body
+
+
+@functools.lru_cache(maxsize=1)
+def _checkout_repo() -> str:
+    """``owner/name`` of the current checkout, as ``gh api`` resolves ``{owner}/{repo}``.
+
+    Looked up once so API reads without a configured repo can still go through
+    the shared client instead of one ``gh api`` process each.
+    """
+    rc, out, _ = _run_gh("repo", "view", "--json", "nameWithOwner", "-q", ".nameWithOwner")
+    return out if rc == 0 else ""
+
+
+def _run_gh_cached(endpoint: str, cache_dir: Path) -> tuple[int, str, str]:
+    """GET a REST endpoint, revalidating a cached copy by ETag.
+
+    Stores ``{etag, body}`` per endpoint under ``cache_dir`` and sends
+    ``If-None-Match`` on the next request; a 304 reuses the cached body and
+    does not count against the rate limit. Returns (returncode, body, stderr)
+    like ``_run_gh``.
+    """
+    client = _github_client()
+    if client is not None and "{owner}" in endpoint:
+        repo = _checkout_repo()
+        if repo:
+            endpoint = endpoint.replace("{owner}/{repo}", repo)
+        else:
+            client = None  # leave the placeholders to gh
+
+    cache_path = cache_dir / f"{hashlib.sha1(endpoint.encode()).hexdigest()}.json"
+    cached: dict[str, str] = {}
+    try:
+        entry = _loads(cache_path.read_bytes())
+    except (OSError, json.JSONDecodeError):
+        pass
+    else:
+        if isinstance(entry, dict):
+            cached = entry
+
+    if client is not None:
+        response = client.get(endpoint, cached.get("etag"))
+        if response is None:
+            return 1, "", f"GET {endpoint} failed"
+        status, headers, body = response
+        rc, err = (0, "") if status < 300 else (1, f"HTTP {status}")
+    else:
+        args = ["api", "-i", endpoint]
+        if cached.get("etag"):
+            args.extend(["-H", f"If-None-Match: {cached['etag']}"])
+        rc, out, err = _run_gh(*args)
+        status, headers, body = _parse_gh_api_include(out)
+
+    # gh exits non-zero on 304, so check the status before the return code
+    if status == 304 or "HTTP 304" in err:
+        if "body" in cached:
+            return 0, cached["body"], ""
+        return 1, "", err
+    if rc != 0:
+        return rc, body, err
+
+    etag = headers.get("etag")
+    if etag:
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix(".tmp")
+            tmp_path.write_text(json.dumps({"etag": etag, "body": body}))
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            pass  # Caching is best effort (P16)
+    return rc, body, err
+
+
 class CommentFetcher:
-    """Fetches GitHub comments using the ``gh`` CLI."""
+    """Fetches GitHub comments using the ``gh`` CLI.
+
+    Top-level PR and issue comments are read from the REST API with ETag
+    revalidation against ``cache_dir`` (default ``.eco-state/gh-cache``), so
+    unchanged items cost a 304 instead of a full fetch. Within one instance
+    each PR or issue is fetched at most once; create a new fetcher per sync
+    run to see new comments.
+    """
 
-    def __init__(self, repo: Optional[str] = None) -> None:
+    def __init__(
+        self,
+        repo: Optional[str] = None,
+        cache_dir: str | Path | None = None,
+    ) -> None:
         self.repo = repo or os.environ.get("GITHUB_REPO", "")
+        self.cache_dir = Path(cache_dir) if cache_dir else Path(".eco-state") / "gh-cache"
+        # Comments already fetched by this instance, keyed by kind and number
+        self._fetched: dict[tuple[str, int], list[GitHubComment]] = {}
+
+    def _memoized(
+        self, key: tuple[str, int], fetch: Callable[[], list[GitHubComment]]
+    ) -> list[GitHubComment]:
+        if key not in self._fetched:
+            self._fetched[key] = fetch()
+        # Callers extend the returned list, so hand out a copy
+        return list(self._fetched[key])
+
+    def _rest_repo_path(self) -> str:
+        # gh api fills in {owner}/{repo} from the current checkout
+        return f"repos/{self.repo}" if self.repo else "repos/{owner}/{repo}"
+
+    def _fetch_rest_comments(
+        self, number: int, *, pr: int | None = None, issue: int | None = None
+    ) -> list[GitHubComment]:
+        """Fetch top-level comments on a PR or issue (PRs are issues in REST).
+
+        Walks the pages until a short one. Each page is revalidated by its own
+        ETag; a failed or unparseable page ends the walk with the comments
+        collected so far (P16).
+        """
+        endpoint = (
+            f"{self._rest_repo_path()}/issues/{number}/comments?per_page={_REST_PAGE_SIZE}"
+        )
+        data: list[dict] = []
+        page = 1
+        while True:
+            # The first page keeps the bare endpoint so existing cache entries stay valid
+            suffix = f"&page={page}" if page > 1 else ""
+            rc, out, _ = _run_gh_cached(endpoint + suffix, self.cache_dir)
+            if rc != 0:
+                break
+            try:
+                items = _loads(out)
+            except json.JSONDecodeError:
+                break
+            data.extend(items)
+            if len(items) < _REST_PAGE_SIZE:
+                break
+            page += 1
 
-    def _repo_args(self) -> list[str]:
+        return [
+            GitHubComment(
+                id=c.get("node_id", ""),
+                body=c.get("body", ""),
+                author=(c.get("user") or {}).get("login", "unknown"),
+                created_at=c.get("created_at", ""),
+                pr=pr,
+                issue=issue,
+            )
+            for c in data
+        ]
+
+    def _repo_args(self) -> tuple[str, ...]:
         if self.repo:
-            return ["--repo", self.repo]
-        return []
+            return ("--repo", self.repo)
+        return ()
 
     def fetch_pr_review_threads(self, pr: int) -> list[GitHubComment]:
         """Fetch review thread comments on a PR via GraphQL."""
-        query = """
-        query($owner: String!, $repo: String!, $pr: Int!) {
-          repository(owner: $owner, name: $repo) {
-            pullRequest(number: $pr) {
-              reviewThreads(first: 100) {
-                nodes {
-                  id
-                  isResolved
-                  comments(first: 10) {
-                    nodes {
-                      id
-                      body
-                      author { login }
-                      createdAt
-                      path
-                      line
-                    }
-                  }
-                }
-              }
-            }
-          }
-        }
-        """
         if not self.repo or "/" not in self.repo:
             return []
 
+        return self._memoized(("review_threads", pr), lambda: self._fetch_review_threads(pr))
+
+    def _fetch_review_threads(self, pr: int) -> list[GitHubComment]:
         owner, repo_name = self.repo.split("/", 1)
-        rc, out, err = _run_gh(
-            "api", "graphql",
-            "-f", f"query={query}",
-            "-f", f"owner={owner}",
-            "-f", f"repo={repo_name}",
-            "-F", f"pr={pr}",
+        data = _graphql(
+            _REVIEW_THREADS_QUERY, {"owner": owner, "repo": repo_name, "pr": pr}
         )
-        if rc != 0:
+        if data is None:
             return []
 
-        try:
-            data = json.loads(out)
-        except json.JSONDecodeError:
-            return []
-
-        comments: list[GitHubComment] = []
         threads = (
-            data.get("data", {})
+            (data.get("data") or {})
             .get("repository", {})
             .get("pullRequest", {})
             .get("reviewThreads", {})
             .get("nodes", [])
         )
-        for thread in threads:
-            if thread.get("isResolved"):
-                continue
-            for node in thread.get("comments", {}).get("nodes", []):
-                comments.append(
-                    GitHubComment(
-                        id=node["id"],
-                        body=node.get("body", ""),
-                        author=node.get("author", {}).get("login", "unknown"),
-                        created_at=node.get("createdAt", ""),
-                        pr=pr,
-                        thread_id=thread["id"],
-                        path=node.get("path"),
-                        line=node.get("line"),
-                    )
-                )
-        return comments
+        return _review_thread_comments(pr, threads)
 
     def fetch_pr_comments(self, pr: int) -> list[GitHubComment]:
         """Fetch top-level comments on a PR."""
-        rc, out, err = _run_gh(
-            "pr", "view", str(pr),
-            "--json", "comments",
-            *self._repo_args(),
-        )
-        if rc != 0:
-            return []
-
-        try:
-            data = json.loads(out)
-        except json.JSONDecodeError:
-            return []
-
-        comments: list[GitHubComment] = []
-        for c in data.get("comments", []):
-            comments.append(
-                GitHubComment(
-                    id=c.get("id", ""),
-                    body=c.get("body", ""),
-                    author=c.get("author", {}).get("login", "unknown"),
-                    created_at=c.get("createdAt", ""),
-                    pr=pr,
-                )
-            )
-        return comments
+        return self._memoized(("pr", pr), lambda: self._fetch_rest_comments(pr, pr=pr))
 
     def fetch_issue_comments(self, issue: int) -> list[GitHubComment]:
         """Fetch comments on an issue."""
-        rc, out, err = _run_gh(
-            "issue", "view", str(issue),
-            "--json", "comments",
-            *self._repo_args(),
+        return self._memoized(
+            ("issue", issue), lambda: self._fetch_rest_comments(issue, issue=issue)
         )
-        if rc != 0:
-            return []
 
-        try:
-            data = json.loads(out)
-        except json.JSONDecodeError:
-            return []
+    def _graphql_nodes(self, query: str, connection: str) -> list[dict]:
+        """Collect every node of a paginated repository connection.
 
+        Stops at the first failed or unparseable page and returns what was
+        collected so far (P16).
+        """
+        owner, repo_name = self.repo.split("/", 1)
+        nodes: list[dict] = []
+        cursor: str | None = None
+        while True:
+            variables: dict[str, str | int] = {"owner": owner, "repo": repo_name}
+            if cursor:
+                variables["cursor"] = cursor
+            data = _graphql(query, variables)
+            if data is None:
+                return nodes
+
+            page = (data.get("data") or {}).get("repository", {}).get(connection, {})
+            nodes.extend(page.get("nodes", []))
+            page_info = page.get("pageInfo", {})
+            cursor = page_info.get("endCursor")
+            if not page_info.get("hasNextPage") or not cursor:
+                return nodes
+
+    def _graphql_item_comments(
+        self, node: dict, *, pr: int | None = None, issue: int | None = None
+    ) -> list[GitHubComment]:
+        """Top-level comments of a PR or issue node from the batched queries.
+
+        The queries only carry the first 100 comments; when the item has
+        more, all of them are fetched from REST instead.
+        """
+        connection = node.get("comments", {})
+        if connection.get("pageInfo", {}).get("hasNextPage"):
+            if pr is not None:
+                return self.fetch_pr_comments(pr)
+            return self.fetch_issue_comments(issue)
+        return [
+            GitHubComment(
+                id=c.get("id", ""),
+                body=c.get("body", ""),
+                author=(c.get("author") or {}).get("login", "unknown"),
+                created_at=c.get("createdAt", ""),
+                pr=pr,
+                issue=issue,
+            )
+            for c in connection.get("nodes", [])
+        ]
+
+    def fetch_all_open_graphql(self) -> list[GitHubComment]:
+        """Fetch comments from all open PRs and issues in batched GraphQL queries.
+
+        Each ``gh`` call returns a page of 50 PRs or issues together with
+        their comments and review threads, so a sync costs a couple of calls
+        per 50 items instead of two or three per item. Requires ``repo`` in
+        ``owner/name`` form.
+        """
         comments: list[GitHubComment] = []
-        for c in data.get("comments", []):
-            comments.append(
-                GitHubComment(
-                    id=c.get("id", ""),
-                    body=c.get("body", ""),
-                    author=c.get("author", {}).get("login", "unknown"),
-                    created_at=c.get("createdAt", ""),
-                    issue=issue,
-                )
+        for pr_node in self._graphql_nodes(_OPEN_PULL_REQUESTS_QUERY, "pullRequests"):
+            num = pr_node.get("number")
+            if not num:
+                continue
+            comments.extend(self._graphql_item_comments(pr_node, pr=num))
+            comments.extend(
+                _review_thread_comments(num, pr_node.get("reviewThreads", {}).get("nodes", []))
             )
+
+        for issue_node in self._graphql_nodes(_OPEN_ISSUES_QUERY, "issues"):
+            num = issue_node.get("number")
+            if not num:
+                continue
+            comments.extend(self._graphql_item_comments(issue_node, issue=num))
         return comments
 
     def fetch_all_open(self) -> list[GitHubComment]:
-        """Fetch comments from all open PRs and issues."""
-        comments: list[GitHubComment] = []
+        """Fetch comments from all open PRs and issues.
 
-        # Fetch open PRs
+        Uses the batched GraphQL queries when ``repo`` is known; otherwise
+        lists open items and fetches each one individually.
+        """
+        if self.repo and "/" in self.repo:
+            return self.fetch_all_open_graphql()
+
+        fetches: list[Callable[[], list[GitHubComment]]] = []
+
+        # List open PRs
         rc, out, _ = _run_gh(
             "pr", "list", "--json", "number", "--state", "open",
             *self._repo_args(),
         )
         if rc == 0:
             try:
-                prs = json.loads(out)
+                prs = _loads(out)
                 for pr in prs:
                     num = pr.get("number")
                     if num:
-                        comments.extend(self.fetch_pr_comments(num))
-                        comments.extend(self.fetch_pr_review_threads(num))
+                        fetches.append(functools.partial(self.fetch_pr_comments, num))
+                        fetches.append(functools.partial(self.fetch_pr_review_threads, num))
             except json.JSONDecodeError:
                 pass
 
-        # Fetch open issues
+        # List open issues
         rc, out, _ = _run_gh(
             "issue", "list", "--json", "number", "--state", "open",
             *self._repo_args(),
         )
         if rc == 0:
             try:
-                issues = json.loads(out)
+                issues = _loads(out)
                 for issue in issues:
                     num = issue.get("number")
                     if num:
-                        comments.extend(self.fetch_issue_comments(num))
+                        fetches.append(functools.partial(self.fetch_issue_comments, num))
             except json.JSONDecodeError:
                 pass
 
+        if not fetches:
+            return []
+
+        # Each fetch blocks on its own gh subprocess, so run them on a thread
+        # pool; map() keeps results in listing order.
+        comments: list[GitHubComment] = []
+        with ThreadPoolExecutor(max_workers=min(_GH_MAX_WORKERS, len(fetches))) as pool:
+            for batch in pool.map(lambda fetch: fetch(), fetches):
+                comments.extend(batch)
         return comments
 
 
@@ -290,7 +680,7 @@ class CommentFetcher:
 class IntentClassifier:
     """Classifies comment intent using pattern matching with optional LLM fallback."""
 
-    INTENT_PATTERNS: dict[CommentIntent, list[re.Pattern[str]]] = {
+    INTENT_PATTERNS: ClassVar[dict[CommentIntent, list[re.Pattern[str]]]] = {
         CommentIntent.EDIT_ISSUE: [
             re.compile(r"\b(update|edit|change|modify)\s+(the\s+)?(issue|description|body)\b", re.I),
             re.compile(r"\b(issue\s+body|issue\s+description)\b", re.I),
@@ -309,7 +699,9 @@ class IntentClassifier:
         ],
         CommentIntent.REPLY: [
             re.compile(r"\b(reply|respond|answer)\b", re.I),
-            re.compile(r"^\s*@\w+\s+(?!:)", re.I),  # @mention without colon (informal mentions)
+            # @mention without colon (informal mentions); same as \s+(?!:) but
+            # without a lookahead, which Hyperscan does not support
+            re.compile(r"^\s*@\w+\s(?:[^:]|$)", re.I),
             re.compile(r"\bthanks\b|\bthank\s+you\b|\blgtm\b", re.I),
         ],
         CommentIntent.CREATE_ISSUE: [
@@ -323,31 +715,41 @@ class IntentClassifier:
         ],
     }
 
+    # Every INTENT_PATTERNS match contains one of these (lowercase) substrings;
+    # keep in sync when adding patterns. A body without any of them cannot
+    # match, so the regex searches are skipped. A subclass that overrides
+    # INTENT_PATTERNS without redefining these gets no prefilter.
+    _PREFILTER_KEYWORDS: tuple[str, ...] = (
+        "?", "@", "update", "edit", "change", "modify", "issue", "description",
+        "fix", "implement", "add", "remove", "refactor", "push", "commit",
+        "reply", "respond", "answer", "thank", "lgtm",
+        "create", "open", "file", "new", "track", "understand", "clarif",
+    )
+
     def classify(self, comment: GitHubComment) -> ClassifiedComment:
         """Classify a comment using deterministic pattern matching.
 
         Returns the first matching intent with high confidence, or CLARIFY
-        as default with low confidence.
+        as default with low confidence. Results are memoized per body (LRU,
+        4096 entries), since polling re-syncs see the same comments again.
         """
-        body = comment.body
-
-        for intent, patterns in self.INTENT_PATTERNS.items():
-            for pattern in patterns:
-                if pattern.search(body):
-                    return ClassifiedComment(
-                        comment=comment,
-                        intent=intent,
-                        confidence=0.9,
-                        pattern_matched=True,
-                    )
-
-        # No pattern matched — default to CLARIFY
-        return ClassifiedComment(
-            comment=comment,
-            intent=CommentIntent.CLARIFY,
-            confidence=0.3,
-            pattern_matched=False,
-        )
+        return _pattern_result(comment, _classify_body(type(self), comment.body))
+
+    def classify_many(self, comments: list[GitHubComment]) -> list[ClassifiedComment]:
+        """Classify comments in order, as ``classify`` would one by one.
+
+        Threads often repeat a body ("LGTM", "Thanks!"), so each distinct
+        body is classified once per batch.
+        """
+        classifier = type(self)
+        intents: dict[str, CommentIntent | None] = {}
+        results: list[ClassifiedComment] = []
+        for comment in comments:
+            body = comment.body
+            if body not in intents:
+                intents[body] = _classify_body(classifier, body)
+            results.append(_pattern_result(comment, intents[body]))
+        return results
 
     def classify_with_llm(
         self,
@@ -372,19 +774,224 @@ class IntentClassifier:
         )
 
         try:
-            response = judge_fn(prompt).strip().lower()
-            for intent in CommentIntent:
-                if intent.value in response:
-                    return ClassifiedComment(
-                        comment=comment,
-                        intent=intent,
-                        confidence=0.7,
-                        pattern_matched=False,
-                    )
+            intent = _intent_from_llm(judge_fn(prompt))
         except Exception:
-            pass
+            return result
+        if intent is None:
+            return result
+        return ClassifiedComment(
+            comment=comment,
+            intent=intent,
+            confidence=0.7,
+            pattern_matched=False,
+        )
+
+    def classify_batch_with_llm(
+        self,
+        comments: list[GitHubComment],
+        judge_fn: Callable[[str], str],
+    ) -> list[ClassifiedComment]:
+        """Classify comments, sending every low-confidence one to the LLM in one prompt.
+
+        Equivalent to ``classify_with_llm`` per comment, but with a single
+        judge call. If the response is not a JSON array with one intent name
+        per comment, falls back to ``classify_with_llm`` for each of them.
+        """
+        results = self.classify_many(comments)
+        uncertain = [i for i, result in enumerate(results) if result.confidence < 0.5]
+        if not uncertain:
+            return results
 
-        return result
+        intent_names = ", ".join(i.value for i in CommentIntent)
+        numbered = "\n\n".join(
+            f"{n}. {comments[i].body}" for n, i in enumerate(uncertain, start=1)
+        )
+        prompt = (
+            f"Classify the intent of each of the following numbered GitHub comments "
+            f"into one of: {intent_names}\n\n"
+            f"{numbered}\n\n"
+            f"Reply with just a JSON array of {len(uncertain)} intent names, in order."
+        )
+
+        try:
+            response = judge_fn(prompt)
+            # Tolerate prose or code fences around the array
+            labels = json.loads(response[response.index("["):response.rindex("]") + 1])
+        except Exception:
+            labels = None
+        if not isinstance(labels, list) or len(labels) != len(uncertain):
+            for i in uncertain:
+                results[i] = self.classify_with_llm(comments[i], judge_fn)
+            return results
+
+        for i, label in zip(uncertain, labels):
+            intent = _intent_from_llm(label) if isinstance(label, str) else None
+            if intent is not None:
+                results[i] = ClassifiedComment(
+                    comment=comments[i],
+                    intent=intent,
+                    confidence=0.7,
+                    pattern_matched=False,
+                )
+        return results
+
+
+def _pattern_result(comment: GitHubComment, intent: CommentIntent | None) -> ClassifiedComment:
+    """Wrap a pattern-matching outcome; no match defaults to low-confidence CLARIFY."""
+    if intent is None:
+        return ClassifiedComment(
+            comment=comment,
+            intent=CommentIntent.CLARIFY,
+            confidence=0.3,
+            pattern_matched=False,
+        )
+    return ClassifiedComment(
+        comment=comment,
+        intent=intent,
+        confidence=0.9,
+        pattern_matched=True,
+    )
+
+
+def _intent_from_llm(response: str) -> CommentIntent | None:
+    """First intent whose name appears in an LLM answer, or None."""
+    response = response.strip().lower()
+    for intent in CommentIntent:
+        if intent.value in response:
+            return intent
+    return None
+
+
+@functools.lru_cache(maxsize=4096)
+def _classify_body(classifier: type[IntentClassifier], body: str) -> CommentIntent | None:
+    """First intent whose patterns match the body, or None; memoized since pure.
+
+    Classification depends only on the body and the classifier's class-level
+    patterns, so repeated comments skip the pattern scan entirely.
+    """
+    database = _intent_database(classifier) if _hyperscan_compatible(body) else None
+    if database is not None:
+        matched: list[int] = []
+        database.scan(
+            body.encode(),
+            match_event_handler=lambda pattern_id, *_: matched.append(pattern_id),
+        )
+        return _flattened_intents(classifier)[min(matched)] if matched else None
+
+    keywords = _prefilter_keywords(classifier)
+    if keywords is not None:
+        folded = body if body.isascii() else body.translate(_IGNORECASE_ASCII_FOLDS)
+        lowered = folded.lower()
+        automaton = _keyword_automaton(classifier)
+        if automaton is not None:
+            has_keyword = next(automaton.iter(lowered), None) is not None
+        else:
+            has_keyword = any(keyword in lowered for keyword in keywords)
+        if not has_keyword:
+            return None
+
+    for intent, matcher in _intent_matchers(classifier):
+        if matcher.search(body):
+            return intent
+    return None
+
+
+@functools.cache
+def _intent_matchers(
+    classifier: type[IntentClassifier],
+) -> tuple[tuple[CommentIntent, re.Pattern[str]], ...]:
+    """One alternation per intent of a classifier, in INTENT_PATTERNS order.
+
+    A single regex across intents would report the leftmost match rather than
+    the first intent in priority order, so intents are still tried one at a
+    time.
+    """
+    return tuple(
+        (intent, re.compile("|".join(f"(?:{p.pattern})" for p in patterns), re.IGNORECASE))
+        for intent, patterns in classifier.INTENT_PATTERNS.items()
+    )
+
+
+@functools.cache
+def _prefilter_keywords(classifier: type[IntentClassifier]) -> tuple[str, ...] | None:
+    """The _PREFILTER_KEYWORDS written for a classifier's INTENT_PATTERNS, or None.
+
+    Keywords only cover the patterns they were written against, so they are
+    used when defined on the class that defines INTENT_PATTERNS or below it.
+    """
+    for cls in classifier.__mro__:
+        if "_PREFILTER_KEYWORDS" in vars(cls):
+            return cls._PREFILTER_KEYWORDS
+        if "INTENT_PATTERNS" in vars(cls):
+            return None
+    return None
+
+
+@functools.cache
+def _flattened_intents(classifier: type[IntentClassifier]) -> tuple[CommentIntent, ...]:
+    """Intent of each pattern in INTENT_PATTERNS order, indexed by pattern id."""
+    return tuple(
+        intent
+        for intent, patterns in classifier.INTENT_PATTERNS.items()
+        for _ in patterns
+    )
+
+
+@functools.cache
+def _keyword_automaton(classifier: type[IntentClassifier]) -> Any:
+    """Aho-Corasick automaton over a classifier's prefilter keywords, if available.
+
+    Finds whether any keyword occurs in one pass over the body instead of one
+    substring search per keyword. Returns None when pyahocorasick is not
+    installed or the classifier has no prefilter keywords.
+    """
+    keywords = _prefilter_keywords(classifier)
+    if keywords is None:
+        return None
+    try:
+        import ahocorasick
+    except ImportError:
+        return None
+
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+
+@functools.cache
+def _intent_database(classifier: type[IntentClassifier]) -> Any:
+    """Compile a classifier's INTENT_PATTERNS into a Hyperscan database, if available.
+
+    Pattern ids follow INTENT_PATTERNS order, so the lowest id reported by a
+    scan belongs to the intent a sequential search would have returned. One
+    scan covers every pattern. Callers only scan bodies that pass
+    ``_hyperscan_compatible``. Returns None when hyperscan is not installed
+    or rejects a pattern.
+    """
+    try:
+        import hyperscan
+    except ImportError:
+        return None
+
+    sources = [
+        pattern.pattern
+        for patterns in classifier.INTENT_PATTERNS.values()
+        for pattern in patterns
+    ]
+    flags = hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH
+    database = hyperscan.Database()
+    try:
+        database.compile(
+            expressions=[source.encode() for source in sources],
+            ids=list(range(len(sources))),
+            elements=len(sources),
+            flags=[flags] * len(sources),
+        )
+    except hyperscan.error:
+        return None
+    return database
 
 
 # ---------------------------------------------------------------------------
@@ -401,11 +1008,21 @@ class ActionExecutor:
     def __init__(self, repo: Optional[str] = None, engine=None) -> None:
         self.repo = repo or os.environ.get("GITHUB_REPO", "")
         self.engine = engine
+        # Built once rather than on every execute() call
+        self._handlers: dict[CommentIntent, Callable[[GitHubComment, bool], ActionResult]] = {
+            CommentIntent.EDIT_ISSUE: self._edit_issue,
+            CommentIntent.CHANGE_CODE: self._change_code,
+            CommentIntent.UPDATE_PR_DESC: self._update_pr_desc,
+            CommentIntent.INVOKE_AGENT: self._invoke_agent,
+            CommentIntent.REPLY: self._reply,
+            CommentIntent.CLARIFY: self._ask_clarification,
+            CommentIntent.CREATE_ISSUE: self._create_issue,
+        }
 
-    def _repo_args(self) -> list[str]:
+    def _repo_args(self) -> tuple[str, ...]:
         if self.repo:
-            return ["--repo", self.repo]
-        return []
+            return ("--repo", self.repo)
+        return ()
 
     def execute(
         self,
@@ -413,16 +1030,7 @@ class ActionExecutor:
         dry_run: bool = False,
     ) -> ActionResult:
         """Dispatch to the appropriate action handler."""
-        handlers = {
-            CommentIntent.EDIT_ISSUE: self._edit_issue,
-            CommentIntent.CHANGE_CODE: self._change_code,
-            CommentIntent.UPDATE_PR_DESC: self._update_pr_desc,
-            CommentIntent.INVOKE_AGENT: self._invoke_agent,
-            CommentIntent.REPLY: self._reply,
-            CommentIntent.CLARIFY: self._ask_clarification,
-            CommentIntent.CREATE_ISSUE: self._create_issue,
-        }
-        handler = handlers.get(classified.intent, self._ask_clarification)
+        handler = self._handlers.get(classified.intent, self._ask_clarification)
         return handler(classified.comment, dry_run)
 
     def _edit_issue(self, comment: GitHubComment, dry_run: bool) -> ActionResult:
@@ -706,73 +1314,300 @@ Please provide a helpful, concise response addressing the feedback. Keep it prof
 # ---------------------------------------------------------------------------
 
 
+def _now_iso() -> str:
+    """Return the current UTC time as an ISO 8601 string.
+
+    ``time.strftime`` on a ``struct_time`` is about 3x cheaper than building
+    an aware ``datetime`` and formatting that.
+    """
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+
+
+def _dumps_line(entry: dict[str, Any]) -> bytes:
+    """Encode one history entry as a newline-terminated JSONL line."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(entry, option=orjson.OPT_APPEND_NEWLINE)
+        except TypeError:  # orjson.JSONEncodeError, e.g. lone surrogates
+            pass
+    return (json.dumps(entry) + "\n").encode()
+
+
+# Sidecar index over sync-history.jsonl. The JSONL file stays the record of
+# truth; ``meta.offset`` is how many of its bytes have been indexed, so rows
+# can always be rebuilt from the log. ``meta.inode`` and ``meta.head``
+# identify the indexed log, so a rotated or replaced file is re-indexed
+# instead of read at stale positions.
+_HISTORY_INDEX_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    comment_id TEXT,
+    intent TEXT,
+    success INTEGER,
+    summary TEXT,
+    error TEXT,
+    timestamp TEXT NOT NULL DEFAULT ''
+);
+CREATE INDEX IF NOT EXISTS entries_comment_id ON entries(comment_id);
+CREATE INDEX IF NOT EXISTS entries_timestamp ON entries(timestamp);
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value INTEGER NOT NULL);
+"""
+
+
+def _to_sqlite(value: Any) -> Any:
+    """SQLite text must be valid UTF-8, so strings with lone surrogates go in as BLOBs."""
+    if isinstance(value, str) and not value.isascii():
+        try:
+            value.encode()
+        except UnicodeEncodeError:
+            return value.encode("utf-8", "surrogatepass")
+    return value
+
+
+def _from_sqlite(value: Any) -> Any:
+    if isinstance(value, bytes):
+        return value.decode("utf-8", "surrogatepass")
+    return value
+
+
+def _index_row(line: bytes) -> tuple[Any, ...] | None:
+    """Turn one JSONL line into an ``entries`` row, or None if unusable.
+
+    Entries that name a comment but are not valid action results still mark
+    the comment processed; their ``intent`` is NULL so ``get_runs`` skips them.
+    """
+    try:
+        record = _loads(line)
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return None
+    if not isinstance(record, dict):
+        return None
+    timestamp = record.get("timestamp", "")
+    if not isinstance(timestamp, str):
+        timestamp = ""
+    try:
+        return (
+            _to_sqlite(record["comment_id"]),
+            CommentIntent(record["intent"]).value,
+            bool(record["success"]),
+            _to_sqlite(record["summary"]),
+            _to_sqlite(record.get("error")),
+            timestamp,
+        )
+    except (KeyError, ValueError):
+        comment_id = record.get("comment_id")
+        if comment_id is None:
+            return None
+        return (_to_sqlite(comment_id), None, None, None, None, timestamp)
+
+
 class SyncHistory:
-    """Persists sync history as JSONL at ``.eco-state/sync-history.jsonl``."""
+    """Persists sync history as JSONL at ``.eco-state/sync-history.jsonl``.
+
+    Lookups go through ``sync-history.sqlite`` next to it, which indexes the
+    JSONL log incrementally instead of re-parsing it on every run.
+    """
 
     def __init__(self, state_dir: str | Path | None = None) -> None:
         self._state_dir = Path(state_dir) if state_dir else Path(".eco-state")
         self._path = self._state_dir / "sync-history.jsonl"
+        self._index_path = self._state_dir / "sync-history.sqlite"
+        self._db: sqlite3.Connection | None = None
+        # Inside open_batch(): the append handle (opened by the first
+        # record()), where its writes started, and the lines and comment ids
+        # written through it but not yet indexed
+        self._batch_file: BinaryIO | None = None
+        self._batch_start = 0
+        self._pending: list[bytes] | None = None
+        self._pending_ids: set[str] = set()
+
+    def close(self) -> None:
+        """Close the sidecar index connection; it reopens on the next lookup."""
+        if self._db is not None:
+            self._db.close()
+            self._db = None
 
     def _ensure_dir(self) -> None:
         self._state_dir.mkdir(parents=True, exist_ok=True)
 
+    def _index(self, create: bool = False) -> sqlite3.Connection | None:
+        """Open the sidecar index and catch it up with the log.
+
+        Returns None while there is no history file unless ``create`` is set,
+        so reads never create the state directory. The log is read once per
+        instance; entries appended by other processes afterwards are only
+        picked up by this instance's next write.
+        """
+        if self._db is None:
+            if not create and not self._path.exists():
+                return None
+            self._ensure_dir()
+            try:
+                self._db = self._open_index()
+            except sqlite3.DatabaseError:
+                # Corrupt sidecar: it is derived data, so start over
+                self._index_path.unlink(missing_ok=True)
+                self._db = self._open_index()
+        return self._db
+
+    def _open_index(self) -> sqlite3.Connection:
+        db = sqlite3.connect(self._index_path, isolation_level=None)
+        db.executescript(_HISTORY_INDEX_SCHEMA)
+        self._catch_up(db)
+        return db
+
+    def _catch_up(self, db: sqlite3.Connection, appended: tuple[int, bytes] | None = None) -> None:
+        """Index JSONL bytes past the stored offset, rebuilding if the log was replaced.
+
+        The log counts as replaced when it shrank, its inode changed, or its
+        first indexed bytes differ. ``appended`` is ``(position, data)`` for a
+        write this instance just made; when it is exactly the unindexed tail
+        it is used as-is rather than read back from disk.
+        """
+        with db, contextlib.ExitStack() as stack:  # one transaction
+            # IMMEDIATE takes the write lock before the offset is read, so
+            # concurrent processes never index the same bytes twice
+            db.execute("BEGIN IMMEDIATE")
+            meta = dict(db.execute("SELECT key, value FROM meta"))
+            offset = meta.get("offset", 0)
+            try:
+                f = stack.enter_context(open(self._path, "rb"))
+            except FileNotFoundError:
+                if offset:
+                    db.execute("DELETE FROM entries")
+                    db.execute("DELETE FROM meta")
+                return
+            st = os.fstat(f.fileno())
+            inode = st.st_ino & (2**63 - 1)  # SQLite integers are signed 64-bit
+            replaced = offset > 0 and (
+                st.st_size < offset
+                or meta.get("inode") != inode
+                or meta.get("head") != _head_hash(f, min(offset, _HEAD_BYTES))
+            )
+            if replaced:
+                db.execute("DELETE FROM entries")
+                offset = 0
+            elif st.st_size == offset:
+                return
+
+            if (
+                appended is not None
+                and appended[0] == offset
+                and offset + len(appended[1]) == st.st_size
+            ):
+                data = appended[1]
+            else:
+                f.seek(offset)
+                data = f.read()
+            # Leave a partially written last line for the next catch-up
+            end = data.rfind(b"\n") + 1
+            rows = (_index_row(line) for line in data[:end].splitlines() if line.strip())
+            db.executemany(
+                "INSERT INTO entries VALUES (?, ?, ?, ?, ?, ?)",
+                (row for row in rows if row is not None),
+            )
+            offset += end
+            db.executemany(
+                "INSERT OR REPLACE INTO meta VALUES (?, ?)",
+                [
+                    ("offset", offset),
+                    ("inode", inode),
+                    ("head", _head_hash(f, min(offset, _HEAD_BYTES))),
+                ],
+            )
+
+    def _append(self, data: bytes) -> None:
+        db = self._index(create=True)
+        with open(self._path, "ab") as f:
+            position = f.tell()
+            f.write(data)
+        self._catch_up(db, (position, data))
+
     def is_processed(self, comment_id: str) -> bool:
         """Check if a comment has already been processed."""
-        if not self._path.exists():
+        if comment_id in self._pending_ids:
+            return True
+        db = self._index()
+        if db is None:
             return False
-        with open(self._path) as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    record = json.loads(line)
-                    if record.get("comment_id") == comment_id:
-                        return True
-                except json.JSONDecodeError:
-                    continue
-        return False
+        return db.execute(
+            "SELECT 1 FROM entries WHERE comment_id = ? LIMIT 1", (_to_sqlite(comment_id),)
+        ).fetchone() is not None
 
     def record(self, result: ActionResult) -> None:
-        """Append an action result to the history file."""
-        self._ensure_dir()
+        """Append an action result to the history file.
+
+        Inside ``open_batch()`` the entry is written and flushed on the
+        batch's open handle, and indexed when the batch closes.
+        """
         entry = {
             "comment_id": result.comment_id,
             "intent": result.intent.value,
             "success": result.success,
             "summary": result.summary,
             "error": result.error,
-            "timestamp": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "timestamp": _now_iso(),
         }
-        with open(self._path, "a") as f:
-            f.write(json.dumps(entry) + "\n")
+        line = _dumps_line(entry)
+        if self._pending is not None:
+            if self._batch_file is None:
+                # Catch the index up first so the batch is indexed from memory
+                self._index(create=True)
+                self._batch_file = open(self._path, "ab")  # noqa: SIM115 - closed by open_batch
+                self._batch_start = self._batch_file.tell()
+            self._batch_file.write(line)
+            # Flush each entry: an action already taken must stay recorded
+            # even if the process is killed before the batch closes
+            self._batch_file.flush()
+            self._pending.append(line)
+            self._pending_ids.add(result.comment_id)
+        else:
+            self._append(line)
+
+    @contextlib.contextmanager
+    def open_batch(self) -> Iterator[SyncHistory]:
+        """Keep the history file open across ``record`` calls.
+
+        Entries are still written as they are recorded; the batch only saves
+        reopening the file and updating the index per entry. The index
+        catches up once when the batch closes, even if the block raises.
+        """
+        self._pending = []
+        try:
+            yield self
+        finally:
+            pending, self._pending = self._pending, None
+            if self._batch_file is not None:
+                self._batch_file.close()
+                self._batch_file = None
+                self._catch_up(
+                    self._index(create=True), (self._batch_start, b"".join(pending))
+                )
+            self._pending_ids.clear()
 
     def get_runs(self, since: str | None = None) -> list[SyncRun]:
         """Read all sync runs, optionally filtered by timestamp."""
-        if not self._path.exists():
+        db = self._index()
+        if db is None:
             return []
 
-        results: list[ActionResult] = []
-        with open(self._path) as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    record = json.loads(line)
-                    if since and record.get("timestamp", "") < since:
-                        continue
-                    results.append(
-                        ActionResult(
-                            comment_id=record["comment_id"],
-                            intent=CommentIntent(record["intent"]),
-                            success=record["success"],
-                            summary=record["summary"],
-                            error=record.get("error"),
-                        )
-                    )
-                except (json.JSONDecodeError, KeyError, ValueError):
-                    continue
+        query = "SELECT comment_id, intent, success, summary, error FROM entries"
+        query += " WHERE intent IS NOT NULL"
+        params: tuple[str, ...] = ()
+        if since:
+            query += " AND timestamp >= ?"
+            params = (since,)
+        results = [
+            ActionResult(
+                comment_id=_from_sqlite(comment_id),
+                intent=CommentIntent(intent),
+                success=bool(success),
+                summary=_from_sqlite(summary),
+                error=_from_sqlite(error),
+            )
+            for comment_id, intent, success, summary, error in db.execute(
+                query + " ORDER BY rowid", params
+            )
+        ]
 
         if not results:
             return []
@@ -780,7 +1615,7 @@ class SyncHistory:
         # Group into a single run for simplicity
         return [
             SyncRun(
-                timestamp=datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+                timestamp=_now_iso(),
                 results=results,
                 dry_run=False,
             )
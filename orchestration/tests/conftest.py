@@ -0,0 +1,15 @@
+"""Shared fixtures for the orchestration test suite."""
+
+import pytest
+
+from orchestration import sync_engine
+
+
+@pytest.fixture(autouse=True)
+def _no_github_http_client(monkeypatch):
+    """Route GitHub reads through the (mocked) ``gh`` subprocess path.
+
+    Without this, an installed ``httpx`` plus a token in the environment
+    would send real API requests from tests that only mock ``subprocess``.
+    """
+    monkeypatch.setattr(sync_engine, "_github_client", lambda: None)
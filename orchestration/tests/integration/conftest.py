@@ -6,9 +6,23 @@ be run with: uv run pytest -m integration -v
 
 import pytest
 
+from orchestration.judge import JudgeEngine
+from orchestration.router import TaskRouter
 from orchestration.sync_engine import GitHubComment
 
 
+# TaskRouter and JudgeEngine keep no per-call state, so one instance of each
+# can serve a whole test module.
+@pytest.fixture(scope="module")
+def router() -> TaskRouter:
+    return TaskRouter()
+
+
+@pytest.fixture(scope="module")
+def engine() -> JudgeEngine:
+    return JudgeEngine()
+
+
 @pytest.fixture
 def make_comment():
     """Factory fixture for creating GitHubComment instances."""
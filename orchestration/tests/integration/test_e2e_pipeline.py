@@ -13,12 +13,10 @@ import pytest
 from orchestration.judge import (
     CriterionScore,
     EvaluationReport,
-    JudgeEngine,
 )
 from orchestration.router import (
     PRIORITY_TABLE,
     ROUTING_TABLE,
-    TaskRouter,
     TaskType,
 )
 from orchestration.rubrics import (
@@ -31,6 +29,19 @@ from orchestration.rubrics import (
 pytestmark = pytest.mark.integration
 
 
+def build_mock_judge(rubric, overall: str = "Overall: Good implementation."):
+    """Build a judge that scores every criterion at the top of its scale."""
+    response = "\n".join(
+        f"## {c.name}\nScore: {c.scale[1]}\nReasoning: Meets {c.name} requirements.\n"
+        for c in rubric
+    ) + f"\n{overall}"
+
+    def mock_judge(prompt: str) -> str:
+        return response
+
+    return mock_judge
+
+
 # ---------------------------------------------------------------------------
 # Pipeline: Feature request
 # ---------------------------------------------------------------------------
@@ -41,19 +52,18 @@ class TestFeatureRequestPipeline:
     → orchestrator with medium priority, selects the correct model, and
     produces a valid evaluation report."""
 
-    def test_classifies_as_feature(self):
-        router = TaskRouter()
-        task_type = router.classify("Add input validation to the login form")
+    TASK = "Add input validation to the login form"
+
+    def test_classifies_as_feature(self, router):
+        task_type = router.classify(self.TASK)
         assert task_type == TaskType.FEATURE
 
-    def test_routes_to_architect_sequence(self):
-        router = TaskRouter()
-        decision = router.route("Add input validation to the login form")
-        assert decision.agent_sequence == ["architect", "performance-engineer", "orchestrator"]
+    def test_routes_to_architect_sequence(self, router):
+        decision = router.route(self.TASK)
+        assert decision.agent_sequence == ("architect", "performance-engineer", "orchestrator")
 
-    def test_feature_has_medium_priority(self):
-        router = TaskRouter()
-        decision = router.route("Add input validation to the login form")
+    def test_feature_has_medium_priority(self, router):
+        decision = router.route(self.TASK)
         assert decision.priority == "medium"
 
     def test_routing_table_enforces_architecture_first(self):
@@ -61,37 +71,25 @@ class TestFeatureRequestPipeline:
         sequence = ROUTING_TABLE[TaskType.FEATURE]
         assert sequence[0] == "architect"
 
-    def test_full_pipeline_with_mock_judge(self):
+    def test_full_pipeline_with_mock_judge(self, router, engine):
         """Full pipeline: route → evaluate with mock judge → valid report."""
-        router = TaskRouter()
-        engine = JudgeEngine()
 
         # Step 1: Route
         decision = router.route("Create a user registration feature")
         assert decision.task_type == TaskType.FEATURE
 
-        # Step 2: Use CODE_REVIEW_RUBRIC (it's a list of EvaluationCriterion)
+        # Step 2: Use CODE_REVIEW_RUBRIC (it's a tuple of EvaluationCriterion)
         rubric = CODE_REVIEW_RUBRIC
 
-        # Step 3: Mock judge function that returns structured output
-        def mock_judge(prompt: str) -> str:
-            lines = []
-            for criterion in rubric:
-                lines.append(f"## {criterion.name}")
-                lines.append(f"Score: {criterion.scale[1]}")
-                lines.append(f"Reasoning: Meets {criterion.name} requirements.\n")
-            lines.append("Overall: Good implementation.")
-            return "\n".join(lines)
-
-        # Step 4: Evaluate
+        # Step 3: Evaluate with a mock judge that returns structured output
         report = engine.evaluate(
             response="def register(user): ...",
             rubric=rubric,
-            judge_fn=mock_judge,
+            judge_fn=build_mock_judge(rubric),
             reference="def register(user): validate(user); save(user)",
         )
 
-        # Step 5: Verify
+        # Step 4: Verify
         assert isinstance(report, EvaluationReport)
         assert report.total >= 0
         assert report.confidence >= 0
@@ -108,19 +106,18 @@ class TestBugFixPipeline:
     """Hypothesis: A bug report routes through performance-engineer → orchestrator
     → reviewer with high priority."""
 
-    def test_classifies_as_bug_fix(self):
-        router = TaskRouter()
-        task_type = router.classify("Fix the null pointer error in auth module")
+    TASK = "Fix the null pointer error in auth module"
+
+    def test_classifies_as_bug_fix(self, router):
+        task_type = router.classify(self.TASK)
         assert task_type == TaskType.BUG_FIX
 
-    def test_routes_to_performance_sequence(self):
-        router = TaskRouter()
-        decision = router.route("Fix the null pointer error in auth module")
-        assert decision.agent_sequence == ["performance-engineer", "orchestrator", "reviewer"]
+    def test_routes_to_performance_sequence(self, router):
+        decision = router.route(self.TASK)
+        assert decision.agent_sequence == ("performance-engineer", "orchestrator", "reviewer")
 
-    def test_bug_fix_has_high_priority(self):
-        router = TaskRouter()
-        decision = router.route("Fix the null pointer error in auth module")
+    def test_bug_fix_has_high_priority(self, router):
+        decision = router.route(self.TASK)
         assert decision.priority == "high"
 
     def test_tdd_enforced_for_bugs(self):
@@ -128,10 +125,8 @@ class TestBugFixPipeline:
         sequence = ROUTING_TABLE[TaskType.BUG_FIX]
         assert sequence[0] == "performance-engineer"
 
-    def test_bug_fix_pipeline_with_judge(self):
+    def test_bug_fix_pipeline_with_judge(self, router, engine):
         """Full pipeline: route → evaluate → verify score structure."""
-        router = TaskRouter()
-        engine = JudgeEngine()
 
         decision = router.route("Fix broken authentication flow")
         assert decision.task_type == TaskType.BUG_FIX
@@ -139,16 +134,10 @@ class TestBugFixPipeline:
 
         rubric = CODE_REVIEW_RUBRIC
 
-        def mock_judge(prompt: str) -> str:
-            return "\n".join(
-                f"## {c.name}\nScore: {c.scale[1]}\nReasoning: Adequate.\n"
-                for c in rubric
-            ) + "\nOverall: Bug fixed adequately."
-
         report = engine.evaluate(
             response="def auth(): try: validate() except: handle()",
             rubric=rubric,
-            judge_fn=mock_judge,
+            judge_fn=build_mock_judge(rubric, "Overall: Bug fixed adequately."),
         )
 
         assert isinstance(report, EvaluationReport)
@@ -164,24 +153,22 @@ class TestUnknownTaskEscalation:
     """Hypothesis: An unclassifiable task returns UNKNOWN type and routes
     to the orchestrator agent. This validates P16 (Permission to Fail)."""
 
-    def test_classifies_as_unknown(self):
-        router = TaskRouter()
-        task_type = router.classify("Something completely ambiguous")
+    TASK = "Something completely ambiguous"
+
+    def test_classifies_as_unknown(self, router):
+        task_type = router.classify(self.TASK)
         assert task_type == TaskType.UNKNOWN
 
-    def test_empty_input_is_unknown(self):
-        router = TaskRouter()
+    def test_empty_input_is_unknown(self, router):
         assert router.classify("") == TaskType.UNKNOWN
         assert router.classify("   ") == TaskType.UNKNOWN
 
-    def test_routes_to_orchestrator(self):
-        router = TaskRouter()
-        decision = router.route("Something completely ambiguous")
-        assert decision.agent_sequence == ["orchestrator"]
+    def test_routes_to_orchestrator(self, router):
+        decision = router.route(self.TASK)
+        assert decision.agent_sequence == ("orchestrator",)
 
-    def test_unknown_has_low_priority(self):
-        router = TaskRouter()
-        decision = router.route("Something completely ambiguous")
+    def test_unknown_has_low_priority(self, router):
+        decision = router.route(self.TASK)
         assert decision.priority == "low"
 
     def test_all_task_types_have_routing(self):
@@ -203,17 +190,14 @@ class TestUnknownTaskEscalation:
 class TestReviewPipeline:
     """Hypothesis: A review request routes directly to the reviewer agent."""
 
-    def test_classifies_as_review(self):
-        router = TaskRouter()
+    def test_classifies_as_review(self, router):
         assert router.classify("Review PR #42") == TaskType.REVIEW
 
-    def test_routes_to_reviewer_only(self):
-        router = TaskRouter()
+    def test_routes_to_reviewer_only(self, router):
         decision = router.route("Review the pull request changes")
-        assert decision.agent_sequence == ["reviewer"]
+        assert decision.agent_sequence == ("reviewer",)
 
-    def test_review_has_medium_priority(self):
-        router = TaskRouter()
+    def test_review_has_medium_priority(self, router):
         decision = router.route("Review this code")
         assert decision.priority == "medium"
 
@@ -226,20 +210,17 @@ class TestReviewPipeline:
 class TestContextExtraction:
     """Hypothesis: The router extracts file paths from task descriptions."""
 
-    def test_extracts_python_file(self):
-        router = TaskRouter()
+    def test_extracts_python_file(self, router):
         decision = router.route("Add tests to orchestration/router.py")
         assert "orchestration/router.py" in decision.context.get("files", [])
 
-    def test_extracts_multiple_files(self):
-        router = TaskRouter()
+    def test_extracts_multiple_files(self, router):
         decision = router.route("Fix cli.py and update config.yaml")
         files = decision.context.get("files", [])
         assert "cli.py" in files
         assert "config.yaml" in files
 
-    def test_no_files_extracted_for_plain_task(self):
-        router = TaskRouter()
+    def test_no_files_extracted_for_plain_task(self, router):
         decision = router.route("Add a new feature")
         assert "files" not in decision.context or decision.context["files"] == []
 
@@ -265,8 +246,7 @@ class TestRubricIntegration:
         for c in TEST_QUALITY_RUBRIC:
             assert isinstance(c, EvaluationCriterion)
 
-    def test_judge_engine_accepts_rubric_criteria(self):
-        engine = JudgeEngine()
+    def test_judge_engine_accepts_rubric_criteria(self, engine):
         rubric = CODE_REVIEW_RUBRIC
 
         def mock_judge(prompt: str) -> str:
@@ -279,8 +259,7 @@ class TestRubricIntegration:
         )
         assert isinstance(report, EvaluationReport)
 
-    def test_multi_model_ensemble_with_rubric(self):
-        engine = JudgeEngine()
+    def test_multi_model_ensemble_with_rubric(self, engine):
         rubric = CODE_REVIEW_RUBRIC
 
         def make_judge(score: int):
@@ -8,10 +8,12 @@ Each test follows the Foundational Algorithm (P2) as a scientific
 experiment: hypothesis → setup → execute → verify.
 """
 
+import dataclasses
 import json
+import subprocess
 
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 
 from orchestration.sync_engine import (
     ActionExecutor,
@@ -113,13 +115,17 @@ class TestSyncActionExecution:
     """Hypothesis: The executor correctly dispatches each intent type
     to the appropriate action handler in dry-run mode."""
 
+    # Fields shared by every comment in this class; GitHubComment is frozen
+    _TEMPLATE = GitHubComment(
+        id="IC_template",
+        body="",
+        author="testuser",
+        created_at="2026-01-01T00:00:00Z",
+    )
+
     def _make_classified(self, intent, body="test", **kwargs):
-        comment = GitHubComment(
-            id=f"IC_test_{intent.value}",
-            body=body,
-            author="testuser",
-            created_at="2026-01-01T00:00:00Z",
-            **kwargs,
+        comment = dataclasses.replace(
+            self._TEMPLATE, id=f"IC_test_{intent.value}", body=body, **kwargs,
         )
         return ClassifiedComment(
             comment=comment,
@@ -128,59 +134,26 @@ class TestSyncActionExecution:
             pattern_matched=True,
         )
 
-    def test_edit_issue_dry_run(self):
-        executor = ActionExecutor()
-        classified = self._make_classified(
-            CommentIntent.EDIT_ISSUE, body="Update the issue", issue=42,
-        )
-        result = executor.execute(classified, dry_run=True)
+    # (intent, comment body, target fields) for each dispatched intent
+    _DRY_RUN_CASES = (
+        (CommentIntent.EDIT_ISSUE, "Update the issue", {"issue": 42}),
+        (CommentIntent.CHANGE_CODE, "Fix the bug", {"pr": 18}),
+        (CommentIntent.UPDATE_PR_DESC, "Update description", {"pr": 18}),
+        (CommentIntent.REPLY, "Thanks!", {"pr": 18}),
+        (CommentIntent.CLARIFY, "Unclear request", {}),
+        (CommentIntent.CREATE_ISSUE, "Open an issue for this", {}),
+    )
+
+    @pytest.mark.parametrize(
+        ("intent", "body", "fields"),
+        _DRY_RUN_CASES,
+        ids=[intent.value for intent, _, _ in _DRY_RUN_CASES],
+    )
+    def test_dry_run_by_intent(self, intent, body, fields):
+        classified = self._make_classified(intent, body=body, **fields)
+        result = ActionExecutor().execute(classified, dry_run=True)
         assert result.success is True
-        assert result.intent == CommentIntent.EDIT_ISSUE
-
-    def test_change_code_dry_run(self):
-        executor = ActionExecutor()
-        classified = self._make_classified(
-            CommentIntent.CHANGE_CODE, body="Fix the bug", pr=18,
-        )
-        result = executor.execute(classified, dry_run=True)
-        assert result.success is True
-        assert result.intent == CommentIntent.CHANGE_CODE
-
-    def test_update_pr_desc_dry_run(self):
-        executor = ActionExecutor()
-        classified = self._make_classified(
-            CommentIntent.UPDATE_PR_DESC, body="Update description", pr=18,
-        )
-        result = executor.execute(classified, dry_run=True)
-        assert result.success is True
-        assert result.intent == CommentIntent.UPDATE_PR_DESC
-
-    def test_reply_dry_run(self):
-        executor = ActionExecutor()
-        classified = self._make_classified(
-            CommentIntent.REPLY, body="Thanks!", pr=18,
-        )
-        result = executor.execute(classified, dry_run=True)
-        assert result.success is True
-        assert result.intent == CommentIntent.REPLY
-
-    def test_clarify_dry_run(self):
-        executor = ActionExecutor()
-        classified = self._make_classified(
-            CommentIntent.CLARIFY, body="Unclear request",
-        )
-        result = executor.execute(classified, dry_run=True)
-        assert result.success is True
-        assert result.intent == CommentIntent.CLARIFY
-
-    def test_create_issue_dry_run(self):
-        executor = ActionExecutor()
-        classified = self._make_classified(
-            CommentIntent.CREATE_ISSUE, body="Open an issue for this",
-        )
-        result = executor.execute(classified, dry_run=True)
-        assert result.success is True
-        assert result.intent == CommentIntent.CREATE_ISSUE
+        assert result.intent == intent
 
 
 # ---------------------------------------------------------------------------
@@ -309,25 +282,41 @@ class TestSyncFullWorkflow:
 # ---------------------------------------------------------------------------
 
 
+def _rest_run(body: object) -> subprocess.CompletedProcess:
+    """A finished ``gh api -i`` call that printed a REST response."""
+    stdout = f"HTTP/2.0 200 OK\nEtag: \"e1\"\n\n{json.dumps(body)}"
+    return subprocess.CompletedProcess(args=[], returncode=0, stdout=stdout, stderr="")
+
+
+# gh results are fixed, so build them once rather than in every test
+_PR_COMMENTS_RUN = _rest_run([
+    {
+        "node_id": "IC_kwDOtest1",
+        "body": "Please fix this",
+        "user": {"login": "user1"},
+        "created_at": "2026-01-01T00:00:00Z",
+    }
+])
+_ISSUE_COMMENTS_RUN = _rest_run([
+    {
+        "node_id": "IC_kwDOtest2",
+        "body": "Update the description",
+        "user": {"login": "user2"},
+        "created_at": "2026-01-02T00:00:00Z",
+    }
+])
+_FAILED_RUN = subprocess.CompletedProcess(args=[], returncode=1, stdout="", stderr="error")
+
+
 class TestSyncCommentFetcher:
     """Hypothesis: The comment fetcher correctly parses gh CLI output."""
 
-    @patch("orchestration.sync_engine.subprocess.run")
-    def test_fetch_pr_comments_parses_json(self, mock_run):
-        mock_run.return_value = MagicMock(
-            returncode=0,
-            stdout=json.dumps({
-                "comments": [
-                    {
-                        "id": "IC_kwDOtest1",
-                        "body": "Please fix this",
-                        "author": {"login": "user1"},
-                        "createdAt": "2026-01-01T00:00:00Z",
-                    }
-                ]
-            }),
-        )
+    @pytest.fixture(autouse=True)
+    def _isolate_cache(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
 
+    @patch("orchestration.sync_engine.subprocess.run", return_value=_PR_COMMENTS_RUN)
+    def test_fetch_pr_comments_parses_json(self, mock_run):
         fetcher = CommentFetcher()
         comments = fetcher.fetch_pr_comments(18)
 
@@ -337,32 +326,16 @@ class TestSyncCommentFetcher:
         assert comments[0].author == "user1"
         assert comments[0].pr == 18
 
-    @patch("orchestration.sync_engine.subprocess.run")
+    @patch("orchestration.sync_engine.subprocess.run", return_value=_ISSUE_COMMENTS_RUN)
     def test_fetch_issue_comments_parses_json(self, mock_run):
-        mock_run.return_value = MagicMock(
-            returncode=0,
-            stdout=json.dumps({
-                "comments": [
-                    {
-                        "id": "IC_kwDOtest2",
-                        "body": "Update the description",
-                        "author": {"login": "user2"},
-                        "createdAt": "2026-01-02T00:00:00Z",
-                    }
-                ]
-            }),
-        )
-
         fetcher = CommentFetcher()
         comments = fetcher.fetch_issue_comments(42)
 
         assert len(comments) == 1
         assert comments[0].issue == 42
 
-    @patch("orchestration.sync_engine.subprocess.run")
+    @patch("orchestration.sync_engine.subprocess.run", return_value=_FAILED_RUN)
     def test_fetch_returns_empty_on_failure(self, mock_run):
-        mock_run.return_value = MagicMock(returncode=1, stdout="", stderr="error")
-
         fetcher = CommentFetcher()
         comments = fetcher.fetch_pr_comments(99)
         assert comments == []
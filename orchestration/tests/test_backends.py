@@ -12,12 +12,18 @@ Tests are written first (P7: Spec / Test / Evals First) and cover:
 
 from __future__ import annotations
 
+import io
 import json
+import subprocess
+import sys
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+from orchestration import backends as backends_module
 from orchestration.backends import (
+    API_KEY_ENV,
     BACKEND_REGISTRY,
     DEFAULT_MODELS,
     ECONOMY_MODELS,
@@ -73,24 +79,13 @@ class TestModelBackendProtocol:
 class TestBackendRegistry:
     """Tests for BACKEND_REGISTRY."""
 
-    def test_registry_has_three_providers(self):
-        assert len(BACKEND_REGISTRY) == 3
-
-    def test_registry_contains_anthropic(self):
-        assert "anthropic" in BACKEND_REGISTRY
-        assert BACKEND_REGISTRY["anthropic"] is AnthropicBackend
-
-    def test_registry_contains_google(self):
-        assert "google" in BACKEND_REGISTRY
-        assert BACKEND_REGISTRY["google"] is GoogleBackend
-
-    def test_registry_contains_openai(self):
-        assert "openai" in BACKEND_REGISTRY
-        assert BACKEND_REGISTRY["openai"] is OpenAIBackend
-
-    def test_registry_values_are_classes(self):
-        for cls in BACKEND_REGISTRY.values():
-            assert isinstance(cls, type)
+    def test_registry_maps_providers_to_backend_classes(self):
+        assert BACKEND_REGISTRY == {
+            "anthropic": AnthropicBackend,
+            "google": GoogleBackend,
+            "openai": OpenAIBackend,
+        }
+        assert all(isinstance(cls, type) for cls in BACKEND_REGISTRY.values())
 
 
 # ---------------------------------------------------------------------------
@@ -126,39 +121,77 @@ class _MockOpenAIModule:
         self.OpenAI = MagicMock()
 
 
+@pytest.fixture
+def no_api_keys(monkeypatch) -> None:
+    """Unset every provider API key variable."""
+    for env_var in API_KEY_ENV.values():
+        monkeypatch.delenv(env_var, raising=False)
+
+
+# The mock SDK modules are built once per session; each test gets them back
+# with their constructor mocks reset, including configured return values.
+@pytest.fixture(scope="session")
+def _anthropic_module() -> _MockAnthropicModule:
+    return _MockAnthropicModule()
+
+
+@pytest.fixture(scope="session")
+def _genai_module() -> _MockGenaiModule:
+    return _MockGenaiModule()
+
+
+@pytest.fixture(scope="session")
+def _google_module(_genai_module) -> _MockGoogleModule:
+    return _MockGoogleModule(_genai_module)
+
+
+@pytest.fixture(scope="session")
+def _openai_module() -> _MockOpenAIModule:
+    return _MockOpenAIModule()
+
+
+@pytest.fixture
+def anthropic_sdk(monkeypatch, _anthropic_module) -> _MockAnthropicModule:
+    """Install a mock anthropic SDK and API key; returns the mock module."""
+    _anthropic_module.Anthropic.reset_mock(return_value=True, side_effect=True)
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
+    monkeypatch.setitem(sys.modules, "anthropic", _anthropic_module)
+    return _anthropic_module
+
+
+@pytest.fixture
+def genai_sdk(monkeypatch, _genai_module, _google_module) -> _MockGenaiModule:
+    """Install a mock google.genai SDK and API key; returns the genai mock."""
+    _genai_module.Client.reset_mock(return_value=True, side_effect=True)
+    monkeypatch.setenv("GOOGLE_API_KEY", "test-key")
+    monkeypatch.setitem(sys.modules, "google", _google_module)
+    monkeypatch.setitem(sys.modules, "google.genai", _genai_module)
+    return _genai_module
+
+
+@pytest.fixture
+def openai_sdk(monkeypatch, _openai_module) -> _MockOpenAIModule:
+    """Install a mock openai SDK and API key; returns the mock module."""
+    _openai_module.OpenAI.reset_mock(return_value=True, side_effect=True)
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    monkeypatch.setitem(sys.modules, "openai", _openai_module)
+    return _openai_module
+
+
 class TestCreateBackend:
     """Tests for the create_backend factory function."""
 
-    def test_create_anthropic_backend(self):
-        mock_mod = _MockAnthropicModule()
-        with (
-            patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test-key"}),
-            patch.dict("sys.modules", {"anthropic": mock_mod}),
-        ):
-            backend = create_backend("anthropic")
-            assert isinstance(backend, AnthropicBackend)
-
-    def test_create_google_backend(self):
-        mock_genai = _MockGenaiModule()
-        mock_google = _MockGoogleModule(mock_genai)
-        with (
-            patch.dict("os.environ", {"GOOGLE_API_KEY": "test-key"}),
-            patch.dict(
-                "sys.modules",
-                {"google": mock_google, "google.genai": mock_genai},
-            ),
-        ):
-            backend = create_backend("google")
-            assert isinstance(backend, GoogleBackend)
-
-    def test_create_openai_backend(self):
-        mock_mod = _MockOpenAIModule()
-        with (
-            patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}),
-            patch.dict("sys.modules", {"openai": mock_mod}),
-        ):
-            backend = create_backend("openai")
-            assert isinstance(backend, OpenAIBackend)
+    def test_create_anthropic_backend(self, anthropic_sdk):
+        backend = create_backend("anthropic")
+        assert isinstance(backend, AnthropicBackend)
+
+    def test_create_google_backend(self, genai_sdk):
+        backend = create_backend("google")
+        assert isinstance(backend, GoogleBackend)
+
+    def test_create_openai_backend(self, openai_sdk):
+        backend = create_backend("openai")
+        assert isinstance(backend, OpenAIBackend)
 
     def test_create_unknown_provider_raises(self):
         with pytest.raises(ValueError, match="Unknown provider"):
@@ -173,44 +206,34 @@ class TestCreateBackend:
 class TestAvailableBackends:
     """Tests for the available_backends function."""
 
-    @patch.dict(
-        "os.environ",
-        {"ANTHROPIC_API_KEY": "k1", "GOOGLE_API_KEY": "k2", "OPENAI_API_KEY": "k3"},
+    @pytest.mark.parametrize(
+        ("env", "claude_path", "expected"),
+        [
+            pytest.param(
+                {"ANTHROPIC_API_KEY": "k1", "GOOGLE_API_KEY": "k2", "OPENAI_API_KEY": "k3"},
+                None,
+                ["anthropic", "google", "openai"],
+                id="all-keys",
+            ),
+            pytest.param({"ANTHROPIC_API_KEY": "k1"}, None, ["anthropic"], id="anthropic-key-only"),
+            pytest.param({}, None, [], id="no-keys-no-cli"),
+            pytest.param({}, "/usr/bin/claude", ["anthropic"], id="claude-cli-only"),
+            pytest.param(
+                {"GOOGLE_API_KEY": "k2", "OPENAI_API_KEY": "k3"},
+                None,
+                ["google", "openai"],
+                id="no-anthropic-key-or-cli",
+            ),
+        ],
     )
-    def test_all_available_when_all_keys_set(self):
-        result = available_backends()
-        assert "anthropic" in result
-        assert "google" in result
-        assert "openai" in result
-
-    @patch.dict("os.environ", {"ANTHROPIC_API_KEY": "k1"}, clear=True)
-    def test_only_anthropic_when_only_its_key_set(self):
-        result = available_backends()
-        assert result == ["anthropic"]
-
-    @patch("shutil.which", return_value=None)
-    @patch.dict("os.environ", {}, clear=True)
-    def test_empty_when_no_keys_and_no_cli(self, _mock_which):
-        result = available_backends()
-        assert result == []
-
-    @patch("shutil.which", return_value="/usr/bin/claude")
-    @patch.dict("os.environ", {}, clear=True)
-    def test_anthropic_available_via_claude_cli(self, _mock_which):
-        result = available_backends()
-        assert "anthropic" in result
+    def test_available_backends(self, monkeypatch, env, claude_path, expected):
+        for env_var in API_KEY_ENV.values():
+            monkeypatch.delenv(env_var, raising=False)
+        for env_var, value in env.items():
+            monkeypatch.setenv(env_var, value)
+        monkeypatch.setattr("shutil.which", lambda name: claude_path)
 
-    @patch("shutil.which", return_value=None)
-    @patch.dict(
-        "os.environ",
-        {"GOOGLE_API_KEY": "k2", "OPENAI_API_KEY": "k3"},
-        clear=True,
-    )
-    def test_excludes_provider_without_key_or_cli(self, _mock_which):
-        result = available_backends()
-        assert "anthropic" not in result
-        assert "google" in result
-        assert "openai" in result
+        assert available_backends() == expected
 
 
 # ---------------------------------------------------------------------------
@@ -218,32 +241,41 @@ class TestAvailableBackends:
 # ---------------------------------------------------------------------------
 
 
+class _StubBackend:
+    """Minimal ModelBackend that records prompts and returns a fixed reply."""
+
+    def __init__(self, reply: str = "") -> None:
+        self.reply = reply
+        self.calls: list[str] = []
+
+    def complete(self, prompt: str) -> str:
+        self.calls.append(prompt)
+        return self.reply
+
+
 class TestBackendAsJudgeFn:
     """Tests for backend_as_judge_fn adapter."""
 
     def test_adapts_backend_to_callable(self):
-        mock_backend = MagicMock(spec=ModelBackend)
-        mock_backend.complete.return_value = "judge response"
+        backend = _StubBackend("judge response")
 
-        judge_fn = backend_as_judge_fn(mock_backend)
+        judge_fn = backend_as_judge_fn(backend)
         result = judge_fn("prompt text")
 
         assert result == "judge response"
-        mock_backend.complete.assert_called_once_with("prompt text")
+        assert backend.calls == ["prompt text"]
 
     def test_returned_callable_is_callable(self):
-        mock_backend = MagicMock(spec=ModelBackend)
-        judge_fn = backend_as_judge_fn(mock_backend)
+        judge_fn = backend_as_judge_fn(_StubBackend())
         assert callable(judge_fn)
 
     def test_passes_through_prompt_exactly(self):
-        mock_backend = MagicMock(spec=ModelBackend)
-        mock_backend.complete.return_value = ""
+        backend = _StubBackend()
 
-        judge_fn = backend_as_judge_fn(mock_backend)
+        judge_fn = backend_as_judge_fn(backend)
         judge_fn("exact prompt")
 
-        mock_backend.complete.assert_called_with("exact prompt")
+        assert backend.calls[-1] == "exact prompt"
 
 
 # ---------------------------------------------------------------------------
@@ -263,230 +295,156 @@ class TestEconomyModels:
         assert ECONOMY_MODELS["anthropic"] != DEFAULT_MODELS["anthropic"]
         assert ECONOMY_MODELS["openai"] != DEFAULT_MODELS["openai"]
 
-    def test_economy_flag_selects_economy_model(self):
-        mock_mod = _MockAnthropicModule()
-        with (
-            patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test-key"}),
-            patch.dict("sys.modules", {"anthropic": mock_mod}),
-        ):
-            backend = create_backend("anthropic", economy=True)
-            assert backend.model == ECONOMY_MODELS["anthropic"]
-
-    def test_explicit_model_overrides_economy(self):
-        mock_mod = _MockAnthropicModule()
-        with (
-            patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test-key"}),
-            patch.dict("sys.modules", {"anthropic": mock_mod}),
-        ):
-            backend = create_backend("anthropic", model="custom-model", economy=True)
-            assert backend.model == "custom-model"
-
-    def test_no_economy_uses_default_model(self):
-        mock_mod = _MockAnthropicModule()
-        with (
-            patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test-key"}),
-            patch.dict("sys.modules", {"anthropic": mock_mod}),
-        ):
-            backend = create_backend("anthropic")
-            assert backend.model == DEFAULT_MODELS["anthropic"]
-
+    def test_economy_flag_selects_economy_model(self, anthropic_sdk):
+        backend = create_backend("anthropic", economy=True)
+        assert backend.model == ECONOMY_MODELS["anthropic"]
 
-# ---------------------------------------------------------------------------
-# TestAnthropicBackend
-# ---------------------------------------------------------------------------
+    def test_explicit_model_overrides_economy(self, anthropic_sdk):
+        backend = create_backend("anthropic", model="custom-model", economy=True)
+        assert backend.model == "custom-model"
 
+    def test_no_economy_uses_default_model(self, anthropic_sdk):
+        backend = create_backend("anthropic")
+        assert backend.model == DEFAULT_MODELS["anthropic"]
 
-class TestAnthropicBackend:
-    """Tests for AnthropicBackend with mocked SDK."""
-
-    def test_complete_calls_messages_create(self):
-        mock_mod = _MockAnthropicModule()
-        mock_client = MagicMock()
-        mock_mod.Anthropic.return_value = mock_client
 
-        mock_message = MagicMock()
-        mock_message.content = [MagicMock(text="response text")]
-        mock_client.messages.create.return_value = mock_message
+# ---------------------------------------------------------------------------
+# TestSdkBackends
+# ---------------------------------------------------------------------------
 
-        with (
-            patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test-key"}),
-            patch.dict("sys.modules", {"anthropic": mock_mod}),
-        ):
-            backend = AnthropicBackend()
-            result = backend.complete("test prompt")
 
-        mock_client.messages.create.assert_called_once_with(
-            model=DEFAULT_MODELS["anthropic"],
-            max_tokens=1024,
-            messages=[{"role": "user", "content": "test prompt"}],
-        )
+def _wire_anthropic(sdk: _MockAnthropicModule, text: str) -> MagicMock:
+    """Make the mock client reply with text; returns the SDK call to inspect."""
+    client = MagicMock()
+    sdk.Anthropic.return_value = client
+    client.messages.create.return_value = SimpleNamespace(content=[SimpleNamespace(text=text)])
+    return client.messages.create
+
+
+def _wire_genai(sdk: _MockGenaiModule, text: str) -> MagicMock:
+    """Make the mock client reply with text; returns the SDK call to inspect."""
+    client = MagicMock()
+    sdk.Client.return_value = client
+    client.models.generate_content.return_value = SimpleNamespace(text=text)
+    return client.models.generate_content
+
+
+def _wire_openai(sdk: _MockOpenAIModule, text: str) -> MagicMock:
+    """Make the mock client reply with text; returns the SDK call to inspect."""
+    client = MagicMock()
+    sdk.OpenAI.return_value = client
+    choice = SimpleNamespace(message=SimpleNamespace(content=text))
+    client.chat.completions.create.return_value = SimpleNamespace(choices=[choice])
+    return client.chat.completions.create
+
+
+# (provider, SDK fixture, wiring helper, expected SDK call kwargs for the
+# prompt "test prompt" besides the model)
+_SDK_BACKENDS = [
+    pytest.param(
+        "anthropic",
+        "anthropic_sdk",
+        _wire_anthropic,
+        {"max_tokens": 1024, "messages": [{"role": "user", "content": "test prompt"}]},
+        id="anthropic",
+    ),
+    pytest.param(
+        "google",
+        "genai_sdk",
+        _wire_genai,
+        {"contents": "test prompt"},
+        id="google",
+    ),
+    pytest.param(
+        "openai",
+        "openai_sdk",
+        _wire_openai,
+        {"messages": [{"role": "user", "content": "test prompt"}]},
+        id="openai",
+    ),
+]
+
+
+class TestSdkBackends:
+    """Tests for the SDK-based backends (Anthropic, Google, OpenAI) with mocked SDKs."""
+
+    @pytest.mark.parametrize(("provider", "sdk_fixture", "wire", "call_kwargs"), _SDK_BACKENDS)
+    def test_complete_calls_sdk(self, request, provider, sdk_fixture, wire, call_kwargs):
+        sdk_call = wire(request.getfixturevalue(sdk_fixture), "response text")
+
+        result = BACKEND_REGISTRY[provider]().complete("test prompt")
+
+        assert sdk_call.call_count == 1
+        assert sdk_call.call_args.args == ()
+        assert sdk_call.call_args.kwargs == {"model": DEFAULT_MODELS[provider], **call_kwargs}
         assert result == "response text"
 
-    def test_uses_custom_model(self):
-        mock_mod = _MockAnthropicModule()
-        mock_client = MagicMock()
-        mock_mod.Anthropic.return_value = mock_client
-        mock_message = MagicMock()
-        mock_message.content = [MagicMock(text="ok")]
-        mock_client.messages.create.return_value = mock_message
+    @pytest.mark.parametrize(("provider", "sdk_fixture", "wire", "call_kwargs"), _SDK_BACKENDS)
+    def test_uses_custom_model(self, request, provider, sdk_fixture, wire, call_kwargs):
+        sdk_call = wire(request.getfixturevalue(sdk_fixture), "ok")
 
-        with (
-            patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test-key"}),
-            patch.dict("sys.modules", {"anthropic": mock_mod}),
-        ):
-            backend = AnthropicBackend(model="claude-custom")
-            backend.complete("p")
+        BACKEND_REGISTRY[provider](model="custom-model").complete("p")
 
-        call_kwargs = mock_client.messages.create.call_args
-        assert call_kwargs.kwargs["model"] == "claude-custom"
+        assert sdk_call.call_args.kwargs["model"] == "custom-model"
 
-    @patch.dict("os.environ", {}, clear=True)
-    def test_raises_without_api_key(self):
-        with pytest.raises(ValueError, match="ANTHROPIC_API_KEY"):
-            AnthropicBackend()
+    @pytest.mark.parametrize(("provider", "env_var"), API_KEY_ENV.items())
+    def test_raises_without_api_key(self, no_api_keys, provider, env_var):
+        with pytest.raises(ValueError, match=env_var):
+            BACKEND_REGISTRY[provider]()
 
 
 # ---------------------------------------------------------------------------
-# TestGoogleBackend
+# TestClaudeCliBackend
 # ---------------------------------------------------------------------------
 
 
-class TestGoogleBackend:
-    """Tests for GoogleBackend with mocked SDK."""
-
-    def _make_mocks(self):
-        mock_genai = _MockGenaiModule()
-        mock_google = _MockGoogleModule(mock_genai)
-        return mock_google, mock_genai
-
-    def test_complete_calls_generate_content(self):
-        mock_google, mock_genai = self._make_mocks()
-        mock_client = MagicMock()
-        mock_genai.Client.return_value = mock_client
-
-        mock_response = MagicMock()
-        mock_response.text = "generated text"
-        mock_client.models.generate_content.return_value = mock_response
-
-        with (
-            patch.dict("os.environ", {"GOOGLE_API_KEY": "test-key"}),
-            patch.dict(
-                "sys.modules",
-                {"google": mock_google, "google.genai": mock_genai},
-            ),
-        ):
-            backend = GoogleBackend()
-            result = backend.complete("test prompt")
-
-        mock_client.models.generate_content.assert_called_once_with(
-            model=DEFAULT_MODELS["google"],
-            contents="test prompt",
-        )
-        assert result == "generated text"
-
-    def test_uses_custom_model(self):
-        mock_google, mock_genai = self._make_mocks()
-        mock_client = MagicMock()
-        mock_genai.Client.return_value = mock_client
-        mock_response = MagicMock()
-        mock_response.text = "ok"
-        mock_client.models.generate_content.return_value = mock_response
-
-        with (
-            patch.dict("os.environ", {"GOOGLE_API_KEY": "test-key"}),
-            patch.dict(
-                "sys.modules",
-                {"google": mock_google, "google.genai": mock_genai},
-            ),
-        ):
-            backend = GoogleBackend(model="gemini-custom")
-            backend.complete("p")
-
-        call_kwargs = mock_client.models.generate_content.call_args
-        assert call_kwargs.kwargs["model"] == "gemini-custom"
-
-    @patch.dict("os.environ", {}, clear=True)
-    def test_raises_without_api_key(self):
-        with pytest.raises(ValueError, match="GOOGLE_API_KEY"):
-            GoogleBackend()
-
-
-# ---------------------------------------------------------------------------
-# TestOpenAIBackend
-# ---------------------------------------------------------------------------
+def _make_mock_popen(
+    stdout_lines: list[str],
+    returncode: int = 0,
+    stderr_text: str = "",
+) -> SimpleNamespace:
+    """Create a stand-in Popen whose pipes are real text streams."""
+    return SimpleNamespace(
+        stdout=io.StringIO("".join(stdout_lines)),
+        stderr=io.StringIO(stderr_text),
+        returncode=returncode,
+        wait=lambda: returncode,
+    )
 
 
-class TestOpenAIBackend:
-    """Tests for OpenAIBackend with mocked SDK."""
+def _result_line(text: str = "ok", input_tokens: int = 10, output_tokens: int = 5) -> str:
+    """One NDJSON ``result`` event line as printed by ``claude -p``."""
+    return json.dumps({
+        "type": "result",
+        "result": text,
+        "usage": {"input_tokens": input_tokens, "output_tokens": output_tokens},
+    }) + "\n"
 
-    def test_complete_calls_chat_completions(self):
-        mock_mod = _MockOpenAIModule()
-        mock_client = MagicMock()
-        mock_mod.OpenAI.return_value = mock_client
 
-        mock_choice = MagicMock()
-        mock_choice.message.content = "completion text"
-        mock_response = MagicMock()
-        mock_response.choices = [mock_choice]
-        mock_client.chat.completions.create.return_value = mock_response
+# Most tests only need some successful result; build its line once
+_OK_RESULT_LINE = _result_line()
 
-        with (
-            patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}),
-            patch.dict("sys.modules", {"openai": mock_mod}),
-        ):
-            backend = OpenAIBackend()
-            result = backend.complete("test prompt")
 
-        mock_client.chat.completions.create.assert_called_once_with(
-            model=DEFAULT_MODELS["openai"],
-            messages=[{"role": "user", "content": "test prompt"}],
-        )
-        assert result == "completion text"
-
-    def test_uses_custom_model(self):
-        mock_mod = _MockOpenAIModule()
-        mock_client = MagicMock()
-        mock_mod.OpenAI.return_value = mock_client
-        mock_choice = MagicMock()
-        mock_choice.message.content = "ok"
-        mock_response = MagicMock()
-        mock_response.choices = [mock_choice]
-        mock_client.chat.completions.create.return_value = mock_response
-
-        with (
-            patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}),
-            patch.dict("sys.modules", {"openai": mock_mod}),
-        ):
-            backend = OpenAIBackend(model="gpt-custom")
-            backend.complete("p")
-
-        call_kwargs = mock_client.chat.completions.create.call_args
-        assert call_kwargs.kwargs["model"] == "gpt-custom"
-
-    @patch.dict("os.environ", {}, clear=True)
-    def test_raises_without_api_key(self):
-        with pytest.raises(ValueError, match="OPENAI_API_KEY"):
-            OpenAIBackend()
+class _FakePopen:
+    """Stands in for subprocess.Popen: records each call, returns ``process``."""
 
+    def __init__(self) -> None:
+        self.calls: list[tuple[list[str], dict]] = []
+        self.process = _make_mock_popen([])
 
-# ---------------------------------------------------------------------------
-# TestClaudeCliBackend
-# ---------------------------------------------------------------------------
+    def __call__(self, cmd: list[str], **kwargs) -> SimpleNamespace:
+        self.calls.append((cmd, kwargs))
+        return self.process
 
 
-def _make_mock_popen(
-    stdout_lines: list[str],
-    returncode: int = 0,
-    stderr_text: str = "",
-):
-    """Create a mock Popen that yields stdout_lines and returns the given code."""
-    mock_proc = MagicMock()
-    mock_proc.stdout = iter(stdout_lines)
-    mock_proc.stderr = MagicMock()
-    mock_proc.stderr.read.return_value = stderr_text
-    mock_proc.returncode = returncode
-    mock_proc.wait.return_value = returncode
-    return mock_proc
+@pytest.fixture
+def fake_popen(monkeypatch) -> _FakePopen:
+    """Replace the subprocess module seen by orchestration.backends."""
+    fake = _FakePopen()
+    monkeypatch.setattr(
+        backends_module, "subprocess", SimpleNamespace(Popen=fake, PIPE=subprocess.PIPE)
+    )
+    return fake
 
 
 class TestClaudeCliBackend:
@@ -508,28 +466,21 @@ class TestClaudeCliBackend:
         assert backend.model == "claude-custom"
 
     @patch("shutil.which", return_value="/usr/bin/claude")
-    @patch("orchestration.backends.subprocess.Popen")
-    def test_complete_calls_claude_cli(self, mock_popen, _mock_which):
-        result_event = json.dumps({
-            "type": "result",
-            "result": "cli response",
-            "usage": {"input_tokens": 10, "output_tokens": 5},
-        })
-        mock_popen.return_value = _make_mock_popen([result_event + "\n"])
+    def test_complete_calls_claude_cli(self, _mock_which, fake_popen):
+        fake_popen.process = _make_mock_popen([_result_line("cli response")])
         backend = ClaudeCliBackend()
         result = backend.complete("test prompt")
 
         assert result == "cli response"
-        mock_popen.assert_called_once()
-        cmd = mock_popen.call_args[0][0]
+        assert len(fake_popen.calls) == 1
+        cmd = fake_popen.calls[-1][0]
         assert cmd[0] == "claude"
         assert "-p" in cmd
         assert "test prompt" in cmd
 
     @patch("shutil.which", return_value="/usr/bin/claude")
-    @patch("orchestration.backends.subprocess.Popen")
-    def test_complete_raises_on_cli_failure(self, mock_popen, _mock_which):
-        mock_popen.return_value = _make_mock_popen(
+    def test_complete_raises_on_cli_failure(self, _mock_which, fake_popen):
+        fake_popen.process = _make_mock_popen(
             [], returncode=1, stderr_text="error occurred",
         )
         backend = ClaudeCliBackend()
@@ -545,51 +496,39 @@ class TestClaudeCliBackend:
 class TestRunClaudeCli:
     """Tests for the _run_claude_cli helper."""
 
-    def _result_line(self, text="ok", input_tokens=10, output_tokens=5):
-        return json.dumps({
-            "type": "result",
-            "result": text,
-            "usage": {"input_tokens": input_tokens, "output_tokens": output_tokens},
-        }) + "\n"
-
-    @patch("orchestration.backends.subprocess.Popen")
-    def test_passes_model_flag(self, mock_popen):
-        mock_popen.return_value = _make_mock_popen([self._result_line()])
+    def test_passes_model_flag(self, fake_popen):
+        fake_popen.process = _make_mock_popen([_OK_RESULT_LINE])
         _run_claude_cli("prompt", model="sonnet")
-        cmd = mock_popen.call_args[0][0]
+        cmd = fake_popen.calls[-1][0]
         assert "--model" in cmd
         idx = cmd.index("--model")
         assert cmd[idx + 1] == "sonnet"
 
-    @patch("orchestration.backends.subprocess.Popen")
-    def test_passes_system_prompt_flag(self, mock_popen):
-        mock_popen.return_value = _make_mock_popen([self._result_line()])
+    def test_passes_system_prompt_flag(self, fake_popen):
+        fake_popen.process = _make_mock_popen([_OK_RESULT_LINE])
         _run_claude_cli("prompt", system_prompt="You are helpful.")
-        cmd = mock_popen.call_args[0][0]
+        cmd = fake_popen.calls[-1][0]
         assert "--system-prompt" in cmd
         idx = cmd.index("--system-prompt")
         assert cmd[idx + 1] == "You are helpful."
 
-    @patch("orchestration.backends.subprocess.Popen")
-    def test_unsets_claudecode_env(self, mock_popen):
-        mock_popen.return_value = _make_mock_popen([self._result_line()])
+    def test_unsets_claudecode_env(self, fake_popen):
+        fake_popen.process = _make_mock_popen([_OK_RESULT_LINE])
         _run_claude_cli("prompt")
-        env = mock_popen.call_args[1]["env"]
+        env = fake_popen.calls[-1][1]["env"]
         assert env["CLAUDECODE"] == ""
 
-    @patch("orchestration.backends.subprocess.Popen")
-    def test_uses_stream_json_format(self, mock_popen):
-        mock_popen.return_value = _make_mock_popen([self._result_line()])
+    def test_uses_stream_json_format(self, fake_popen):
+        fake_popen.process = _make_mock_popen([_OK_RESULT_LINE])
         _run_claude_cli("prompt")
-        cmd = mock_popen.call_args[0][0]
+        cmd = fake_popen.calls[-1][0]
         assert "--output-format" in cmd
         idx = cmd.index("--output-format")
         assert cmd[idx + 1] == "stream-json"
 
-    @patch("orchestration.backends.subprocess.Popen")
-    def test_returns_dict_with_result_and_tokens(self, mock_popen):
-        mock_popen.return_value = _make_mock_popen([
-            self._result_line("hello", 100, 50),
+    def test_returns_dict_with_result_and_tokens(self, fake_popen):
+        fake_popen.process = _make_mock_popen([
+            _result_line("hello", 100, 50),
         ])
         result = _run_claude_cli("prompt")
         assert isinstance(result, dict)
@@ -597,37 +536,33 @@ class TestRunClaudeCli:
         assert result["input_tokens"] == 100
         assert result["output_tokens"] == 50
 
-    @patch("orchestration.backends.subprocess.Popen")
-    def test_handles_non_json_lines(self, mock_popen):
-        mock_popen.return_value = _make_mock_popen([
+    def test_handles_non_json_lines(self, fake_popen):
+        fake_popen.process = _make_mock_popen([
             "not json\n",
-            self._result_line("ok"),
+            _OK_RESULT_LINE,
         ])
         result = _run_claude_cli("prompt")
         assert result["result"] == "ok"
 
-    @patch("orchestration.backends.subprocess.Popen")
-    def test_passes_allowed_tools_flag(self, mock_popen):
-        mock_popen.return_value = _make_mock_popen([self._result_line()])
+    def test_passes_allowed_tools_flag(self, fake_popen):
+        fake_popen.process = _make_mock_popen([_OK_RESULT_LINE])
         _run_claude_cli("prompt", allowed_tools=["Bash", "Write"])
-        cmd = mock_popen.call_args[0][0]
+        cmd = fake_popen.calls[-1][0]
         assert "--allowedTools" in cmd
         idx = cmd.index("--allowedTools")
         assert cmd[idx + 1] == "Bash,Write"
 
-    @patch("orchestration.backends.subprocess.Popen")
-    def test_no_allowed_tools_flag_when_none(self, mock_popen):
-        mock_popen.return_value = _make_mock_popen([self._result_line()])
+    def test_no_allowed_tools_flag_when_none(self, fake_popen):
+        fake_popen.process = _make_mock_popen([_OK_RESULT_LINE])
         _run_claude_cli("prompt")
-        cmd = mock_popen.call_args[0][0]
+        cmd = fake_popen.calls[-1][0]
         assert "--allowedTools" not in cmd
 
-    @patch("orchestration.backends.subprocess.Popen")
-    def test_on_event_callback(self, mock_popen):
+    def test_on_event_callback(self, fake_popen):
         events = []
-        mock_popen.return_value = _make_mock_popen([
+        fake_popen.process = _make_mock_popen([
             json.dumps({"type": "progress", "data": "working"}) + "\n",
-            self._result_line(),
+            _OK_RESULT_LINE,
         ])
         _run_claude_cli("prompt", on_event=lambda e: events.append(e))
         assert len(events) == 2
@@ -651,31 +586,22 @@ class TestRunClaudeCliCommandStructure:
     2. All flags required by the chosen output format must be present.
     """
 
-    def _result_line(self, text="ok"):
-        return json.dumps({
-            "type": "result",
-            "result": text,
-            "usage": {"input_tokens": 1, "output_tokens": 1},
-        }) + "\n"
-
     # -- Prompt isolation (root cause: variadic flags eating the prompt) ------
 
-    @patch("orchestration.backends.subprocess.Popen")
-    def test_prompt_appears_after_double_dash(self, mock_popen):
+    def test_prompt_appears_after_double_dash(self, fake_popen):
         """The prompt must follow a '--' separator so variadic flags cannot consume it."""
-        mock_popen.return_value = _make_mock_popen([self._result_line()])
+        fake_popen.process = _make_mock_popen([_OK_RESULT_LINE])
         _run_claude_cli("my prompt")
-        cmd = mock_popen.call_args[0][0]
+        cmd = fake_popen.calls[-1][0]
         assert "--" in cmd, "Command must contain '--' separator"
         dd_idx = cmd.index("--")
         assert cmd[dd_idx + 1] == "my prompt"
 
-    @patch("orchestration.backends.subprocess.Popen")
-    def test_prompt_isolated_from_allowed_tools(self, mock_popen):
+    def test_prompt_isolated_from_allowed_tools(self, fake_popen):
         """With --allowedTools, the prompt must not be adjacent to the tools list."""
-        mock_popen.return_value = _make_mock_popen([self._result_line()])
+        fake_popen.process = _make_mock_popen([_OK_RESULT_LINE])
         _run_claude_cli("user request", allowed_tools=["Bash", "Read", "Write"])
-        cmd = mock_popen.call_args[0][0]
+        cmd = fake_popen.calls[-1][0]
 
         tools_idx = cmd.index("--allowedTools")
         dd_idx = cmd.index("--")
@@ -684,24 +610,22 @@ class TestRunClaudeCliCommandStructure:
         # The tools value sits between --allowedTools and --, not touching the prompt
         assert tools_idx < dd_idx < prompt_idx
 
-    @patch("orchestration.backends.subprocess.Popen")
-    def test_prompt_isolated_with_all_optional_flags(self, mock_popen):
+    def test_prompt_isolated_with_all_optional_flags(self, fake_popen):
         """Prompt is correctly separated even when all optional flags are present."""
-        mock_popen.return_value = _make_mock_popen([self._result_line()])
+        fake_popen.process = _make_mock_popen([_OK_RESULT_LINE])
         _run_claude_cli(
             "complex prompt\nwith newlines",
             model="sonnet",
             system_prompt="You are helpful.\nBe concise.",
             allowed_tools=["Bash", "Edit", "Read", "Write", "Glob", "Grep"],
         )
-        cmd = mock_popen.call_args[0][0]
+        cmd = fake_popen.calls[-1][0]
         dd_idx = cmd.index("--")
         # Prompt is the very last element, right after '--'
         assert cmd[-1] == "complex prompt\nwith newlines"
         assert dd_idx == len(cmd) - 2
 
-    @patch("orchestration.backends.subprocess.Popen")
-    def test_prompt_is_always_last_argument(self, mock_popen):
+    def test_prompt_is_always_last_argument(self, fake_popen):
         """The prompt must be the final element in the command, in all configurations."""
         for kwargs in [
             {},
@@ -710,29 +634,27 @@ class TestRunClaudeCliCommandStructure:
             {"allowed_tools": ["Bash"]},
             {"model": "sonnet", "system_prompt": "sys", "allowed_tools": ["Bash", "Write"]},
         ]:
-            mock_popen.return_value = _make_mock_popen([self._result_line()])
+            fake_popen.process = _make_mock_popen([_OK_RESULT_LINE])
             _run_claude_cli("THE_PROMPT", **kwargs)
-            cmd = mock_popen.call_args[0][0]
+            cmd = fake_popen.calls[-1][0]
             assert cmd[-1] == "THE_PROMPT", (
                 f"Prompt must be last arg; got {cmd[-1]!r} with kwargs={kwargs}"
             )
 
     # -- Required flags for stream-json output --------------------------------
 
-    @patch("orchestration.backends.subprocess.Popen")
-    def test_verbose_flag_present(self, mock_popen):
+    def test_verbose_flag_present(self, fake_popen):
         """stream-json output format requires --verbose; it must always be in the command."""
-        mock_popen.return_value = _make_mock_popen([self._result_line()])
+        fake_popen.process = _make_mock_popen([_OK_RESULT_LINE])
         _run_claude_cli("prompt")
-        cmd = mock_popen.call_args[0][0]
+        cmd = fake_popen.calls[-1][0]
         assert "--verbose" in cmd
 
-    @patch("orchestration.backends.subprocess.Popen")
-    def test_stream_json_and_verbose_coexist(self, mock_popen):
+    def test_stream_json_and_verbose_coexist(self, fake_popen):
         """Both --verbose and stream-json must be present together."""
-        mock_popen.return_value = _make_mock_popen([self._result_line()])
+        fake_popen.process = _make_mock_popen([_OK_RESULT_LINE])
         _run_claude_cli("prompt")
-        cmd = mock_popen.call_args[0][0]
+        cmd = fake_popen.calls[-1][0]
         fmt_idx = cmd.index("--output-format")
         assert cmd[fmt_idx + 1] == "stream-json"
         assert "--verbose" in cmd
@@ -746,19 +668,16 @@ class TestRunClaudeCliCommandStructure:
 class TestCreateBackendFallback:
     """Tests for create_backend falling back to ClaudeCliBackend."""
 
-    @patch("shutil.which", return_value="/usr/bin/claude")
-    @patch.dict("os.environ", {}, clear=True)
-    def test_anthropic_falls_back_to_cli(self, _mock_which):
+    def test_anthropic_falls_back_to_cli(self, no_api_keys, monkeypatch):
+        monkeypatch.setattr("shutil.which", lambda name: "/usr/bin/claude")
         backend = create_backend("anthropic")
         assert isinstance(backend, ClaudeCliBackend)
 
-    @patch("shutil.which", return_value=None)
-    @patch.dict("os.environ", {}, clear=True)
-    def test_anthropic_raises_when_no_key_and_no_cli(self, _mock_which):
+    def test_anthropic_raises_when_no_key_and_no_cli(self, no_api_keys, monkeypatch):
+        monkeypatch.setattr("shutil.which", lambda name: None)
         with pytest.raises(ValueError, match="claude CLI not found"):
             create_backend("anthropic")
 
-    @patch.dict("os.environ", {}, clear=True)
-    def test_google_does_not_fall_back(self):
+    def test_google_does_not_fall_back(self, no_api_keys):
         with pytest.raises(ValueError, match="GOOGLE_API_KEY"):
             create_backend("google")
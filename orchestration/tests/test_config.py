@@ -1,8 +1,13 @@
 """Tests for orchestration.config — config loading and model selection."""
 
+import copy
 import os
+from dataclasses import asdict
 from unittest.mock import patch
 
+import pytest
+
+from orchestration import config as config_module
 from orchestration.config import (
     DEFAULT_MODEL,
     ECONOMY_DEFAULT_MODEL,
@@ -12,6 +17,7 @@ from orchestration.config import (
     _build_config,
     _extract_eco_section,
     _find_config_file,
+    _read_eco_section,
     load_config,
     select_model,
 )
@@ -105,6 +111,13 @@ class TestEcoConfig:
         config = EcoConfig()
         assert config.models is not MODEL_TABLE
 
+    def test_config_supports_asdict_and_deepcopy(self):
+        config = EcoConfig()
+        assert asdict(config)["models"] == MODEL_TABLE
+        copied = copy.deepcopy(config)
+        assert copied == config
+        assert copied.models is not config.models
+
 
 # ---------------------------------------------------------------------------
 # Config file discovery
@@ -240,6 +253,12 @@ class TestBuildConfig:
 
 
 class TestLoadConfig:
+    @pytest.fixture(autouse=True)
+    def _fresh_section_cache(self):
+        _read_eco_section.cache_clear()
+        yield
+        _read_eco_section.cache_clear()
+
     def test_loads_defaults_when_no_file(self, tmp_path):
         config = load_config(search_dir=tmp_path)
         assert config.default_model == DEFAULT_MODEL
@@ -266,6 +285,29 @@ class TestLoadConfig:
         config = load_config(search_dir=str(tmp_path))
         assert isinstance(config, EcoConfig)
 
+    def test_unchanged_file_is_parsed_once(self, tmp_path):
+        (tmp_path / ".eco.toml").write_bytes(b'default_model = "gpt-4o"\n')
+        with patch.object(
+            config_module, "_parse_toml", wraps=config_module._parse_toml,
+        ) as parse:
+            first = load_config(search_dir=tmp_path)
+            second = load_config(search_dir=tmp_path)
+        assert parse.call_count == 1
+        assert first == second
+
+    def test_edited_file_is_reparsed(self, tmp_path):
+        eco_toml = tmp_path / ".eco.toml"
+        eco_toml.write_bytes(b'default_model = "gpt-4o"\n')
+        assert load_config(search_dir=tmp_path).default_model == "gpt-4o"
+        eco_toml.write_bytes(b'default_model = "gemini-2.0-flash"\n')
+        assert load_config(search_dir=tmp_path).default_model == "gemini-2.0-flash"
+
+    def test_env_overrides_apply_on_cache_hit(self, tmp_path):
+        (tmp_path / ".eco.toml").write_bytes(b"token_budget = 10000\n")
+        assert load_config(search_dir=tmp_path).token_budget == 10000
+        with patch.dict(os.environ, {"ECO_TOKEN_BUDGET": "500"}):
+            assert load_config(search_dir=tmp_path).token_budget == 500
+
 
 # ---------------------------------------------------------------------------
 # Model selection
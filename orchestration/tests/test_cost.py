@@ -2,10 +2,15 @@
 
 from __future__ import annotations
 
+import dataclasses
 import json
+import sqlite3
+import threading
+import time
 
 import pytest
 
+from orchestration import cost as cost_module
 from orchestration.cost import (
     MODEL_PRICING,
     DEFAULT_PRICING,
@@ -230,6 +235,38 @@ class TestUsageStore:
         assert records[0].pr == original.pr
         assert records[0].session_id == original.session_id
 
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_append_writes_same_fields_with_or_without_orjson(
+        self, tmp_path, monkeypatch, use_orjson,
+    ):
+        if use_orjson:
+            pytest.importorskip("orjson")
+        else:
+            monkeypatch.setattr("orchestration.cost.orjson", None)
+        path = tmp_path / "usage.jsonl"
+        record = self._make_record(pr=18, session_id="s1")
+        UsageStore(str(path)).append(record)
+        assert json.loads(path.read_bytes()) == dataclasses.asdict(record)
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_roundtrip_non_ascii(self, tmp_path, monkeypatch, use_orjson):
+        if use_orjson:
+            pytest.importorskip("orjson")
+        else:
+            monkeypatch.setattr("orchestration.cost.orjson", None)
+        store = UsageStore(str(tmp_path / "usage.jsonl"))
+        store.append(self._make_record(session_id="séance ✓"))
+        store.append(self._make_record(session_id="\ud800"))
+        assert [r.session_id for r in store.read_all()] == ["séance ✓", "\ud800"]
+
+    def test_iter_all_is_lazy(self, tmp_path):
+        store = UsageStore(str(tmp_path / "usage.jsonl"))
+        store.append(self._make_record(command="route"))
+        store.append(self._make_record(command="judge"))
+        records = store.iter_all()
+        assert next(records).command == "route"
+        assert [r.command for r in records] == ["judge"]
+
     def test_read_all_nonexistent_file(self, tmp_path):
         store = UsageStore(str(tmp_path / "missing.jsonl"))
         assert store.read_all() == []
@@ -299,6 +336,38 @@ class TestUsageStore:
         records = store.read_filtered(command="route")
         assert len(records) == 2
 
+    @pytest.mark.parametrize(
+        "filters",
+        [
+            {"pr": 0},
+            {"issue": 7, "command": "judge"},
+            {"since": "2026-02-02", "until": "2026-02-02"},
+            {"since": "2026-02-02T12:00:00Z", "pr": 18},
+            {"until": "2026-02-01", "command": "route"},
+        ],
+    )
+    def test_filters_match_filtering_read_all(self, tmp_path, filters):
+        store = UsageStore(str(tmp_path / "usage.jsonl"))
+        for day in (1, 2, 3):
+            for hour, (pr, issue, command) in enumerate(
+                [(0, None, "route"), (18, 7, "judge"), (None, 7, "route")]
+            ):
+                store.append(self._make_record(
+                    timestamp=f"2026-02-0{day}T{hour * 8:02d}:00:00Z",
+                    pr=pr, issue=issue, command=command,
+                ))
+        since = filters.get("since", "")
+        until = filters.get("until", "~")
+        since = since + "T00:00:00Z" if len(since) == 10 else since
+        until = until + "T23:59:59Z" if len(until) == 10 else until
+        expected = [
+            r for r in store.read_all()
+            if since <= r.timestamp <= until
+            and all(getattr(r, k) == v for k, v in filters.items() if k not in ("since", "until"))
+        ]
+        assert expected
+        assert store.read_filtered(**filters) == expected
+
     def test_combined_filters(self, tmp_path):
         store = UsageStore(str(tmp_path / "usage.jsonl"))
         store.append(self._make_record(pr=18, command="route"))
@@ -308,3 +377,119 @@ class TestUsageStore:
         assert len(records) == 1
         assert records[0].pr == 18
         assert records[0].command == "route"
+
+
+# ---------------------------------------------------------------------------
+# UsageStore date index
+# ---------------------------------------------------------------------------
+
+class TestUsageStoreIndex:
+    """Tests for the sidecar index behind date-filtered reads."""
+
+    @staticmethod
+    def _record(day: int, command: str = "route") -> UsageRecord:
+        return UsageRecord(
+            timestamp=f"2026-02-{day:02d}T12:00:00Z",
+            model="claude-sonnet-4-20250514",
+            input_tokens=100,
+            output_tokens=50,
+            command=command,
+        )
+
+    @pytest.fixture
+    def store(self, tmp_path) -> UsageStore:
+        store = UsageStore(str(tmp_path / "usage.jsonl"))
+        for day in (1, 2, 3):
+            store.append(self._record(day))
+        return store
+
+    def _days(self, records: list[UsageRecord]) -> list[str]:
+        return [r.timestamp[:10] for r in records]
+
+    def test_date_query_creates_index(self, store, tmp_path):
+        assert self._days(store.read_filtered(since="2026-02-02")) == ["2026-02-02", "2026-02-03"]
+        assert (tmp_path / "usage.sqlite").exists()
+
+    def test_other_reads_do_not_create_index(self, store, tmp_path):
+        store.read_all()
+        store.read_filtered(command="route")
+        assert not (tmp_path / "usage.sqlite").exists()
+
+    def test_missing_file_creates_nothing(self, tmp_path):
+        store = UsageStore(str(tmp_path / "missing.jsonl"))
+        assert store.read_filtered(since="2026-02-01") == []
+        assert list(tmp_path.iterdir()) == []
+
+    def test_picks_up_later_appends(self, store):
+        store.read_filtered(until="2026-02-01")
+        store.append(self._record(1, command="judge"))
+        records = store.read_filtered(until="2026-02-01")
+        assert [r.command for r in records] == ["route", "judge"]
+
+    def test_partial_last_line_is_indexed_once_complete(self, store):
+        line = json.dumps(dataclasses.asdict(self._record(4))) + "\n"
+        with open(store.path, "a") as f:
+            f.write(line[:20])
+        assert self._days(store.read_filtered(since="2026-02-03")) == ["2026-02-03"]
+        with open(store.path, "a") as f:
+            f.write(line[20:])
+        assert self._days(store.read_filtered(since="2026-02-03")) == ["2026-02-03", "2026-02-04"]
+
+    def test_rebuilds_after_log_shrinks(self, store):
+        store.read_filtered(since="2026-02-01")
+        store.path.write_text("")
+        store.append(self._record(5))
+        assert self._days(store.read_filtered(since="2026-02-01")) == ["2026-02-05"]
+
+    def test_rebuilds_after_log_is_replaced_by_a_longer_one(self, store, tmp_path):
+        store.read_filtered(since="2026-02-01")
+        replacement = tmp_path / "usage.jsonl.new"
+        other = UsageStore(str(replacement))
+        for day in (4, 5, 6, 7):
+            other.append(self._record(day, command="judge-with-a-longer-name"))
+        replacement.replace(store.path)
+        records = store.read_filtered(since="2026-02-01")
+        assert self._days(records) == ["2026-02-04", "2026-02-05", "2026-02-06", "2026-02-07"]
+
+    def test_rebuilds_after_same_size_rewrite(self, store):
+        assert len(store.read_filtered(until="2026-02-02")) == 2
+        size = store.path.stat().st_size
+        rewritten = store.path.read_bytes().replace(b"2026-02-03", b"2026-02-02")
+        with open(store.path, "r+b") as f:
+            f.write(rewritten)
+        assert store.path.stat().st_size == size
+        assert self._days(store.read_filtered(until="2026-02-02")) == [
+            "2026-02-01", "2026-02-02", "2026-02-02",
+        ]
+
+    def test_concurrent_catch_up_indexes_each_line_once(self, store, monkeypatch):
+        index_rows = cost_module._index_rows
+
+        def slow_index_rows(data, position):
+            time.sleep(0.05)  # let the other reader reach its catch-up
+            yield from index_rows(data, position)
+
+        monkeypatch.setattr(cost_module, "_index_rows", slow_index_rows)
+        readers = [
+            threading.Thread(
+                target=UsageStore(str(store.path)).read_filtered,
+                kwargs={"since": "2026-02-01"},
+            )
+            for _ in range(2)
+        ]
+        for reader in readers:
+            reader.start()
+        for reader in readers:
+            reader.join()
+        assert len(store.read_filtered(since="2026-02-01")) == 3
+
+    def test_rebuilds_corrupt_index(self, store, tmp_path):
+        (tmp_path / "usage.sqlite").write_bytes(b"not a database" * 100)
+        assert self._days(store.read_filtered(until="2026-02-02")) == ["2026-02-01", "2026-02-02"]
+
+    def test_falls_back_to_scan_without_index(self, store, monkeypatch):
+        def refuse(*args, **kwargs):
+            raise sqlite3.OperationalError("unable to open database file")
+
+        monkeypatch.setattr("orchestration.cost.sqlite3.connect", refuse)
+        assert self._days(store.read_filtered(since="2026-02-03")) == ["2026-02-03"]
@@ -4,6 +4,9 @@ These tests define the specification for correct behavior.
 They are written first, following TDD principles (P7: Spec / Test / Evals First).
 """
 
+import json
+import threading
+
 import pytest
 
 from orchestration.judge import (
@@ -225,6 +228,34 @@ class TestDiscreteScoringOnly:
         with pytest.raises(ValueError, match="[Rr]ange|[Ss]cale|[Bb]etween"):
             engine.parse_criterion_score(out_of_range_low, criterion)
 
+    @pytest.mark.parametrize(
+        "response",
+        [
+            "Reasoning: Solid.\nScore: 4",
+            "Reasoning: Solid.\nScore: 4.0",
+            "Reasoning: Too good.\nScore: 7",
+            "Reasoning: Partial.\nScore: 2.5",
+            "Score: 3",
+            "Reasoning: No score given.",
+        ],
+    )
+    def test_rubric_scoring_matches_per_criterion_parse(self, response):
+        """Scoring a rubric in one pass keeps exactly the criteria that parse."""
+        engine = JudgeEngine()
+        rubric = [
+            EvaluationCriterion(name="accuracy", description="Accurate?", scale=(1, 5)),
+            EvaluationCriterion(name="depth", description="Deep?", scale=(1, 10)),
+        ]
+
+        expected = []
+        for criterion in rubric:
+            try:
+                expected.append(engine.parse_criterion_score(response, criterion))
+            except ValueError:
+                pass
+
+        assert engine._score_rubric(response, rubric) == expected
+
 
 class TestPairwiseDebiasing:
     """Tests for pairwise comparison debiasing (P4: scaffolding structures the ensemble)."""
@@ -435,6 +466,31 @@ class TestEnsembleMajorityVote:
         # Confidence should reflect agreement level
         assert result.confidence >= 0.66  # 2/3 agreement
 
+    def test_ensemble_combines_scores_per_criterion(self):
+        """Each criterion's combined score is the median of the judges' scores."""
+        engine = JudgeEngine()
+        rubric = [
+            EvaluationCriterion(name="quality", description="Quality", scale=(1, 5)),
+            EvaluationCriterion(name="depth", description="Depth", scale=(1, 3)),
+        ]
+        responses = iter([
+            "Reasoning: A.\nScore: 2",
+            "Reasoning: B.\nScore: 5",
+            "Reasoning: C.\nScore: 3",
+        ])
+
+        result = engine.ensemble_vote(
+            response="Test response",
+            rubric=rubric,
+            n_judges=3,
+            judge_fn=lambda prompt: next(responses),
+        )
+
+        by_name = {s.criterion.name: s for s in result.scores}
+        assert by_name["quality"].score == 3  # median of 2, 5, 3
+        assert by_name["depth"].score == 2  # 5 is out of range; median of 2, 3
+        assert by_name["depth"].reasoning == "A. | C."
+
 
 class TestBiasChecklist:
     """Test that every evaluation includes a bias checklist."""
@@ -666,6 +722,33 @@ class TestMultiModelEnsemble:
         assert report.confidence >= 0.9
         assert report.total == 5.0
 
+    def test_multi_model_ensemble_runs_judges_concurrently(self):
+        """Judges overlap in time: each waits until all three have started."""
+        engine = JudgeEngine()
+        rubric = [
+            EvaluationCriterion(
+                name="quality",
+                description="Overall quality",
+                scale=(1, 5),
+            ),
+        ]
+        barrier = threading.Barrier(3, timeout=5)
+
+        def make_judge(score: int):
+            def judge(prompt: str) -> str:
+                barrier.wait()
+                return f"Reasoning: OK.\nScore: {score}"
+            return judge
+
+        report = engine.multi_model_ensemble(
+            response="Test response",
+            rubric=rubric,
+            judge_fns=[make_judge(2), make_judge(4), make_judge(4)],
+        )
+
+        assert "3/3" in report.reasoning
+        assert report.scores[0].score == 4
+
     def test_multi_model_ensemble_has_cross_model_bias_check(self):
         """Bias checklist should include cross_model_bias."""
         engine = JudgeEngine()
@@ -692,3 +775,137 @@ class TestMultiModelEnsemble:
         ]
         assert len(cross_model_check) == 1
         assert cross_model_check[0].checked is True
+
+
+class TestEvaluateBatch:
+    """Tests for evaluate_batch() folding several responses into one judge call."""
+
+    RUBRIC = (
+        EvaluationCriterion(name="correctness", description="Is it correct?", scale=(1, 5)),
+        EvaluationCriterion(name="clarity", description="Is it clear?", scale=(1, 5), weight=2.0),
+    )
+
+    @staticmethod
+    def _batch_judge(prompt: str) -> str:
+        """Scores each numbered response with its number (capped at 5)."""
+        count = prompt.count("\nResponse ") + prompt.startswith("Response ")
+        return json.dumps([
+            {
+                "task_id": n,
+                "scores": [
+                    {"criterion": "correctness", "reasoning": f"Task {n} ok.", "score": min(n, 5)},
+                    {"criterion": "clarity", "reasoning": "Readable.", "score": 4},
+                ],
+                "overall": f"Task {n} overall.",
+            }
+            for n in range(1, count + 1)
+        ])
+
+    def test_batch_evaluate_splits_correctly(self):
+        engine = JudgeEngine()
+        calls = []
+
+        def judge(prompt: str) -> str:
+            calls.append(prompt)
+            return self._batch_judge(prompt)
+
+        reports = engine.evaluate_batch(
+            [f"answer {i}" for i in range(7)], self.RUBRIC, judge_fn=judge, batch_size=3,
+        )
+
+        assert len(calls) == 3
+        assert "Response 3:\nanswer 2" in calls[0]
+        assert "Response 1:\nanswer 6" in calls[2]
+        assert len(reports) == 7
+        assert [r.scores[0].score for r in reports] == [1, 2, 3, 1, 2, 3, 1]
+
+    def test_batch_matches_single_evaluate_scores(self):
+        engine = JudgeEngine()
+        [batch_report] = engine.evaluate_batch(
+            ["answer"], self.RUBRIC, judge_fn=self._batch_judge,
+        )
+        single_report = engine.evaluate(
+            "answer",
+            self.RUBRIC,
+            judge_fn=lambda prompt: "Reasoning: Task 1 ok.\nScore: 1",
+        )
+
+        assert batch_report.scores[0] == single_report.scores[0]
+        assert batch_report.scores[1].score == 4
+        # Weighted: (1 * 1.0 + 4 * 2.0) / 3.0
+        assert batch_report.total == pytest.approx(3.0)
+        assert "Task 1 overall." in batch_report.reasoning
+
+    def test_out_of_range_batch_score_is_dropped(self):
+        def judge(prompt: str) -> str:
+            return json.dumps([{"task_id": 1, "scores": [
+                {"criterion": "correctness", "reasoning": "Wow.", "score": 9},
+                {"criterion": "clarity", "reasoning": "Fine.", "score": 3},
+            ]}])
+
+        [report] = JudgeEngine().evaluate_batch(["answer"], self.RUBRIC, judge_fn=judge)
+        assert [s.criterion.name for s in report.scores] == ["clarity"]
+
+    def test_json_fields_are_not_reparsed_as_text(self):
+        def judge(prompt: str) -> str:
+            return json.dumps([{"task_id": 1, "scores": [
+                {"criterion": "correctness", "reasoning": "Earlier draft had score: 2.", "score": 5},
+                {"criterion": "clarity", "reasoning": "Fine.", "score": "4"},
+            ]}])
+
+        [report] = JudgeEngine().evaluate_batch(["answer"], self.RUBRIC, judge_fn=judge)
+        [score] = report.scores
+        assert score.score == 5
+        assert score.reasoning == "Earlier draft had score: 2."
+
+    def test_reordered_batch_is_matched_by_task_id(self):
+        def judge(prompt: str) -> str:
+            return json.dumps(list(reversed(json.loads(self._batch_judge(prompt)))))
+
+        reports = JudgeEngine().evaluate_batch(["a", "b", "c"], self.RUBRIC, judge_fn=judge)
+        assert [r.scores[0].score for r in reports] == [1, 2, 3]
+
+    @pytest.mark.parametrize(
+        "task_ids",
+        [(1, 1), (1, None), (1, 3), (True, 2)],
+        ids=["duplicate", "missing", "out-of-range", "bool"],
+    )
+    def test_bad_task_ids_fall_back_to_single_evaluate(self, task_ids):
+        calls = []
+
+        def judge(prompt: str) -> str:
+            calls.append(prompt)
+            if len(calls) == 1:
+                items = json.loads(self._batch_judge(prompt))
+                for item, task_id in zip(items, task_ids):
+                    item["task_id"] = task_id
+                return json.dumps(items)
+            return "Reasoning: Fine.\nScore: 3"
+
+        reports = JudgeEngine().evaluate_batch(["a", "b"], self.RUBRIC, judge_fn=judge)
+
+        assert len(calls) == 3
+        assert [r.total for r in reports] == [3.0, 3.0]
+
+    def test_malformed_batch_falls_back_to_single_evaluate(self):
+        calls = []
+
+        def judge(prompt: str) -> str:
+            calls.append(prompt)
+            if len(calls) == 1:
+                return "I would rate these highly."
+            return "Reasoning: Fine.\nScore: 3"
+
+        reports = JudgeEngine().evaluate_batch(["a", "b"], self.RUBRIC, judge_fn=judge)
+
+        assert len(calls) == 3
+        assert [r.total for r in reports] == [3.0, 3.0]
+
+    def test_batch_safety_concern_is_flagged(self):
+        def judge(prompt: str) -> str:
+            return json.dumps([
+                {"task_id": 1, "scores": [], "overall": "Safety: CONCERN - leaks keys"}
+            ])
+
+        [report] = JudgeEngine().evaluate_batch(["a"], self.RUBRIC, judge_fn=judge)
+        assert report.safety_flag is True
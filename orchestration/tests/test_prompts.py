@@ -0,0 +1,128 @@
+"""Tests for deterministic helpers in the prompt templates package."""
+
+from orchestration.prompts import (
+    DecompositionCache,
+    review_pr_prompt,
+    scrutinize_test_changes_prompt,
+    task_skeleton,
+)
+from orchestration.prompts.review_prompts import count_tokens
+
+
+class TestTaskSkeleton:
+    """Tests for task_skeleton variable extraction."""
+
+    def test_replaces_paths_references_and_code_spans(self) -> None:
+        skeleton, variables = task_skeleton(
+            "Fix orchestration/router.py for #42 using `TaskRouter`"
+        )
+        assert skeleton == "Fix <VAR_1> for <VAR_2> using <VAR_3>"
+        assert variables == ["orchestration/router.py", "#42", "`TaskRouter`"]
+
+    def test_repeated_variable_reuses_placeholder(self) -> None:
+        skeleton, variables = task_skeleton("Move a.py next to b.py, then delete a.py")
+        assert skeleton == "Move <VAR_1> next to <VAR_2>, then delete <VAR_1>"
+        assert variables == ["a.py", "b.py"]
+
+    def test_structurally_similar_tasks_share_skeleton(self) -> None:
+        first, _ = task_skeleton("Add tests for orchestration/cost.py (#12)")
+        second, _ = task_skeleton("Add  tests for orchestration/judge.py (#99)")
+        assert first == second
+
+    def test_prose_and_attribute_access_are_not_paths(self) -> None:
+        skeleton, variables = task_skeleton(
+            "Read self.settings in foo.py, e.g. via os.environ, i.e. at startup"
+        )
+        assert skeleton == "Read self.settings in <VAR_1>, e.g. via os.environ, i.e. at startup"
+        assert variables == ["foo.py"]
+
+
+class TestDecompositionCache:
+    """Tests for DecompositionCache lookup and variable re-injection."""
+
+    def test_miss_returns_none(self) -> None:
+        cache = DecompositionCache()
+        assert cache.get("Add tests for orchestration/cost.py") is None
+
+    def test_hit_substitutes_new_variables(self) -> None:
+        cache = DecompositionCache()
+        cache.put(
+            "Add tests for orchestration/cost.py (#12)",
+            "1. Read orchestration/cost.py\n2. Write tests\n3. Close #12",
+        )
+        result = cache.get("Add tests for orchestration/judge.py (#99)")
+        assert result == "1. Read orchestration/judge.py\n2. Write tests\n3. Close #99"
+        assert len(cache) == 1
+
+    def test_variable_inside_longer_path_is_substituted(self) -> None:
+        cache = DecompositionCache()
+        cache.put("Add tests for a.py", "1. Create tests/a.py\n2. Import a.py there")
+        assert cache.get("Add tests for b.py") == "1. Create tests/b.py\n2. Import b.py there"
+
+    def test_variable_is_not_substituted_inside_another_token(self) -> None:
+        cache = DecompositionCache()
+        cache.put("Close #3", "1. Close #3 and link #31")
+        assert len(cache) == 0
+
+    def test_bare_code_span_identifier_is_not_cached(self) -> None:
+        cache = DecompositionCache()
+        cache.put("Use `Foo` in x.py", "1. Rename Foo in x.py")
+        assert len(cache) == 0
+
+    def test_decomposition_with_derived_paths_is_not_cached(self) -> None:
+        cache = DecompositionCache()
+        cache.put("Rename foo.py", "1. Move foo.py to bar.py\n2. Update imports")
+        assert len(cache) == 0
+        assert cache.get("Rename baz.py") is None
+
+    def test_prose_in_decomposition_does_not_block_caching(self) -> None:
+        cache = DecompositionCache()
+        cache.put("Add tests for a.py", "1. Cover edge cases, e.g. empty self.settings in a.py")
+        assert cache.get("Add tests for b.py") == (
+            "1. Cover edge cases, e.g. empty self.settings in b.py"
+        )
+
+    def test_different_structure_misses(self) -> None:
+        cache = DecompositionCache()
+        cache.put("Add tests for a.py", "1. Write tests for a.py")
+        assert cache.get("Remove tests for a.py") is None
+
+    def test_clear(self) -> None:
+        cache = DecompositionCache()
+        cache.put("Add tests for a.py", "1. Write tests for a.py")
+        cache.clear()
+        assert cache.get("Add tests for a.py") is None
+
+
+class TestReviewPromptBudget:
+    """Tests for fitting diffs into the review prompt token budget."""
+
+    @staticmethod
+    def _diff(*files: str) -> str:
+        return "".join(
+            f"diff --git a/{name} b/{name}\n" + "+added line\n" * 200 for name in files
+        )
+
+    def test_small_diff_is_untouched(self) -> None:
+        diff = self._diff("a.py")
+        assert review_pr_prompt(diff, "rubric") == review_pr_prompt(diff, "rubric", None)
+
+    def test_truncates_at_file_boundary(self) -> None:
+        diff = self._diff("a.py", "b.py", "c.py")
+        budget = count_tokens(review_pr_prompt("", "rubric", None)) + count_tokens(
+            self._diff("a.py", "b.py")
+        ) + 10
+        prompt = review_pr_prompt(diff, "rubric", max_tokens=budget)
+        assert "a/b.py" in prompt
+        assert "a/c.py" not in prompt
+        omitted = len(self._diff("c.py").encode())
+        assert f"[diff truncated: {omitted} bytes omitted]" in prompt
+        assert count_tokens(prompt) <= budget
+
+    def test_falls_back_to_line_boundary(self) -> None:
+        diff = self._diff("a.py")
+        budget = count_tokens(scrutinize_test_changes_prompt("", None)) + 50
+        prompt = scrutinize_test_changes_prompt(diff, max_tokens=budget)
+        assert "diff --git a/a.py" in prompt
+        assert "[diff truncated:" in prompt
+        assert count_tokens(prompt) <= budget
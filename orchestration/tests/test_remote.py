@@ -3,6 +3,8 @@
 import json
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from orchestration.remote import (
     RemoteInstance,
     _instance_name,
@@ -11,6 +13,8 @@ from orchestration.remote import (
     get_repo_url,
     launch_instance,
     list_instances,
+    list_instances_multi,
+    refresh_git_context,
     stop_instance,
     stream_logs,
 )
@@ -69,6 +73,37 @@ class TestRemoteInstance:
         assert inst.task == "Fix the auth bug"
         assert inst.issue == 42
 
+    def test_created_at_dt_parses_gcloud_timestamp(self):
+        inst = RemoteInstance(
+            name="agents-task-42",
+            zone="us-central1-a",
+            status="RUNNING",
+            machine_type="e2-standard-2",
+            created_at="2026-01-01T08:30:00.123-08:00",
+        )
+        assert inst.created_at_dt.isoformat() == "2026-01-01T08:30:00.123000-08:00"
+        assert inst.created_at_dt is inst.created_at_dt
+
+    def test_created_at_dt_parses_utc_z_suffix(self):
+        inst = RemoteInstance(
+            name="agents-task-42",
+            zone="us-central1-a",
+            status="RUNNING",
+            machine_type="e2-standard-2",
+            created_at="2026-01-01T16:30:00Z",
+        )
+        assert inst.created_at_dt.isoformat() == "2026-01-01T16:30:00+00:00"
+
+    def test_created_at_dt_unparseable(self):
+        inst = RemoteInstance(
+            name="agents-task-42",
+            zone="us-central1-a",
+            status="RUNNING",
+            machine_type="e2-standard-2",
+            created_at="",
+        )
+        assert inst.created_at_dt is None
+
 
 # ---------------------------------------------------------------------------
 # _run_gcloud
@@ -79,14 +114,22 @@ class TestRunGcloud:
     def test_calls_gcloud_with_args(self, mock_run):
         mock_run.return_value = MagicMock(returncode=0, stdout="ok", stderr="")
         result = _run_gcloud("compute", "instances", "list")
-        mock_run.assert_called_once_with(
-            ["gcloud", "compute", "instances", "list"],
-            capture_output=True,
-            text=True,
-            check=False,
-        )
+        mock_run.assert_called_once()
+        assert mock_run.call_args[0][0] == ["gcloud", "compute", "instances", "list"]
+        kwargs = mock_run.call_args[1]
+        assert kwargs["capture_output"] is True
+        assert kwargs["text"] is True
+        assert kwargs["check"] is False
         assert result.returncode == 0
 
+    @patch("orchestration.remote.subprocess.run")
+    def test_disables_update_check_and_prompts(self, mock_run):
+        mock_run.return_value = MagicMock(returncode=0, stdout="ok", stderr="")
+        _run_gcloud("compute", "instances", "list")
+        env = mock_run.call_args[1]["env"]
+        assert env["CLOUDSDK_COMPONENT_MANAGER_DISABLE_UPDATE_CHECK"] == "1"
+        assert env["CLOUDSDK_CORE_DISABLE_PROMPTS"] == "1"
+
 
 # ---------------------------------------------------------------------------
 # launch_instance
@@ -283,6 +326,27 @@ class TestListInstances:
         assert "my-project" in call_args
 
 
+class TestListInstancesMulti:
+    @patch("orchestration.remote.list_instances")
+    def test_aggregates_in_project_order(self, mock_list):
+        def _fake(*, project=None):
+            return [RemoteInstance(
+                name=f"{project}-task",
+                zone="us-central1-a",
+                status="RUNNING",
+                machine_type="e2-standard-2",
+                created_at="2026-01-01T00:00:00Z",
+            )]
+
+        mock_list.side_effect = _fake
+        instances = list_instances_multi(["proj-a", "proj-b", "proj-c"])
+        assert [i.name for i in instances] == ["proj-a-task", "proj-b-task", "proj-c-task"]
+        assert mock_list.call_count == 3
+
+    def test_no_projects(self):
+        assert list_instances_multi([]) == []
+
+
 # ---------------------------------------------------------------------------
 # stream_logs
 # ---------------------------------------------------------------------------
@@ -346,6 +410,12 @@ class TestStopInstance:
 # ---------------------------------------------------------------------------
 
 class TestGitHelpers:
+    @pytest.fixture(autouse=True)
+    def _clear_git_cache(self):
+        refresh_git_context()
+        yield
+        refresh_git_context()
+
     @patch("orchestration.remote.subprocess.run")
     def test_get_repo_url(self, mock_run):
         mock_run.return_value = MagicMock(
@@ -372,6 +442,18 @@ class TestGitHelpers:
         mock_run.return_value = MagicMock(returncode=1, stdout="")
         assert get_current_branch() == "main"
 
+    @patch("orchestration.remote.subprocess.run")
+    def test_git_context_cached_until_refresh(self, mock_run):
+        mock_run.return_value = MagicMock(returncode=0, stdout="feat/a\n")
+        assert get_current_branch() == "feat/a"
+        mock_run.return_value = MagicMock(returncode=0, stdout="feat/b\n")
+        assert get_current_branch() == "feat/a"
+        assert mock_run.call_count == 1
+
+        refresh_git_context()
+        assert get_current_branch() == "feat/b"
+        assert mock_run.call_count == 2
+
 
 # ---------------------------------------------------------------------------
 # CLI integration (eco remote ...)
@@ -3,13 +3,21 @@
 Tests define routing behavior before implementation (TDD - P7).
 """
 
+import dataclasses
+import re
+import sys
+
 import pytest
 
+from orchestration import router as router_module
 from orchestration.router import (
+    CLASSIFICATION_PATTERNS,
     TaskType,
     RoutingDecision,
     TaskRouter,
     ROUTING_TABLE,
+    PRIORITY_TABLE,
+    _ROUTES,
 )
 
 
@@ -74,6 +82,16 @@ class TestRoutingDecision:
         )
         assert decision.context == {"files": ["router.py"]}
 
+    def test_routing_decision_is_frozen(self):
+        decision = RoutingDecision(
+            task_type=TaskType.FEATURE,
+            agent_sequence=("architect",),
+            priority="high",
+        )
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            decision.priority = "low"
+        assert not hasattr(decision, "__dict__")
+
 
 class TestRoutingTable:
     """Tests for the ROUTING_TABLE constant."""
@@ -96,6 +114,18 @@ class TestRoutingTable:
     def test_routing_table_has_unknown(self):
         assert TaskType.UNKNOWN in ROUTING_TABLE
 
+    def test_routing_table_agent_names_are_interned(self):
+        for sequence in ROUTING_TABLE.values():
+            for name in sequence:
+                assert name is sys.intern(name)
+
+    def test_combined_routes_mirror_public_tables(self):
+        for task_type in TaskType:
+            assert _ROUTES[task_type] == (
+                ROUTING_TABLE[task_type],
+                PRIORITY_TABLE[task_type],
+            )
+
 
 class TestTaskRouterClassify:
     """Tests for TaskRouter.classify() method."""
@@ -195,6 +225,72 @@ class TestTaskRouterClassify:
         assert router.classify("Add New Feature") == TaskType.FEATURE
 
 
+def _reference_classify(task_description: str) -> TaskType:
+    """First pattern in CLASSIFICATION_PATTERNS order wins."""
+    for task_type, pattern in CLASSIFICATION_PATTERNS:
+        if pattern.search(task_description):
+            return task_type
+    return TaskType.UNKNOWN
+
+
+PRIORITY_SAMPLES = [
+    "Fix the architecture of the sync engine",
+    "write the architecture documentation",
+    "prefix handling is broken",
+    "Design a cool NASA-inspired cargo asset",
+    "Add a unity c# controller",
+    "Add a new feature to the user profile page",
+    "review the blender to unity pipeline\nthen deploy",
+    "naïve fix for the café API",
+    "something needs to happen",
+    "system\x1fdesign for the thing",
+]
+
+
+class TestClassifyPatternPriority:
+    """classify() must agree with a list-order scan on every engine."""
+
+    @pytest.fixture(autouse=True)
+    def _fresh_classify_cache(self):
+        router_module._classify.cache_clear()
+        yield
+        router_module._classify.cache_clear()
+
+    @pytest.mark.parametrize("description", PRIORITY_SAMPLES)
+    def test_re_engine_matches_pattern_order(self, description, monkeypatch):
+        monkeypatch.setattr(router_module, "_hyperscan_database", lambda: None)
+        assert TaskRouter().classify(description) == _reference_classify(description)
+
+    @pytest.mark.parametrize("description", ["F\u0130x it", "Update the doc\u017f"])
+    def test_keyword_match_follows_ignorecase_folding(self, description, monkeypatch):
+        """Keyword matching agrees with re.IGNORECASE on non-ASCII case folds."""
+        monkeypatch.setattr(router_module, "_hyperscan_database", lambda: None)
+        assert TaskRouter().classify(description) == _reference_classify(description)
+
+    @pytest.mark.parametrize("text", ["TODO:cleanup", "todo: cleanup", "Fix\\Bug", "v2 Fix"])
+    def test_residual_regex_keeps_uppercase_escapes(self, text):
+        pattern = re.compile(r"TODO:\S+|\W\Bbug|v\D", re.IGNORECASE)
+        _, residual = router_module._compile_run([pattern])
+        assert bool(residual.search(text.lower())) == bool(pattern.search(text))
+
+    @pytest.mark.parametrize("description", PRIORITY_SAMPLES)
+    def test_hyperscan_engine_matches_pattern_order(self, description):
+        pytest.importorskip("hyperscan")
+        assert TaskRouter().classify(description) == _reference_classify(description)
+
+
+class TestClassifyCache:
+    """classify() results are memoized per description."""
+
+    def test_repeated_description_hits_cache(self):
+        router_module._classify.cache_clear()
+        router = TaskRouter()
+        assert router.classify("Fix the login bug") == TaskType.BUG_FIX
+        assert router.classify("Fix the login bug") == TaskType.BUG_FIX
+        info = router_module._classify.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
+
+
 class TestTaskRouterRoute:
     """Tests for TaskRouter.route() method."""
 
@@ -222,13 +318,13 @@ class TestTaskRouterRoute:
         """Review requests go directly to reviewer agent."""
         decision = router.route("review the pull request #42")
         assert decision.task_type == TaskType.REVIEW
-        assert decision.agent_sequence == ["reviewer"]
+        assert decision.agent_sequence == ("reviewer",)
 
     def test_unknown_task_falls_back_to_orchestrator(self, router):
         """Unclassifiable tasks return to orchestrator for clarification (P16)."""
         decision = router.route("something unclear")
         assert decision.task_type == TaskType.UNKNOWN
-        assert decision.agent_sequence == ["orchestrator"]
+        assert decision.agent_sequence == ("orchestrator",)
 
     def test_routing_returns_priority(self, router):
         """Routing decisions include a priority level."""
@@ -253,17 +349,27 @@ class TestTaskRouterRoute:
         assert "main.py" in decision.context["files"]
         assert "utils.py" in decision.context["files"]
 
+    def test_routing_extracts_file_before_punctuation(self, router):
+        """A trailing period or parenthesis is not part of the file path."""
+        decision = router.route("refactor main.py. Then fix (utils.py)")
+        assert decision.context["files"] == ["main.py", "utils.py"]
+
+    def test_long_run_without_extension_has_no_files(self, router):
+        """Long path-like runs with no extension yield no files (linear scan)."""
+        decision = router.route("a" * 50_000 + ". fix it")
+        assert "files" not in decision.context
+
     def test_docs_routes_to_architect(self, router):
         """Documentation tasks route to architect for API docs."""
         decision = router.route("update the documentation")
         assert decision.task_type == TaskType.DOCS
-        assert decision.agent_sequence == ["architect"]
+        assert decision.agent_sequence == ("architect",)
 
     def test_infrastructure_routes_to_architect_and_infra_engineer(self, router):
         """Infrastructure tasks route to architect then infrastructure-engineer."""
         decision = router.route("update CI pipeline")
         assert decision.task_type == TaskType.INFRASTRUCTURE
-        assert decision.agent_sequence == ["architect", "infrastructure-engineer", "reviewer"]
+        assert decision.agent_sequence == ("architect", "infrastructure-engineer", "reviewer")
 
     def test_feature_routes_to_orchestrator(self, router):
         """Feature tasks route to orchestrator who picks specialist."""
@@ -315,7 +421,7 @@ class TestUnitySpaceSimRouting:
         """Tasks about asset design route to unity-asset-designer."""
         decision = router.route("Design a cargo ship asset for Unity Space Sim")
         assert decision.task_type == TaskType.UNITY_ASSET_DESIGN
-        assert decision.agent_sequence == ["unity-asset-designer"]
+        assert decision.agent_sequence == ("unity-asset-designer",)
 
     def test_asset_pipeline_routes_to_gamedev_integration(self, router):
         """Asset pipeline validation routes to gamedev-integration-engineer."""
@@ -343,6 +449,22 @@ class TestUnitySpaceSimRouting:
         assert decision.task_type == TaskType.UNITY_SCRIPTING
         assert "unity-engineer" in decision.agent_sequence
 
+    def test_path_match_skips_classification(self, router, monkeypatch):
+        """A routed project path decides the task type without classifying."""
+        def fail(task_description):
+            raise AssertionError("classify() should not be called")
+
+        monkeypatch.setattr(router, "classify", fail)
+        decision = router.route("Fix bug in projects/unity-space-sim/blender/generate_ship.py")
+        assert decision.task_type == TaskType.BLENDER_SCRIPTING
+
+    def test_unrouted_project_path_falls_back_to_classification(self, router):
+        """Project paths outside routed directories use the general classification."""
+        description = "Fix bug in projects/unity-space-sim/docs/README.md"
+        decision = router.route(description)
+        assert decision.context.get("project") == "unity-space-sim"
+        assert decision.task_type == router.classify(description)
+
     def test_unity_space_sim_project_context_detected(self, router):
         """Tasks with unity-space-sim paths set project context."""
         decision = router.route("Update file in projects/unity-space-sim/docs/README.md")
@@ -28,6 +28,10 @@ class TestCodeReviewRubric:
         total_max = sum(criterion.max_score for criterion in CODE_REVIEW_RUBRIC)
         assert total_max == 10.0
 
+    def test_code_review_rubric_is_immutable(self) -> None:
+        """The rubric is a tuple, so callers cannot alter the shared constant."""
+        assert isinstance(CODE_REVIEW_RUBRIC, tuple)
+
     def test_code_review_rubric_criteria_names(self) -> None:
         """Verify all expected criteria are present."""
         names = {criterion.name for criterion in CODE_REVIEW_RUBRIC}
@@ -53,12 +57,12 @@ class TestAllCriteria:
     """Tests that apply to all criteria across all rubrics."""
 
     @pytest.fixture
-    def all_criteria(self) -> list[EvaluationCriterion]:
+    def all_criteria(self) -> tuple[EvaluationCriterion, ...]:
         """Collect all criteria from all rubrics."""
         return CODE_REVIEW_RUBRIC + TEST_QUALITY_RUBRIC
 
     def test_all_criteria_have_descriptions(
-        self, all_criteria: list[EvaluationCriterion]
+        self, all_criteria: tuple[EvaluationCriterion, ...]
     ) -> None:
         """Every criterion must have a non-empty description."""
         for criterion in all_criteria:
@@ -68,7 +72,7 @@ class TestAllCriteria:
             )
 
     def test_all_criteria_scales_are_valid(
-        self, all_criteria: list[EvaluationCriterion]
+        self, all_criteria: tuple[EvaluationCriterion, ...]
     ) -> None:
         """All criteria must have valid scales (min >= 0, max > min)."""
         for criterion in all_criteria:
@@ -77,14 +81,14 @@ class TestAllCriteria:
             assert max_val > min_val, f"{criterion.name} has invalid scale range"
 
     def test_all_criteria_have_positive_weights(
-        self, all_criteria: list[EvaluationCriterion]
+        self, all_criteria: tuple[EvaluationCriterion, ...]
     ) -> None:
         """All criteria must have positive weights."""
         for criterion in all_criteria:
             assert criterion.weight > 0, f"{criterion.name} has non-positive weight"
 
     def test_all_criteria_have_names(
-        self, all_criteria: list[EvaluationCriterion]
+        self, all_criteria: tuple[EvaluationCriterion, ...]
     ) -> None:
         """Every criterion must have a non-empty name."""
         for criterion in all_criteria:
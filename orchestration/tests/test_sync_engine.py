@@ -11,9 +11,19 @@ Tests are written first (P7: Spec / Test / Evals First) and cover:
 
 from __future__ import annotations
 
+import dataclasses
 import json
+import re
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from typing import ClassVar
 from unittest.mock import MagicMock, patch
 
+import pytest
+
+from orchestration import sync_engine
 from orchestration.sync_engine import (
     ActionExecutor,
     ActionResult,
@@ -24,6 +34,12 @@ from orchestration.sync_engine import (
     IntentClassifier,
     SyncHistory,
     _AGENT_RESULT_MARKER,
+    _checkout_repo,
+    _classify_body,
+    _GitHubClient,
+    _github_client,
+    _intent_database,
+    _run_gh_cached,
 )
 
 
@@ -106,6 +122,12 @@ class TestGitHubComment:
         assert c.path == "src/main.py"
         assert c.line == 10
 
+    def test_comment_is_frozen(self):
+        c = GitHubComment(id="1", body="", author="a", created_at="")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            c.body = "edited"
+        assert not hasattr(c, "__dict__")
+
 
 # ---------------------------------------------------------------------------
 # TestIntentClassifier
@@ -201,6 +223,74 @@ class TestIntentClassifier:
         result = classifier.classify(self._make_comment("Looks good to me overall"))
         assert result.pattern_matched is False
 
+    def test_intent_priority_beats_match_position(self):
+        classifier = IntentClassifier()
+        result = classifier.classify(self._make_comment("Thanks! Please fix the code too"))
+        assert result.intent == CommentIntent.CHANGE_CODE
+
+    def test_prefilter_keyword_in_every_pattern(self):
+        keywords = IntentClassifier._PREFILTER_KEYWORDS
+        for patterns in IntentClassifier.INTENT_PATTERNS.values():
+            for pattern in patterns:
+                assert any(k in pattern.pattern.lower() for k in keywords), pattern.pattern
+
+    @pytest.fixture
+    def fresh_classify_cache(self):
+        _classify_body.cache_clear()
+        yield
+        _classify_body.cache_clear()
+
+    @staticmethod
+    def _use_prefilter(monkeypatch, engine):
+        monkeypatch.setattr("orchestration.sync_engine._intent_database", lambda cls: None)
+        if engine == "ahocorasick":
+            pytest.importorskip("ahocorasick")
+        else:
+            monkeypatch.setattr("orchestration.sync_engine._keyword_automaton", lambda cls: None)
+
+    @pytest.mark.parametrize("engine", ["ahocorasick", "substring"])
+    def test_prefilter_miss_skips_regex(self, monkeypatch, engine, fresh_classify_cache):
+        self._use_prefilter(monkeypatch, engine)
+        classifier = IntentClassifier()
+        # A matcher that accepts anything shows whether the regexes ran
+        monkeypatch.setattr(
+            "orchestration.sync_engine._intent_matchers",
+            lambda cls: ((CommentIntent.REPLY, re.compile("")),),
+        )
+        result = classifier.classify(self._make_comment("```\nprint(x * 2)\n```"))
+        assert result.intent == CommentIntent.CLARIFY
+        assert result.pattern_matched is False
+
+    @pytest.mark.parametrize("engine", ["ahocorasick", "substring"])
+    @pytest.mark.parametrize("body", ["Pleaſe puſh a fix", "İssue body is wrong"])
+    def test_prefilter_folds_like_ignorecase(self, monkeypatch, body, engine, fresh_classify_cache):
+        self._use_prefilter(monkeypatch, engine)
+        assert IntentClassifier().classify(self._make_comment(body)).pattern_matched is True
+
+    def test_repeated_body_hits_cache(self, fresh_classify_cache):
+        classifier = IntentClassifier()
+        first = classifier.classify(self._make_comment("Push a fix for this"))
+        second = classifier.classify(
+            GitHubComment(id="c2", body="Push a fix for this", author="other", created_at="")
+        )
+        info = _classify_body.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
+        assert second.intent == first.intent == CommentIntent.CHANGE_CODE
+        assert second.comment.id == "c2"
+
+    def test_classify_many_matches_classify(self, fresh_classify_cache):
+        classifier = IntentClassifier()
+        bodies = ["LGTM", "Push a fix for this", "Interesting approach", "LGTM"]
+        comments = [
+            GitHubComment(id=f"c{n}", body=body, author="user", created_at="")
+            for n, body in enumerate(bodies)
+        ]
+        results = classifier.classify_many(comments)
+        # The repeated body is classified once within the batch
+        info = _classify_body.cache_info()
+        assert (info.hits, info.misses) == (0, 3)
+        assert results == [classifier.classify(c) for c in comments]
+
     def test_classify_with_llm_high_confidence_skips_llm(self):
         """When pattern match confidence is high, LLM is not called."""
         classifier = IntentClassifier()
@@ -242,25 +332,154 @@ class TestIntentClassifier:
         assert result.confidence == 0.3
 
 
+    def test_classify_batch_with_llm_single_call(self):
+        classifier = IntentClassifier()
+        mock_llm = MagicMock(return_value='```json\n["create_issue", "reply"]\n```')
+        comments = [
+            self._make_comment("Interesting approach"),
+            self._make_comment("Fix the code please"),
+            self._make_comment("Hmm"),
+        ]
+
+        results = classifier.classify_batch_with_llm(comments, judge_fn=mock_llm)
+
+        mock_llm.assert_called_once()
+        assert "1. Interesting approach" in mock_llm.call_args[0][0]
+        assert "2. Hmm" in mock_llm.call_args[0][0]
+        assert [r.intent for r in results] == [
+            CommentIntent.CREATE_ISSUE, CommentIntent.CHANGE_CODE, CommentIntent.REPLY,
+        ]
+        assert [r.confidence for r in results] == [0.7, 0.9, 0.7]
+
+    def test_classify_batch_with_llm_all_certain_skips_llm(self):
+        mock_llm = MagicMock()
+        results = IntentClassifier().classify_batch_with_llm(
+            [self._make_comment("Fix the code please")], judge_fn=mock_llm,
+        )
+        mock_llm.assert_not_called()
+        assert results[0].intent == CommentIntent.CHANGE_CODE
+
+    def test_classify_batch_with_llm_bad_response_falls_back(self):
+        mock_llm = MagicMock(side_effect=["not json", "reply", "create_issue"])
+        results = IntentClassifier().classify_batch_with_llm(
+            [self._make_comment("Interesting approach"), self._make_comment("Hmm")],
+            judge_fn=mock_llm,
+        )
+        assert mock_llm.call_count == 3
+        assert [r.intent for r in results] == [CommentIntent.REPLY, CommentIntent.CREATE_ISSUE]
+
+    def test_classify_batch_with_llm_unknown_label_keeps_pattern_result(self):
+        results = IntentClassifier().classify_batch_with_llm(
+            [self._make_comment("Interesting approach")],
+            judge_fn=MagicMock(return_value='["no idea"]'),
+        )
+        assert results[0].intent == CommentIntent.CLARIFY
+        assert results[0].confidence == 0.3
+
+
+INTENT_SAMPLES = [
+    "Thanks! Please fix the code too",
+    "@my-agent: summarize the thread",
+    "@bob  : not an agent call",
+    "@bob :x",
+    "@bob \n",
+    "Could you track that as an issue?",
+    "What does this do?\nNo idea",
+    "I dont understand the pr description",
+    "Looks good to me overall",
+    "@bob\x1fplease",
+]
+
+
+class TestIntentClassifierEngines:
+    """The regex and Hyperscan paths agree with a sequential pattern search."""
+
+    @pytest.fixture(autouse=True)
+    def _fresh_classify_cache(self):
+        _classify_body.cache_clear()
+        yield
+        _classify_body.cache_clear()
+
+    @staticmethod
+    def _sequential(body: str) -> CommentIntent:
+        for intent, patterns in IntentClassifier.INTENT_PATTERNS.items():
+            if any(p.search(body) for p in patterns):
+                return intent
+        return CommentIntent.CLARIFY
+
+    def _classify_all(self) -> list[CommentIntent]:
+        classifier = IntentClassifier()
+        return [
+            classifier.classify(GitHubComment(id="c", body=b, author="u", created_at="")).intent
+            for b in INTENT_SAMPLES
+        ]
+
+    @pytest.mark.parametrize("engine", ["re", "hyperscan"])
+    @pytest.mark.parametrize(
+        ("body", "intent"),
+        [
+            ("fix the code", CommentIntent.CLARIFY),
+            ("fix the code é", CommentIntent.CLARIFY),
+            ("bananas please", CommentIntent.REPLY),
+            ("bananas please é", CommentIntent.REPLY),
+        ],
+    )
+    def test_subclass_patterns_are_used(self, monkeypatch, engine, body, intent):
+        if engine == "hyperscan":
+            pytest.importorskip("hyperscan")
+        else:
+            monkeypatch.setattr("orchestration.sync_engine._intent_database", lambda cls: None)
+
+        class _FruitClassifier(IntentClassifier):
+            INTENT_PATTERNS: ClassVar[dict[CommentIntent, list[re.Pattern[str]]]] = {
+                CommentIntent.REPLY: [re.compile(r"\bbananas\b", re.IGNORECASE)],
+            }
+
+        comment = GitHubComment(id="c", body=body, author="u", created_at="")
+        result = _FruitClassifier().classify(comment)
+        assert result.intent == intent
+        assert result.pattern_matched is (intent is CommentIntent.REPLY)
+
+    def test_regex_engine_matches_sequential_search(self, monkeypatch):
+        monkeypatch.setattr("orchestration.sync_engine._intent_database", lambda cls: None)
+        assert self._classify_all() == [self._sequential(b) for b in INTENT_SAMPLES]
+
+    def test_hyperscan_engine_matches_sequential_search(self):
+        pytest.importorskip("hyperscan")
+        assert _intent_database(IntentClassifier) is not None
+        assert self._classify_all() == [self._sequential(b) for b in INTENT_SAMPLES]
+
+
 # ---------------------------------------------------------------------------
 # TestCommentFetcher
 # ---------------------------------------------------------------------------
 
 
+def _rest_output(body: object, etag: str = '"e1"') -> str:
+    """Format a REST response the way ``gh api -i`` prints it."""
+    # gh ends its own status line in LF and the server's header lines in CRLF
+    return (
+        f"HTTP/2.0 200 OK\nEtag: {etag}\r\nContent-Type: application/json\r\n\r\n"
+        f"{json.dumps(body)}"
+    )
+
+
 class TestCommentFetcher:
     """Tests for CommentFetcher with mocked subprocess calls."""
 
+    @pytest.fixture(autouse=True)
+    def _isolate_cache(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+
     def test_fetch_pr_comments_parses_json(self):
-        gh_output = json.dumps({
-            "comments": [
-                {
-                    "id": "c1",
-                    "body": "Fix this",
-                    "author": {"login": "user1"},
-                    "createdAt": "2025-01-01T00:00:00Z",
-                },
-            ]
-        })
+        gh_output = _rest_output([
+            {
+                "node_id": "c1",
+                "body": "Fix this",
+                "user": {"login": "user1"},
+                "created_at": "2025-01-01T00:00:00Z",
+            },
+        ])
 
         with patch("orchestration.sync_engine.subprocess.run") as mock_run:
             mock_run.return_value = MagicMock(
@@ -275,16 +494,14 @@ class TestCommentFetcher:
         assert comments[0].pr == 18
 
     def test_fetch_issue_comments_parses_json(self):
-        gh_output = json.dumps({
-            "comments": [
-                {
-                    "id": "c2",
-                    "body": "Track this",
-                    "author": {"login": "user2"},
-                    "createdAt": "2025-01-02T00:00:00Z",
-                },
-            ]
-        })
+        gh_output = _rest_output([
+            {
+                "node_id": "c2",
+                "body": "Track this",
+                "user": {"login": "user2"},
+                "created_at": "2025-01-02T00:00:00Z",
+            },
+        ])
 
         with patch("orchestration.sync_engine.subprocess.run") as mock_run:
             mock_run.return_value = MagicMock(
@@ -297,6 +514,91 @@ class TestCommentFetcher:
         assert comments[0].id == "c2"
         assert comments[0].issue == 42
 
+    def test_fetch_comments_revalidates_with_etag(self, tmp_path):
+        comment = {"node_id": "c1", "body": "Fix this", "user": {"login": "u"}, "created_at": ""}
+        responses = [
+            MagicMock(returncode=0, stdout=_rest_output([comment]), stderr=""),
+            MagicMock(returncode=1, stdout="HTTP/2.0 304 Not Modified\nEtag: \"e1\"\n\n", stderr="gh: HTTP 304"),
+        ]
+        def fetcher():
+            return CommentFetcher(repo="owner/repo", cache_dir=tmp_path / "cache")
+
+        with patch("orchestration.sync_engine.subprocess.run", side_effect=responses) as mock_run:
+            first = fetcher().fetch_pr_comments(18)
+            second = fetcher().fetch_pr_comments(18)
+
+        assert [c.id for c in first] == [c.id for c in second] == ["c1"]
+        assert "If-None-Match: \"e1\"" in mock_run.call_args_list[1].args[0]
+        assert "repos/owner/repo/issues/18/comments?per_page=100" in mock_run.call_args_list[0].args[0]
+
+    def test_fetch_comments_parses_crlf_headers(self, tmp_path):
+        comment = {"node_id": "c1", "body": "Fix this", "user": {"login": "u"}, "created_at": ""}
+        gh_output = (
+            "HTTP/2.0 200 OK\nContent-Type: application/json\r\nEtag: W/\"abc\"\r\n\r\n"
+            + json.dumps([comment])
+        )
+        with patch("orchestration.sync_engine.subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0, stdout=gh_output, stderr="")
+            comments = CommentFetcher(repo="owner/repo", cache_dir=tmp_path).fetch_pr_comments(18)
+
+        assert [c.id for c in comments] == ["c1"]
+        [entry] = tmp_path.glob("*.json")
+        assert json.loads(entry.read_text()) == {"etag": 'W/"abc"', "body": json.dumps([comment])}
+
+    def test_non_dict_cache_entry_is_a_miss(self, tmp_path):
+        comment = {"node_id": "c1", "body": "", "user": {"login": "u"}, "created_at": ""}
+        with patch("orchestration.sync_engine.subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(
+                returncode=0, stdout=_rest_output([comment]), stderr="",
+            )
+            CommentFetcher(repo="owner/repo", cache_dir=tmp_path).fetch_pr_comments(18)
+            [entry] = tmp_path.glob("*.json")
+            entry.write_text("[1, 2]")
+            comments = CommentFetcher(repo="owner/repo", cache_dir=tmp_path).fetch_pr_comments(18)
+
+        assert [c.id for c in comments] == ["c1"]
+        assert "If-None-Match" not in " ".join(mock_run.call_args_list[1].args[0])
+
+    def test_fetch_comments_follows_pages(self):
+        def page(start, count):
+            return _rest_output([
+                {"node_id": f"c{i}", "body": "", "user": {"login": "u"}, "created_at": ""}
+                for i in range(start, start + count)
+            ])
+
+        responses = [
+            MagicMock(returncode=0, stdout=page(0, 100), stderr=""),
+            MagicMock(returncode=0, stdout=page(100, 3), stderr=""),
+        ]
+        with patch("orchestration.sync_engine.subprocess.run", side_effect=responses) as mock_run:
+            comments = CommentFetcher(repo="owner/repo").fetch_pr_comments(18)
+
+        assert len(comments) == 103
+        assert comments[-1].id == "c102"
+        assert "repos/owner/repo/issues/18/comments?per_page=100&page=2" in mock_run.call_args_list[1].args[0]
+
+    def test_fetch_pr_comments_once_per_instance(self):
+        comment = {"node_id": "c1", "body": "Fix this", "user": {"login": "u"}, "created_at": ""}
+        fetcher = CommentFetcher(repo="owner/repo")
+
+        with patch("orchestration.sync_engine.subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(
+                returncode=0, stdout=_rest_output([comment]), stderr="",
+            )
+            first = fetcher.fetch_pr_comments(18)
+            first.append(first[0])
+            second = fetcher.fetch_pr_comments(18)
+            fetcher.fetch_issue_comments(18)
+
+        assert [c.id for c in second] == ["c1"]
+        assert mock_run.call_count == 2
+
+    def test_fetch_comments_without_cached_body_on_304_is_empty(self, tmp_path):
+        with patch("orchestration.sync_engine.subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=1, stdout="", stderr="gh: HTTP 304")
+            fetcher = CommentFetcher(repo="owner/repo", cache_dir=tmp_path / "cache")
+            assert fetcher.fetch_issue_comments(42) == []
+
     def test_fetch_pr_comments_returns_empty_on_failure(self):
         with patch("orchestration.sync_engine.subprocess.run") as mock_run:
             mock_run.return_value = MagicMock(
@@ -367,11 +669,207 @@ class TestCommentFetcher:
         assert comments[0].path == "src/main.py"
         assert comments[0].line == 42
 
+    def test_fetch_pr_review_threads_deleted_author(self):
+        graphql_response = json.dumps({"data": {"repository": {"pullRequest": {"reviewThreads": {
+            "nodes": [{"id": "t1", "isResolved": False, "comments": {"nodes": [
+                {"id": "rc1", "body": "Old comment", "author": None, "createdAt": ""},
+            ]}}],
+        }}}}})
+
+        with patch("orchestration.sync_engine.subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(
+                returncode=0, stdout=graphql_response, stderr="",
+            )
+            comments = CommentFetcher(repo="owner/repo").fetch_pr_review_threads(18)
+
+        assert comments[0].author == "unknown"
+
     def test_fetch_pr_review_threads_no_repo(self):
         fetcher = CommentFetcher(repo="")
         comments = fetcher.fetch_pr_review_threads(18)
         assert comments == []
 
+    def test_fetch_all_open_graphql_batches_pages(self):
+        def page(connection, nodes, end_cursor=None):
+            return MagicMock(returncode=0, stderr="", stdout=json.dumps({
+                "data": {"repository": {connection: {
+                    "pageInfo": {"hasNextPage": end_cursor is not None, "endCursor": end_cursor},
+                    "nodes": nodes,
+                }}}
+            }))
+
+        comment = {"id": "c1", "body": "Fix this", "author": {"login": "u"}, "createdAt": ""}
+        thread = {"id": "t1", "isResolved": False, "comments": {"nodes": [
+            {"id": "rc1", "body": "Nit", "author": {"login": "r"}, "createdAt": "",
+             "path": "a.py", "line": 3},
+        ]}}
+        responses = [
+            page("pullRequests", [{
+                "number": 18,
+                "comments": {"nodes": [comment]},
+                "reviewThreads": {"nodes": [thread]},
+            }], end_cursor="CUR1"),
+            page("pullRequests", [{
+                "number": 19,
+                "comments": {"nodes": []},
+                "reviewThreads": {"nodes": []},
+            }]),
+            page("issues", [{"number": 42, "comments": {"nodes": [dict(comment, id="c2")]}}]),
+        ]
+
+        with patch("orchestration.sync_engine.subprocess.run", side_effect=responses) as mock_run:
+            comments = CommentFetcher(repo="owner/repo").fetch_all_open()
+
+        assert mock_run.call_count == 3
+        assert "cursor=CUR1" in mock_run.call_args_list[1].args[0]
+        assert [(c.id, c.pr, c.issue) for c in comments] == [
+            ("c1", 18, None), ("rc1", 18, None), ("c2", None, 42),
+        ]
+        assert comments[1].thread_id == "t1"
+
+    def test_fetch_all_open_graphql_falls_back_to_rest_for_long_threads(self):
+        issues_page = MagicMock(returncode=0, stderr="", stdout=json.dumps({
+            "data": {"repository": {"issues": {
+                "pageInfo": {"hasNextPage": False, "endCursor": None},
+                "nodes": [{"number": 42, "comments": {
+                    "pageInfo": {"hasNextPage": True},
+                    "nodes": [{"id": "c0", "body": "", "author": {"login": "u"}, "createdAt": ""}],
+                }}],
+            }}}
+        }))
+        prs_page = MagicMock(returncode=0, stderr="", stdout=json.dumps({
+            "data": {"repository": {"pullRequests": {
+                "pageInfo": {"hasNextPage": False, "endCursor": None}, "nodes": [],
+            }}}
+        }))
+        rest_page = MagicMock(returncode=0, stderr="", stdout=_rest_output([
+            {"node_id": f"c{i}", "body": "", "user": {"login": "u"}, "created_at": ""}
+            for i in range(100)
+        ]))
+        last_page = MagicMock(returncode=0, stderr="", stdout=_rest_output([
+            {"node_id": "c100", "body": "", "user": {"login": "u"}, "created_at": ""},
+        ]))
+
+        with patch(
+            "orchestration.sync_engine.subprocess.run",
+            side_effect=[prs_page, issues_page, rest_page, last_page],
+        ) as mock_run:
+            comments = CommentFetcher(repo="owner/repo").fetch_all_open()
+
+        assert len(comments) == 101
+        assert {c.issue for c in comments} == {42}
+        assert "repos/owner/repo/issues/42/comments?per_page=100" in mock_run.call_args_list[2].args[0]
+
+    def test_fetch_all_open_without_repo_lists_items(self):
+        with patch("orchestration.sync_engine.subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0, stdout="[]", stderr="")
+            comments = CommentFetcher(repo="").fetch_all_open()
+
+        assert comments == []
+        assert [c.args[0][1:3] for c in mock_run.call_args_list] == [
+            ["pr", "list"], ["issue", "list"],
+        ]
+
+    def test_fetch_all_open_without_repo_keeps_listing_order(self):
+        def fake_gh(cmd, **kwargs):
+            kind, action, *rest = cmd[1:]
+            if action == "list":
+                numbers = [1, 2] if kind == "pr" else [3]
+                return MagicMock(returncode=0, stderr="", stdout=json.dumps(
+                    [{"number": n} for n in numbers]
+                ))
+            number = rest[-1].split("/")[-2]
+            comment = {"node_id": f"item-{number}", "body": "", "user": {"login": "u"}}
+            return MagicMock(returncode=0, stderr="", stdout=_rest_output([comment]))
+
+        with patch("orchestration.sync_engine.subprocess.run", side_effect=fake_gh):
+            comments = CommentFetcher(repo="").fetch_all_open()
+
+        assert [(c.id, c.pr, c.issue) for c in comments] == [
+            ("item-1", 1, None), ("item-2", 2, None), ("item-3", None, 3),
+        ]
+
+
+class TestGitHubClient:
+    """Tests for the persistent HTTP client used for GitHub reads."""
+
+    @staticmethod
+    def _client(handler) -> _GitHubClient:
+        httpx = pytest.importorskip("httpx")
+        client = _GitHubClient("token")
+        client._client = httpx.Client(
+            base_url="https://api.github.com", transport=httpx.MockTransport(handler),
+        )
+        return client
+
+    def test_graphql_posts_query_and_variables(self):
+        httpx = pytest.importorskip("httpx")
+        seen = []
+
+        def handler(request):
+            seen.append(json.loads(request.content))
+            return httpx.Response(200, json={"data": {"ok": True}})
+
+        data = self._client(handler).graphql("query { viewer { login } }", {"pr": 18})
+        assert data == {"data": {"ok": True}}
+        assert seen == [{"query": "query { viewer { login } }", "variables": {"pr": 18}}]
+
+    def test_graphql_returns_none_on_http_error(self):
+        httpx = pytest.importorskip("httpx")
+        client = self._client(lambda request: httpx.Response(502))
+        assert client.graphql("query { x }", {}) is None
+
+    def test_cached_get_revalidates_through_client(self, tmp_path, monkeypatch):
+        httpx = pytest.importorskip("httpx")
+        sent_etags = []
+
+        def handler(request):
+            sent_etags.append(request.headers.get("If-None-Match"))
+            if request.headers.get("If-None-Match") == '"e1"':
+                return httpx.Response(304)
+            return httpx.Response(200, headers={"ETag": '"e1"'}, text="[1]")
+
+        client = self._client(handler)
+        monkeypatch.setattr("orchestration.sync_engine._github_client", lambda: client)
+
+        assert _run_gh_cached("repos/o/r/issues/1/comments", tmp_path) == (0, "[1]", "")
+        assert _run_gh_cached("repos/o/r/issues/1/comments", tmp_path) == (0, "[1]", "")
+        assert sent_etags == [None, '"e1"']
+
+    def test_placeholder_endpoint_resolves_checkout_once(self, tmp_path, monkeypatch):
+        httpx = pytest.importorskip("httpx")
+        paths = []
+
+        def handler(request):
+            paths.append(request.url.path)
+            return httpx.Response(200, text="[]")
+
+        client = self._client(handler)
+        monkeypatch.setattr("orchestration.sync_engine._github_client", lambda: client)
+        _checkout_repo.cache_clear()
+        try:
+            with patch("orchestration.sync_engine._run_gh", return_value=(0, "o/r", "")) as mock_gh:
+                for n in (1, 2):
+                    assert _run_gh_cached(f"repos/{{owner}}/{{repo}}/issues/{n}/comments", tmp_path)[0] == 0
+        finally:
+            _checkout_repo.cache_clear()
+        assert mock_gh.call_count == 1
+        assert paths == ["/repos/o/r/issues/1/comments", "/repos/o/r/issues/2/comments"]
+
+    def test_enterprise_host_keeps_gh(self, monkeypatch):
+        pytest.importorskip("httpx")
+        monkeypatch.setenv("GH_HOST", "github.example.com")
+        monkeypatch.setenv("GH_TOKEN", "token")
+        assert _github_client.__wrapped__() is None
+
+    def test_token_from_environment(self, monkeypatch):
+        pytest.importorskip("httpx")
+        monkeypatch.delenv("GH_HOST", raising=False)
+        monkeypatch.setenv("GH_TOKEN", "token")
+        with patch("orchestration.sync_engine.subprocess.run") as mock_run:
+            assert isinstance(_github_client.__wrapped__(), _GitHubClient)
+        mock_run.assert_not_called()
+
 
 # ---------------------------------------------------------------------------
 # TestActionExecutor
@@ -530,6 +1028,20 @@ class TestSyncHistory:
         history = SyncHistory(state_dir=tmp_path / ".eco-state")
         assert history.is_processed("c1") is False
 
+    def test_is_processed_reads_file_once(self, tmp_path):
+        state_dir = tmp_path / ".eco-state"
+        SyncHistory(state_dir=state_dir).record(ActionResult(
+            comment_id="c1", intent=CommentIntent.REPLY, success=True, summary="Done",
+        ))
+        with (state_dir / "sync-history.jsonl").open("a") as f:
+            f.write("not json\n[1]\n")
+
+        history = SyncHistory(state_dir=state_dir)
+        with patch("builtins.open", wraps=open) as mock_open:
+            assert history.is_processed("c1") is True
+            assert history.is_processed("c2") is False
+        assert mock_open.call_count == 1
+
     def test_multiple_records(self, tmp_path):
         history = SyncHistory(state_dir=tmp_path / ".eco-state")
         for i in range(3):
@@ -546,6 +1058,166 @@ class TestSyncHistory:
         assert history.is_processed("c2") is True
         assert history.is_processed("c99") is False
 
+    def test_open_batch_opens_file_once_and_writes_through(self, tmp_path):
+        history = SyncHistory(state_dir=tmp_path / ".eco-state")
+        path = tmp_path / ".eco-state" / "sync-history.jsonl"
+        with patch("builtins.open", wraps=open) as mock_open, history.open_batch():
+            for i in range(3):
+                history.record(ActionResult(
+                    comment_id=f"c{i}", intent=CommentIntent.REPLY,
+                    success=True, summary=f"Reply {i}",
+                ))
+                # Already on disk, so a killed process keeps the record
+                assert SyncHistory(state_dir=tmp_path / ".eco-state").is_processed(f"c{i}")
+            assert history.is_processed("c2") is True
+        assert [c.args for c in mock_open.call_args_list].count((path, "ab")) == 1
+        lines = path.read_text().splitlines()
+        assert [json.loads(line)["comment_id"] for line in lines] == ["c0", "c1", "c2"]
+
+    def test_empty_open_batch_creates_no_files(self, tmp_path):
+        with SyncHistory(state_dir=tmp_path / ".eco-state").open_batch():
+            pass
+        assert not (tmp_path / ".eco-state").exists()
+
+    def test_open_batch_flushes_on_error(self, tmp_path):
+        history = SyncHistory(state_dir=tmp_path / ".eco-state")
+        with pytest.raises(RuntimeError), history.open_batch():
+            history.record(ActionResult(
+                comment_id="c1", intent=CommentIntent.REPLY, success=True, summary="Done",
+            ))
+            raise RuntimeError("boom")
+        assert SyncHistory(state_dir=tmp_path / ".eco-state").is_processed("c1") is True
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_round_trip_non_ascii(self, tmp_path, monkeypatch, use_orjson):
+        if use_orjson:
+            pytest.importorskip("orjson")
+        else:
+            monkeypatch.setattr("orchestration.sync_engine.orjson", None)
+        history = SyncHistory(state_dir=tmp_path / ".eco-state")
+        history.record(ActionResult(
+            comment_id="c1", intent=CommentIntent.REPLY, success=True, summary="Répondu ✓",
+        ))
+        history.record(ActionResult(
+            comment_id="c2", intent=CommentIntent.REPLY, success=False, summary="\ud800",
+        ))
+        runs = SyncHistory(state_dir=tmp_path / ".eco-state").get_runs()
+        assert [r.summary for r in runs[0].results] == ["Répondu ✓", "\ud800"]
+        assert SyncHistory(state_dir=tmp_path / ".eco-state").is_processed("c2") is True
+
+    def test_reads_do_not_create_state_dir(self, tmp_path):
+        history = SyncHistory(state_dir=tmp_path / ".eco-state")
+        assert history.is_processed("c1") is False
+        assert history.get_runs() == []
+        assert not (tmp_path / ".eco-state").exists()
+
+    def test_index_catches_up_with_appended_log(self, tmp_path):
+        state_dir = tmp_path / ".eco-state"
+        SyncHistory(state_dir=state_dir).record(ActionResult(
+            comment_id="c1", intent=CommentIntent.REPLY, success=True, summary="Done",
+        ))
+        assert (state_dir / "sync-history.sqlite").exists()
+        with (state_dir / "sync-history.jsonl").open("a") as f:
+            f.write(json.dumps({"comment_id": "c2", "intent": "reply",
+                                "success": True, "summary": "Later"}) + "\n")
+            f.write('{"comment_id": "c3", "intent"')  # partially written
+
+        history = SyncHistory(state_dir=state_dir)
+        assert history.is_processed("c1") is True
+        assert history.is_processed("c2") is True
+        assert history.is_processed("c3") is False
+        with (state_dir / "sync-history.jsonl").open("a") as f:
+            f.write(': "reply", "success": true, "summary": "Split"}\n')
+        history.record(ActionResult(
+            comment_id="c4", intent=CommentIntent.REPLY, success=True, summary="Done",
+        ))
+        assert history.is_processed("c3") is True
+        assert [r.comment_id for r in history.get_runs()[0].results] == ["c1", "c2", "c3", "c4"]
+
+    def test_concurrent_catch_up_indexes_each_entry_once(self, tmp_path, monkeypatch):
+        state_dir = tmp_path / ".eco-state"
+        state_dir.mkdir()
+        (state_dir / "sync-history.jsonl").write_text("".join(
+            json.dumps({"comment_id": f"c{n}", "intent": "reply", "success": True,
+                        "summary": "Done"}) + "\n"
+            for n in range(3)
+        ))
+        index_row = sync_engine._index_row
+
+        def slow_index_row(line):
+            time.sleep(0.02)  # let the other process reach its catch-up
+            return index_row(line)
+
+        monkeypatch.setattr(sync_engine, "_index_row", slow_index_row)
+
+        def lookup() -> None:
+            with closing(SyncHistory(state_dir=state_dir)) as history:
+                history.is_processed("c0")
+
+        readers = [threading.Thread(target=lookup) for _ in range(2)]
+        for reader in readers:
+            reader.start()
+        for reader in readers:
+            reader.join()
+        with closing(sqlite3.connect(state_dir / "sync-history.sqlite")) as db:
+            assert db.execute("SELECT COUNT(*) FROM entries").fetchone() == (3,)
+
+    def test_close_releases_index_until_next_lookup(self, tmp_path):
+        with closing(SyncHistory(state_dir=tmp_path / ".eco-state")) as history:
+            history.record(ActionResult(
+                comment_id="c1", intent=CommentIntent.REPLY, success=True, summary="Done",
+            ))
+        assert history._db is None
+        assert history.is_processed("c1") is True
+        history.close()
+        assert history._db is None
+
+    def test_index_rebuilt_when_log_shrinks(self, tmp_path):
+        state_dir = tmp_path / ".eco-state"
+        SyncHistory(state_dir=state_dir).record(ActionResult(
+            comment_id="c1", intent=CommentIntent.REPLY, success=True, summary="Done",
+        ))
+        (state_dir / "sync-history.jsonl").write_text('{"comment_id": "c2"}\n')
+        history = SyncHistory(state_dir=state_dir)
+        assert history.is_processed("c1") is False
+        assert history.is_processed("c2") is True
+        assert history.get_runs() == []
+
+    def test_index_rebuilt_when_log_is_replaced_by_a_longer_one(self, tmp_path):
+        state_dir = tmp_path / ".eco-state"
+        SyncHistory(state_dir=state_dir).record(ActionResult(
+            comment_id="c1", intent=CommentIntent.REPLY, success=True, summary="Done",
+        ))
+        replacement = tmp_path / "sync-history.jsonl.new"
+        replacement.write_text("".join(
+            json.dumps({"comment_id": f"c{i}", "summary": "x" * 200}) + "\n" for i in (2, 3)
+        ))
+        replacement.replace(state_dir / "sync-history.jsonl")
+        history = SyncHistory(state_dir=state_dir)
+        assert history.is_processed("c1") is False
+        assert history.is_processed("c3") is True
+
+    def test_index_rebuilt_after_same_size_rewrite(self, tmp_path):
+        state_dir = tmp_path / ".eco-state"
+        SyncHistory(state_dir=state_dir).record(ActionResult(
+            comment_id="c1", intent=CommentIntent.REPLY, success=True, summary="Done",
+        ))
+        path = state_dir / "sync-history.jsonl"
+        rewritten = path.read_bytes().replace(b'"c1"', b'"c9"')
+        with open(path, "r+b") as f:
+            f.write(rewritten)
+        history = SyncHistory(state_dir=state_dir)
+        assert history.is_processed("c1") is False
+        assert history.is_processed("c9") is True
+
+    def test_corrupt_index_is_rebuilt(self, tmp_path):
+        state_dir = tmp_path / ".eco-state"
+        SyncHistory(state_dir=state_dir).record(ActionResult(
+            comment_id="c1", intent=CommentIntent.REPLY, success=True, summary="Done",
+        ))
+        (state_dir / "sync-history.sqlite").write_bytes(b"not a database" * 100)
+        assert SyncHistory(state_dir=state_dir).is_processed("c1") is True
+
     def test_get_runs_returns_results(self, tmp_path):
         history = SyncHistory(state_dir=tmp_path / ".eco-state")
         result = ActionResult(